@@ -53,6 +53,9 @@ print(name[::-1])  # Output: radeK
 # You must include at least one `:` in slicing.
 # print(name[])  # ❌ This is a SyntaxError
 
+# 💡 Every slice above COPIES the characters into a new string. On huge text
+# (logs, dumps) keep the bytes and slice/search windows instead: projects/text_view.py
+
 # --------------------------
 # PRACTICAL EXAMPLE: Extract digits
 # --------------------------
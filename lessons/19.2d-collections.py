@@ -97,6 +97,10 @@ for row in n:
 # n[1][2] = 99
 # Changes the 3rd column of 2nd row to 99 → [2, 3, 99]
 
+# 💡 For big numeric matrices, one flat typed buffer with strides is far more
+#    compact and gives transposes/sub-blocks as views without copying:
+#    see projects/matrix.py (Matrix.from_lists(n) / m.tolist())
+
 # ====================================
 # ✅ Python 2D List Flexibility
 # ====================================
@@ -108,3 +112,6 @@ for group in mix:
     print(group)
 
 # You can even nest list inside tuple, tuple inside set (if hashable), etc.
+
+# 💡 Nested lists allocate EVERY cell. For huge, mostly-empty grids and game boards
+#    (dict-of-keys, COO and CSR layouts) see projects/sparse_grid.py
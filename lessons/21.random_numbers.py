@@ -51,3 +51,9 @@ shuffled_cards = cards[:]
 random.shuffle(shuffled_cards)
 print("Original:", cards)
 print("Shuffled Copy:", shuffled_cards)
+
+# 💡 All of the above share ONE global generator and draw one value per call.
+#    For reproducible per-worker streams and millions of values per call
+#    (typed arrays, weighted alias tables, big shuffles) see projects/random_streams.py
+#    To sample from streams too big for memory (files, endless iterators),
+#    see projects/reservoir_sampling.py
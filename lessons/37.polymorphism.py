@@ -71,6 +71,9 @@ for shape in shape_list:
     # This is called **dynamic dispatch** or **runtime polymorphism**.
     shape.area()
 
+# 💡 Tens of millions of shapes? projects/shape_store.py groups them by type and
+#    computes areas per group over columns, with per-object area() as the fallback
+
 # =====================================================
 # 🔥 Duck Typing in Python
 # =====================================================
@@ -133,6 +136,7 @@ v3 = v1 + v2
 print(v3)  # 📍 Vector(7, 10)
 
 # Without operator overloading, the + operator would throw a TypeError
+# 💡 Millions of vectors? See projects/vectors.py (__slots__ Vector + array-backed VectorArray)
 
 
 #python does not support method overloading as in c++ or java (same method name different number of parameters), it just selects the method that is last declared basically
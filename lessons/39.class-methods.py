@@ -54,6 +54,9 @@ print(s2.get_student_count())  # 📚 Total number of students: 2
 
 # Correct and recommended way to call a class method:
 print(Student.get_student_count())  # 📚 Total number of students: 2
+# 💡 count only tells you HOW MANY. To ask "who has a GPA between 8.5 and 9?" or
+#    "top 10" without scanning every object, see projects/student_registry.py
+#    (class-level name + sorted GPA indexes, kept in sync with weak references)
 
 # Show student info using instance method
 print(s1.get_info())
@@ -22,6 +22,10 @@ class Book:
         return True if self.title == other.title and self.author == other.author else False
         #return self.title == other.title and self.author == other.author basically same
 
+# 💡 Defining __eq__ sets __hash__ to None, so Book can't go in a set or dict.
+#    For a matching __hash__ and streaming dedup of huge book feeds, see
+#    projects/book_catalog.py
+
 b1=Book("Harry Potter 1","JKrow")
 b2=Book("Harry Potter 1","JKrow")
 
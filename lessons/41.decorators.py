@@ -82,3 +82,8 @@ ice_cream("pista") #Added sprinkles and Here is you pista ice-cream!
 # This makes decorators a form of FUNCTION WRAPPING or FUNCTION MODIFICATION
 
 # Closures are key: The wrapper "remembers" the original function passed to the decorator.
+
+# 💡 Real-world use of the same wrapper pattern: timing, counting and profiling
+#    every call of a function → see projects/instrumentation.py (@instrument)
+# 💡 The `*args, **kwargs` wrapper is also how caching decorators work
+#    → see projects/memoize.py (@memoize with LRU/TTL eviction and hit/miss counters)
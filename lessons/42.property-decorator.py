@@ -69,6 +69,10 @@ class Rectangle:
         return f"{self._width * self._height:.2f} sq. cm"
 
 
+# 💡 These getters return STRINGS and recompute on every access. For raw numbers,
+#    a cached area and bulk validation of millions of rectangles, see
+#    projects/rectangles.py
+
 # ================================================================
 # 🚀 Using the Rectangle class
 # ================================================================
@@ -104,5 +104,8 @@ with open(binary_file, 'rb') as bf:
 # Delete binary file after use
 os.remove(binary_file)
 
+# 💡 For millions of fixed-width records, see projects/binary_records.py:
+#    struct + readinto() into a preallocated buffer + memoryview slicing (no copies)
+
 
 # With operator in python 
\ No newline at end of file
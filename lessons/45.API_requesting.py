@@ -129,6 +129,8 @@ except requests.exceptions.RequestException as e:
 # img = requests.get("http://example.com/image.jpg")
 # with open("image.jpg", "wb") as f:
 #     f.write(img.content)
+# ⚠️ img.content keeps the WHOLE file in memory. For big files stream it with
+#    requests.get(url, stream=True) + iter_content() — see projects/download_manager.py
 
 # ========================================================
 # SUMMARY: What You've Learned
@@ -143,3 +145,6 @@ except requests.exceptions.RequestException as e:
 # ✅ Downloading images/files
 
 # This makes you capable of building any API-interacting client in Python!
+
+# 💡 Reusing connections + caching responses: see projects/pokeapi_client.py
+# 💡 Fetching ALL Pokémon concurrently (rate limited, retried): see projects/bulk_fetcher.py
@@ -113,6 +113,9 @@ string.strip(chars)        # removes specified characters
 "$$hello$$".strip('$')    # "hello"
 ```
 
+💡 Chains like `s.strip().lower().replace("-", " ")` build a new string at every step. For millions
+of records, `projects/text_normalizer.py` runs the steps once per batch (and across processes).
+
 ---
 
 ## 🔹6. `str.lstrip([chars])` & `str.rstrip([chars])`
@@ -151,6 +154,9 @@ string.replace(old, new, count)      # replace first `count` occurrences
 "banana".replace("a", "o", 2)  # Output: "bonona"
 ```
 
+💡 Each `find`/`count`/`replace` call is one pass for ONE pattern. For thousands of keywords,
+`projects/multi_pattern.py` finds or replaces all of them in a single pass (Aho–Corasick).
+
 ---
 
 ## 🔹8. `str.split(sep=None, maxsplit=-1)`
@@ -466,4 +466,10 @@ If you want, I can generate:
 
 Would you like me to proceed with those?
 
-"""
\ No newline at end of file
+"""
+
+# 💡 Going further with these ideas:
+#    - projects/fibonacci.py → O(log n) fast-doubling Fibonacci + streaming from any index
+#    - projects/pipeline.py → reusable lazy pipelines (map/filter/batch/window/parallel_map)
+#    - projects/typed_cursor.py → BidirectionalIterator over array/mmap with O(1) seek and zero-copy next_n/prev_n
+#    - projects/coroutine_pipeline.py → push-based pipelines built on .send() (fan-out, fan-in, batching)
@@ -1551,6 +1551,9 @@ for code in range(ord('a'), ord('z') + 1):
     print(chr(code), end=' ')  # prints a b c ... z
 ```
 
+💡 Calling `chr()`/`ord()` per character is slow on big text. `projects/text_transcode.py` converts
+whole strings to code-point arrays (and back) and classifies characters in bulk with `translate`.
+
 ---
 
 ## 8. Internals and limits
@@ -2013,6 +2016,9 @@ print(calculate("abs(-10) + round(2.3)"))  # ➝ 12
 * `__builtins__` is disabled
 * Only certain functions are whitelisted
 
+💡 For millions of user formulas, see `projects/expression_engine.py`: it validates the AST
+(no attribute tricks like `().__class__`), compiles each formula once and evaluates whole columns.
+
 ---
 
 ## 🔷 Summary
@@ -2753,6 +2759,9 @@ print(decimal_to_base(255, 2))   # '11111111'
 print(decimal_to_base(255, 8))   # '377'
 ```
 
+💡 `result = digit + result` re-copies the string every step (quadratic). For huge numbers or
+millions of values, see `projects/base_codec.py` (divide & conquer, bit slicing, batch encode/decode).
+
 ---
 
 # 📌 Summary Table
@@ -0,0 +1,266 @@
+# ==============================================================
+# 🔢 BASE 2..36 CODEC (huge integers + batches)
+# ==============================================================
+
+# lessons/61.IMP_builtin_functions.py converts with:
+#     def decimal_to_base(n, base):
+#         ...
+#         while n > 0:
+#             result = digits[n % base] + result
+#             n //= base
+#
+# For a number with D digits this is QUADRATIC twice over:
+# - `digits[...] + result` copies the whole result string every iteration
+# - every `n // base` divides the whole big integer, D times
+#
+# This module:
+# ✅ divide & conquer for huge numbers: split n by base**(2**k) (precomputed),
+#    convert both halves recursively, pad the low half with zeros
+# ✅ power-of-two bases (2, 4, 8, 16, 32) by bit slicing: bits are already
+#    grouped in base 2**k, so we use C-level formatting + str.translate
+# ✅ batch encode/decode for big arrays of ordinary-sized ints, using a table of
+#    precomputed multi-digit chunks so each lookup emits several digits at once
+# ✅ decode() also splits huge strings in halves (int() is quadratic on long
+#    non-power-of-two strings, and Python 3.11+ caps int(str) at 4300 digits)
+
+import base64
+import sys
+from array import array
+from itertools import repeat
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Below this size the simple loop (or int()/str()) is fastest
+_LEAF_DIGITS = 1000
+
+_POW2_BASES = {2, 4, 8, 16, 32}
+
+# hex digit → two base-4 digits, used with str.translate
+_HEX_TO_BASE4 = str.maketrans({h: DIGITS[int(h, 16) // 4] + DIGITS[int(h, 16) % 4]
+                               for h in "0123456789ABCDEF"})
+# RFC 4648 base32 alphabet (A-Z, 2-7) → our digits (0-9, A-V)
+_B32_TO_DIGITS = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", DIGITS[:32].encode())
+
+
+def _check_base(base):
+    if not 2 <= base <= 36:
+        raise ValueError("base must be between 2 and 36")
+
+
+# ------------------------------------------
+# ✅ 1. Power-of-two bases: bit slicing
+# ------------------------------------------
+
+def _encode_pow2(n, base):
+    if base == 2:
+        return format(n, "b")
+    if base == 8:
+        return format(n, "o")
+    if base == 16:
+        return format(n, "X")
+    if base == 4:
+        s = format(n, "X").translate(_HEX_TO_BASE4)
+        return s.lstrip("0") or "0"
+    # base 32: 5 bytes = 40 bits = 8 base-32 digits, so pad to a multiple of 5 bytes
+    nbytes = max(1, (n.bit_length() + 7) // 8)
+    nbytes += -nbytes % 5
+    s = base64.b32encode(n.to_bytes(nbytes, "big")).translate(_B32_TO_DIGITS).decode("ascii")
+    return s.lstrip("0") or "0"
+
+
+# ------------------------------------------
+# ✅ 2. Other bases: divide & conquer
+# ------------------------------------------
+
+def _small_encode(n, base):
+    # Simple loop for numbers with at most ~_LEAF_DIGITS digits (list + join, no re-copying)
+    if base == 10 and n.bit_length() < 10_000:
+        return str(n)
+    out = []
+    while n:
+        n, r = divmod(n, base)
+        out.append(DIGITS[r])
+    return "".join(reversed(out)) or "0"
+
+
+def _powers(base, n):
+    # [(base**k, k)] with k = _LEAF_DIGITS * 2**i, up to about the size of n
+    powers = []
+    k = _LEAF_DIGITS
+    p = base ** k
+    while p.bit_length() * 2 <= n.bit_length() + p.bit_length():
+        powers.append((p, k))
+        p *= p
+        k *= 2
+    return powers
+
+
+def _dc_encode(n, base, powers, level, pad):
+    if level < 0:
+        s = _small_encode(n, base) if n else ""
+        return s.rjust(pad, "0") if pad else s
+    p, k = powers[level]
+    if n < p:
+        return _dc_encode(n, base, powers, level - 1, pad)
+    hi, lo = divmod(n, p)
+    high = _dc_encode(hi, base, powers, level - 1, max(0, pad - k))
+    return high + _dc_encode(lo, base, powers, level - 1, k)
+
+
+def encode(n, base):
+    # int → string in `base` (uppercase digits, "-" for negatives)
+    _check_base(base)
+    if n < 0:
+        return "-" + encode(-n, base)
+    if base in _POW2_BASES:
+        return _encode_pow2(n, base)
+    if n.bit_length() <= _LEAF_DIGITS * 4:
+        return _small_encode(n, base)
+    powers = _powers(base, n)
+    return _dc_encode(n, base, powers, len(powers) - 1, 0) or "0"
+
+
+def decode(s, base):
+    # string in `base` → int
+    _check_base(base)
+    s = s.strip()
+    if s.startswith("-"):
+        return -decode(s[1:], base)
+    if base in _POW2_BASES or len(s) <= _LEAF_DIGITS:
+        return int(s, base)
+    return _dc_decode(s, base, {})
+
+
+def _dc_decode(s, base, power_cache):
+    if len(s) <= _LEAF_DIGITS:
+        return int(s, base)
+    half = len(s) // 2
+    low_len = len(s) - half
+    p = power_cache.get(low_len)
+    if p is None:
+        p = power_cache[low_len] = base ** low_len
+    return _dc_decode(s[:half], base, power_cache) * p + _dc_decode(s[half:], base, power_cache)
+
+
+# ------------------------------------------
+# ✅ 3. Batches of ordinary-sized integers
+# ------------------------------------------
+
+def _chunk_table(base):
+    # Largest k with base**k <= 65536.
+    # table[i] = i written with exactly k digits, top[i] = same without leading zeros
+    k = 1
+    while base ** (k + 1) <= 65536:
+        k += 1
+    size = base ** k
+    table = [_small_encode(i, base).rjust(k, "0") for i in range(size)]
+    top = [t.lstrip("0") or "0" for t in table]
+    return size, table, top
+
+
+_TABLES = {}
+
+
+def encode_many(numbers, base):
+    # Encode a sequence of ints (list, array.array, range...) → list of strings
+    _check_base(base)
+    if base in (2, 8, 16):
+        spec = {2: "b", 8: "o", 16: "X"}[base]
+        return list(map(format, numbers, repeat(spec)))
+    if base == 10:
+        return list(map(str, numbers))
+
+    if base not in _TABLES:
+        _TABLES[base] = _chunk_table(base)
+    size, table, top = _TABLES[base]
+    size2 = size * size
+    size3 = size2 * size
+    out = []
+    append = out.append
+    # Each table lookup emits k digits at once; the common sizes are unrolled
+    for n in numbers:
+        if 0 <= n < size:
+            append(top[n])
+        elif 0 <= n < size2:
+            high, low = divmod(n, size)
+            append(top[high] + table[low])
+        elif 0 <= n < size3:
+            high, low = divmod(n, size2)
+            mid, low = divmod(low, size)
+            append(top[high] + table[mid] + table[low])
+        else:
+            append(encode(n, base))
+    return out
+
+
+def decode_many(strings, base, typecode=None):
+    # Decode a sequence of strings → list of ints (or array.array(typecode))
+    _check_base(base)
+    values = map(int, strings, repeat(base))    # int(s, base) runs in C
+    if typecode:
+        return array(typecode, values)
+    return list(values)
+
+
+def decimal_to_base(n, base):
+    # The lesson's original function, kept for comparison
+    digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    if n == 0:
+        return "0"
+    result = ""
+    while n > 0:
+        result = digits[n % base] + result
+        n //= base
+    return result
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)          # allow int("...") on huge strings for the checks
+
+    # Correctness against the lesson's function
+    for base in range(2, 37):
+        for n in [0, 1, base - 1, base, 255, 10 ** 50 + 7, random.getrandbits(5000)]:
+            assert encode(n, base) == decimal_to_base(n, base), (n, base)
+            assert decode(encode(n, base), base) == n
+    assert encode_many([0, 5, 36, 10 ** 30], 36) == [decimal_to_base(x, 36) for x in [0, 5, 36, 10 ** 30]]
+    print("✅ encode/decode agree with decimal_to_base for every base")
+
+    # Huge numbers: 10^5 decimal digits
+    big = random.getrandbits(332_193)            # ≈ 100,000 decimal digits
+    for base in (7, 16, 36):
+        t0 = time.perf_counter()
+        s = encode(big, base)
+        t_enc = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        assert decode(s, base) == big
+        t_dec = time.perf_counter() - t0
+        print(f"🔢 base {base:>2}: {len(s):,} digits, encode {t_enc:.3f}s, decode {t_dec:.3f}s")
+
+    small_big = big >> (332_193 - 66_439)       # ≈ 20,000 digits (the lesson's version is too slow for 100k)
+    t0 = time.perf_counter()
+    decimal_to_base(small_big, 36)
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    encode(small_big, 36)
+    t_new = time.perf_counter() - t0
+    print(f"⏱️ 20k-digit number, base 36: decimal_to_base {t_old:.3f}s vs encode {t_new:.4f}s "
+          f"({t_old / t_new:,.0f}x)")
+
+    # Batches: 10^6 ordinary ints
+    numbers = [random.getrandbits(40) for _ in range(1_000_000)]
+    t0 = time.perf_counter()
+    old = [decimal_to_base(x, 36) for x in numbers]
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    new = encode_many(numbers, 36)
+    t_new = time.perf_counter() - t0
+    assert old == new
+    t0 = time.perf_counter()
+    assert decode_many(new, 36, typecode="q").tolist() == numbers
+    t_dec = time.perf_counter() - t0
+    print(f"📦 10^6 ints, base 36: decimal_to_base {t_old:.2f}s vs encode_many {t_new:.2f}s "
+          f"({t_old / t_new:.1f}x), decode_many {t_dec:.2f}s")
@@ -0,0 +1,252 @@
+# ==============================================================
+# 📦 FIXED-WIDTH BINARY RECORD FILES (struct + memoryview + readinto)
+# ==============================================================
+
+# Section 10 of lessons/43.file_handling.py writes raw bytes with
+#     bf.write(b"\x42\x43\x44")
+# and reads the whole file back with bf.read().
+#
+# That is fine for 3 bytes, but for MILLIONS of fixed-width records:
+# - bf.read() creates one giant bytes object (a full copy of the file)
+# - unpacking record by record creates a new bytes object per record
+#
+# This module avoids both:
+# ✅ struct.Struct        → compiles the record layout ONCE ("<Iqd" etc.)
+# ✅ readinto(buffer)     → fills a PREALLOCATED bytearray, no new bytes object
+# ✅ memoryview           → slicing a memoryview does NOT copy the bytes
+# ✅ mmap                 → lets the OS page the file in, slices are views
+
+import mmap
+import os
+import struct
+import weakref
+
+
+class RecordFile:
+    # A file made of equally sized records described by a struct format.
+    #
+    #   rf = RecordFile("ticks.bin", "<Iqd")   # id, timestamp, price
+    #   rf.append((1, 1700000000, 101.5))
+    #   rf[10:20]          → RecordView (no copy)
+    #   rf.read_into(buf, start=0)  → fills buf, returns record count
+
+    def __init__(self, path, fmt, mode="a+b"):
+        self.path = path
+        self.struct = struct.Struct(fmt)      # compiled once, reused for every record
+        self.record_size = self.struct.size
+        self.file = open(path, mode)
+        self._mmap = None                      # created lazily on first slice
+        self._mview = None                     # one memoryview over the whole map
+        self._views = weakref.WeakSet()        # live RecordViews into the map
+
+    # ----------------------------------------------------------
+    # Context manager so it can be used with `with` like open()
+    # ----------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        try:
+            self._drop_mmap()
+        finally:
+            self.file.close()
+
+    def _drop_mmap(self):
+        # A mmap cannot be closed while a memoryview still points into it, so
+        # every RecordView handed out is released first: after append(),
+        # extend() or close() old views raise ValueError instead of reading a
+        # stale map.
+        if self._mmap is None:
+            return
+        mapped, self._mmap = self._mmap, None
+        try:
+            for view in list(self._views):
+                view.release()
+            self._views.clear()
+            self._mview.release()
+            mapped.close()
+        except BufferError:
+            # something still reads the old map (a raw window.view[...] or a
+            # running iter(window)); the read-only map stays valid and is
+            # unmapped when that reader goes away
+            pass
+        self._mview = None
+
+    # ----------------------------------------------------------
+    # Writing
+    # ----------------------------------------------------------
+    def append(self, record):
+        self._drop_mmap()                      # the file is about to grow
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(self.struct.pack(*record))
+
+    def extend(self, records, batch=4096):
+        # Pack many records into ONE reusable buffer with pack_into(),
+        # then write the buffer in a single call per batch.
+        self._drop_mmap()
+        self.file.seek(0, os.SEEK_END)
+        buffer = bytearray(self.record_size * batch)
+        view = memoryview(buffer)
+        filled = 0
+        for record in records:
+            self.struct.pack_into(buffer, filled * self.record_size, *record)
+            filled += 1
+            if filled == batch:
+                self.file.write(view)
+                filled = 0
+        if filled:
+            self.file.write(view[:filled * self.record_size])
+        view.release()
+
+    def flush(self):
+        self.file.flush()
+
+    # ----------------------------------------------------------
+    # Reading
+    # ----------------------------------------------------------
+    def __len__(self):
+        self.file.flush()
+        return os.fstat(self.file.fileno()).st_size // self.record_size
+
+    def allocate(self, count):
+        # Preallocate a buffer big enough for `count` records.
+        # Reuse it across read_into() calls → zero allocation per record.
+        return bytearray(self.record_size * count)
+
+    def read_into(self, buffer, start=0):
+        # Fill `buffer` with records starting at record index `start`.
+        # Returns how many WHOLE records were read (0 at end of file).
+        self.file.flush()
+        self.file.seek(start * self.record_size)
+        nbytes = self.file.readinto(buffer)
+        return nbytes // self.record_size
+
+    def iter_batches(self, batch=4096):
+        # Walk the whole file with ONE buffer; each batch is a memoryview
+        # slice of that buffer, so it is only valid until the next batch.
+        buffer = self.allocate(batch)
+        view = memoryview(buffer)
+        start = 0
+        try:
+            while True:
+                count = self.read_into(buffer, start)
+                if count == 0:
+                    break
+                yield RecordView(view[:count * self.record_size], self.struct)
+                start += count
+        finally:
+            view.release()
+
+    def __iter__(self):
+        for batch in self.iter_batches():
+            yield from batch
+
+    def _mapped(self):
+        if self._mmap is None:
+            self.file.flush()
+            self._mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mview = memoryview(self._mmap)
+        return self._mmap
+
+    def __getitem__(self, index):
+        n = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step != 1:
+                raise ValueError("Only contiguous record ranges can be viewed")
+            stop = max(start, stop)
+            if start == stop:
+                return RecordView(memoryview(b""), self.struct)
+            self._mapped()
+            view = self._mview[start * self.record_size:stop * self.record_size]
+            return RecordView(view, self.struct, self._views)
+
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("record index out of range")
+        return self.struct.unpack_from(self._mapped(), index * self.record_size)
+
+
+class RecordView:
+    # A zero-copy window over a run of records (backed by a memoryview).
+    # Slicing a RecordView returns another RecordView over the same memory.
+
+    def __init__(self, view, record_struct, registry=None):
+        self.view = view
+        self.struct = record_struct
+        self.record_size = record_struct.size
+        # the owning RecordFile's set of live views (None: not backed by a map)
+        self._registry = registry
+        if registry is not None:
+            registry.add(self)
+
+    def __len__(self):
+        return len(self.view) // self.record_size
+
+    def __getitem__(self, index):
+        n = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step != 1:
+                raise ValueError("Only contiguous record ranges can be viewed")
+            stop = max(start, stop)
+            view = self.view[start * self.record_size:stop * self.record_size]
+            return RecordView(view, self.struct, self._registry)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("record index out of range")
+        return self.struct.unpack_from(self.view, index * self.record_size)
+
+    def __iter__(self):
+        # iter_unpack walks the memoryview directly, no slicing copies
+        return self.struct.iter_unpack(self.view)
+
+    def tobytes(self):
+        # The ONLY method that copies — use it when you really need bytes
+        return self.view.tobytes()
+
+    def release(self):
+        self.view.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+if __name__ == "__main__":
+    import time
+
+    path = "records_demo.bin"
+    if os.path.exists(path):
+        os.remove(path)
+
+    n = 1_000_000
+    with RecordFile(path, "<Iqd") as rf:
+        t0 = time.perf_counter()
+        rf.extend((i, 1_700_000_000 + i, i * 0.5) for i in range(n))
+        print(f"📝 Wrote {len(rf):,} records in {time.perf_counter() - t0:.2f}s")
+
+        # Streaming read with a single preallocated buffer
+        t0 = time.perf_counter()
+        total = 0.0
+        for batch in rf.iter_batches(batch=8192):
+            for _id, _ts, price in batch:
+                total += price
+        print(f"📖 Summed prices = {total:,.1f} in {time.perf_counter() - t0:.2f}s")
+
+        # Zero-copy slicing of a record range
+        with rf[500_000:500_005] as window:
+            print(f"🔎 Records 500000..500004: {list(window)}")
+            with window[1:3] as inner:
+                print(f"🔎 Sub-slice [1:3]: {list(inner)}")
+
+        print(f"🎯 Single record rf[-1]: {rf[-1]}")
+
+    os.remove(path)
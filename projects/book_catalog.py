@@ -0,0 +1,319 @@
+# ==============================================================
+# 📚 BOOK CATALOG: consistent hashing + streaming deduplication
+# ==============================================================
+
+# lessons/40.dunder_methods.py gives Book an __eq__ but no __hash__:
+#     class Book:
+#         def __eq__(self, other):
+#             return self.title == other.title and self.author == other.author
+#
+# Defining __eq__ silently sets __hash__ = None, so {b1, b2} raises
+# "TypeError: unhashable type: 'Book'" and the only way to drop duplicates is
+# to compare every book with every other one — O(n²).
+#
+# ✅ Book.__hash__ built from the SAME fields as __eq__ (equal books → equal hashes)
+# ✅ CatalogIndex: one pass over a feed of any size, yields each book once
+#    - exact mode: remembers a 16-byte BLAKE2 digest per unique book, not the book
+#      (≈80 bytes per entry instead of the full title/author strings)
+#    - Bloom mode: fixed memory chosen up front (≈1.5 bytes per book at 1% error);
+#      may drop a small, bounded fraction of unique books as "already seen"
+#    - both: exact answers; the Bloom filter answers "definitely new" without
+#      touching the set (worth it when the exact store is slow, e.g. on disk —
+#      next to an in-memory set it only adds work)
+# ✅ read_feed / dedupe_file for tab-separated "title<TAB>author" files
+
+import functools
+import hashlib
+import math
+import operator
+import sys
+from array import array
+from functools import reduce
+from itertools import repeat
+
+_MOD64 = bytes(i & 63 for i in range(256))         # byte → bit number in a 64-bit word
+_MIN_ERROR_RATE = 1e-10                            # smallest Bloom error rate accepted
+
+
+# ------------------------------------------
+# ✅ 1. Hashable Book
+# ------------------------------------------
+
+class Book:
+    __slots__ = ("title", "author")
+
+    def __init__(self, title, author):
+        self.title = title
+        self.author = author
+
+    def __str__(self):
+        return f"{self.title} by {self.author}"
+
+    def __repr__(self):
+        return f"Book({self.title!r}, {self.author!r})"
+
+    def key(self):
+        # The fields that define equality — __eq__ and __hash__ both use this
+        return (self.title, self.author)
+
+    def __eq__(self, other):
+        if not isinstance(other, Book):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def digest(self):
+        # Stable 16-byte fingerprint (hash() changes between runs for strings)
+        return book_digest(self.title, self.author)
+
+
+def book_digest(title, author):
+    # The title's byte length goes first, so ("ab", "c") and ("a", "bc") stay
+    # apart whatever characters the fields contain
+    title = title.encode("utf-8", "surrogatepass")
+    author = author.encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(len(title).to_bytes(8, "little") + title + author,
+                           digest_size=16).digest()
+
+
+# ------------------------------------------
+# ✅ 2. Bloom filter
+# ------------------------------------------
+
+class BloomFilter:
+    #   seen = BloomFilter(capacity=50_000_000, error_rate=0.01)   # ≈ 76 MB
+    #   seen.add(digest) → True if it was (probably) there already
+    #
+    # "Blocked" layout: all k bits of a key live in ONE 64-bit word, so a lookup
+    # is one array access and the k-bit mask is built with map()/reduce() in C
+    # instead of k Python-level bit operations. Costs more bits than a classic
+    # Bloom filter for the same error rate, so the size comes from the blocked
+    # layout's own false-positive formula (see _blocked_error_rate).
+
+    def __init__(self, capacity, error_rate=0.01):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if error_rate < _MIN_ERROR_RATE:
+            # with at most 8 bits per key in one word, two keys sharing a word
+            # already cost thousands of bits per key at this rate
+            raise ValueError(f"error_rate below {_MIN_ERROR_RATE} is not practical for a blocked "
+                             "Bloom filter; use the exact index instead")
+        # Smallest filter that meets error_rate, over k = 1..8 (one digest byte per bit)
+        words, self.hashes = min((_words_needed(capacity, error_rate, k), k) for k in range(1, 9))
+        self.words = array("Q", bytes(8 * words))
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+    def _locate(self, digest):
+        # Word index from the first 8 digest bytes, bit numbers (0..63) from the next k
+        word = int.from_bytes(digest[:8], "little") % len(self.words)
+        mask = reduce(operator.or_, map(operator.lshift, repeat(1),
+                                        digest[8:8 + self.hashes].translate(_MOD64)))
+        return word, mask
+
+    def __contains__(self, digest):
+        word, mask = self._locate(digest)
+        return self.words[word] & mask == mask
+
+    def add(self, digest):
+        word, mask = self._locate(digest)
+        old = self.words[word]
+        if old & mask == mask:
+            return True
+        self.words[word] = old | mask
+        return False
+
+    @property
+    def nbytes(self):
+        return self.words.itemsize * len(self.words)
+
+
+def _blocked_error_rate(load, hashes):
+    # False-positive rate of a blocked Bloom filter with `load` keys per 64-bit
+    # word on average. Each key sets `hashes` random bits of its word (repeats
+    # allowed); a lookup is a false positive when every bit it picks is set.
+    # For a lookup hitting q distinct bits, inclusion-exclusion over the ones
+    # left unset gives  Σ_i (-1)^i·C(q, i)·(1 - i/64)^(k·keys in the word),
+    # and with a Poisson number of keys per word E[x^(k·j)] = exp(load·(x^k - 1)).
+    return sum(c * math.exp(load * ((1 - i / 64) ** hashes - 1))
+               for i, c in enumerate(_unset_terms(hashes)))
+
+
+@functools.lru_cache(maxsize=None)
+def _unset_terms(hashes):
+    # Coefficient of (1 - i/64)^draws in P(all of a lookup's bits are set)
+    distinct = [1.0] + [0.0] * hashes             # P(k picks hit exactly q distinct bits)
+    for _ in range(hashes):
+        distinct = [distinct[q] * q / 64 + (distinct[q - 1] * (65 - q) / 64 if q else 0.0)
+                    for q in range(hashes + 1)]
+    return [sum(p * (-1) ** i * math.comb(q, i) for q, p in enumerate(distinct) if q >= i)
+            for i in range(hashes + 1)]
+
+
+def _words_needed(capacity, error_rate, hashes):
+    # Binary search for the fewest 64-bit words that keep the error rate in bounds
+    capacity = max(1, capacity)
+    low, high = 1, 1
+    while _blocked_error_rate(capacity / high, hashes) > error_rate:
+        low, high = high, high * 2
+    while low < high:
+        mid = (low + high) // 2
+        if _blocked_error_rate(capacity / mid, hashes) > error_rate:
+            low = mid + 1
+        else:
+            high = mid
+    return high
+
+
+# ------------------------------------------
+# ✅ 3. Streaming catalog index
+# ------------------------------------------
+
+class CatalogIndex:
+    #   index = CatalogIndex()                                 # exact
+    #   index = CatalogIndex(exact=False, bloom_capacity=50_000_000)   # bounded memory
+    #   for book in index.dedupe(feed): ...                    # first occurrence of each book
+
+    def __init__(self, exact=True, bloom_capacity=None, error_rate=0.01):
+        if not exact and bloom_capacity is None:
+            raise ValueError("a Bloom-only index needs bloom_capacity")
+        self.digests = set() if exact else None
+        self.bloom = BloomFilter(bloom_capacity, error_rate) if bloom_capacity else None
+        self.seen = 0
+        self.unique = 0
+
+    def add_key(self, title, author):
+        # True if this (title, author) is new
+        digest = book_digest(title, author)
+        self.seen += 1
+        if self.bloom is not None:
+            maybe_seen = self.bloom.add(digest)
+            if self.digests is None:             # Bloom only: trust the filter
+                if maybe_seen:
+                    return False
+                self.unique += 1
+                return True
+            if not maybe_seen:                   # definitely new: skip the set lookup
+                self.digests.add(digest)
+                self.unique += 1
+                return True
+        if digest in self.digests:
+            return False
+        self.digests.add(digest)
+        self.unique += 1
+        return True
+
+    def add(self, book):
+        return self.add_key(book.title, book.author)
+
+    def __contains__(self, book):
+        digest = book.digest()
+        if self.bloom is not None and digest not in self.bloom:
+            return False
+        return digest in self.digests if self.digests is not None else True
+
+    def __len__(self):
+        return self.unique
+
+    def dedupe(self, books):
+        add = self.add
+        for book in books:
+            if add(book):
+                yield book
+
+    @property
+    def duplicates(self):
+        return self.seen - self.unique
+
+    def nbytes(self):
+        # Approximate memory of the index itself
+        total = self.bloom.nbytes if self.bloom else 0
+        if self.digests:
+            total += sys.getsizeof(self.digests) + len(self.digests) * sys.getsizeof(bytes(16))
+        return total
+
+    def stats(self):
+        return {"seen": self.seen, "unique": self.unique, "duplicates": self.duplicates,
+                "bloom_bytes": self.bloom.nbytes if self.bloom else 0,
+                "exact_entries": len(self.digests) if self.digests is not None else 0}
+
+
+# ------------------------------------------
+# ✅ 4. Files: one book per line, "title<TAB>author"
+# ------------------------------------------
+
+def read_feed(path, encoding="utf-8"):
+    with open(path, encoding=encoding, newline="") as f:
+        for line in f:
+            title, _, author = line.rstrip("\r\n").partition("\t")
+            yield Book(title, author)
+
+
+def dedupe_file(src, dst, index=None, encoding="utf-8"):
+    # Streams src → dst keeping the first copy of every book; memory depends only on the index
+    if index is None:
+        index = CatalogIndex()
+    with open(src, encoding=encoding, newline="") as fin, \
+            open(dst, "w", encoding=encoding, newline="") as fout:
+        for line in fin:
+            title, _, author = line.rstrip("\r\n").partition("\t")
+            if index.add_key(title, author):
+                fout.write(f"{title}\t{author}\n")
+    return index
+
+
+def dedupe_pairwise(books):
+    # What the lesson's Book forces you to do: compare with every kept book
+    kept = []
+    for book in books:
+        if not any(book == other for other in kept):
+            kept.append(book)
+    return kept
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    b1 = Book("Harry Potter 1", "JKrow")
+    b2 = Book("Harry Potter 1", "JKrow")
+    print(f"📗 b1 == b2: {b1 == b2}, hash equal: {hash(b1) == hash(b2)}, set size: {len({b1, b2})}")
+
+    rng = random.Random(7)
+
+    def feed(n, distinct):
+        for _ in range(n):
+            i = rng.randrange(distinct)
+            yield Book(f"Title {i}", f"Author {i % 9973}")
+
+    small = list(feed(3_000, 2_000))
+    t0 = time.perf_counter()
+    slow = dedupe_pairwise(small)
+    t_pair = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fast = list(CatalogIndex().dedupe(small))
+    t_index = time.perf_counter() - t0
+    assert slow == fast
+    print(f"⏱️ {len(small):,} books: pairwise {t_pair:.2f}s vs index {t_index * 1e3:.1f} ms")
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000     # pass 50000000 for the full feed
+    distinct = n * 7 // 10
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = os.path.join(tmp, "feed.tsv"), os.path.join(tmp, "unique.tsv")
+        with open(src, "w", encoding="utf-8") as f:
+            f.writelines(f"{b.title}\t{b.author}\n" for b in feed(n, distinct))
+
+        for label, make in (("exact", lambda: CatalogIndex()),
+                            ("bloom", lambda: CatalogIndex(exact=False, bloom_capacity=n)),
+                            ("bloom+exact", lambda: CatalogIndex(bloom_capacity=n))):
+            t0 = time.perf_counter()
+            index = dedupe_file(src, dst, make())
+            elapsed = time.perf_counter() - t0
+            size = index.nbytes()
+            print(f"🧾 {label:<11}: {index.unique:,} unique / {index.seen:,} in {elapsed:.1f}s "
+                  f"({n / elapsed / 1e6:.2f}M books/s), index {size / 1e6:.1f} MB "
+                  f"({size / index.unique:.1f} B per unique book)")
@@ -0,0 +1,306 @@
+# ==============================================================
+# 🚀 CONCURRENT BULK FETCHER (asyncio + rate limit + retries → JSONL)
+# ==============================================================
+
+# lessons/45.API_requesting.py fetches ONE Pokémon typed into input().
+# Pulling all ~1000 of them one by one means ~1000 sequential round trips.
+#
+# This module fetches many URLs at once, but politely:
+# ✅ bounded concurrency   → at most N requests in flight (asyncio.Semaphore-like workers)
+# ✅ token-bucket limiter  → at most R requests per second on average, small bursts allowed
+# ✅ retries with jitter   → 429 / 5xx / connection errors are retried with
+#                            "full jitter" exponential backoff (and Retry-After is honoured)
+# ✅ streaming output      → every result is written to a .jsonl file AS SOON AS it arrives,
+#                            so memory stays flat no matter how many records we pull
+#
+# Only the standard library is used: a tiny keep-alive HTTP/1.1 client is built on
+# asyncio.open_connection(), so it also runs where `requests` / `aiohttp` are missing.
+# Use projects/stub_http_server.py to try it offline.
+
+import asyncio
+import json
+import random
+import ssl
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+BASE_URL = "https://pokeapi.co/api/v2/"
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+# ------------------------------------------
+# ✅ 1. Token bucket rate limiter
+# ------------------------------------------
+
+class TokenBucket:
+    # `rate` tokens are added per second, up to `capacity` (the burst size).
+    # Every request takes one token; if the bucket is empty we sleep just long
+    # enough for the next token to appear. The default burst is `rate` tokens,
+    # but never less than one (a bucket that can't hold a token never opens).
+
+    def __init__(self, rate, capacity=None):
+        if not rate > 0:
+            raise ValueError("rate must be positive")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1 token")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# ------------------------------------------
+# ✅ 2. Minimal keep-alive HTTP/1.1 client
+# ------------------------------------------
+
+class HTTPError(Exception):
+    def __init__(self, status, url, retry_after=None):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+        self.retry_after = retry_after
+
+
+class AsyncHTTPClient:
+    # Keeps idle connections per (scheme, host, port) so that the next request
+    # reuses the socket instead of paying for a new TCP/TLS handshake.
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self.idle = {}                           # (scheme, host, port) → [(reader, writer), ...]
+        self.ssl_context = ssl.create_default_context()
+
+    async def _connect(self, key):
+        pool = self.idle.get(key)
+        while pool:
+            reader, writer = pool.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+        scheme, host, port = key
+        return await asyncio.open_connection(
+            host, port, ssl=self.ssl_context if scheme == "https" else None
+        )
+
+    def _release(self, key, conn):
+        self.idle.setdefault(key, []).append(conn)
+
+    async def get(self, url):
+        # Returns (status, headers, body_bytes)
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        reader, writer = await asyncio.wait_for(self._connect(key), self.timeout)
+        try:
+            request = (
+                f"GET {target} HTTP/1.1\r\n"
+                f"Host: {parts.netloc}\r\n"
+                "Accept: application/json\r\n"
+                "Connection: keep-alive\r\n\r\n"
+            )
+            writer.write(request.encode())
+            await writer.drain()
+            status, headers, body = await asyncio.wait_for(self._read_response(reader), self.timeout)
+        except BaseException:
+            writer.close()
+            raise
+
+        if headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self._release(key, (reader, writer))
+        return status, headers, body
+
+    async def _read_response(self, reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Server closed the connection")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()         # trailing CRLF
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()             # CRLF after every chunk
+            body = b"".join(chunks)
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+        return status, headers, body
+
+    async def close(self):
+        for pool in self.idle.values():
+            for _reader, writer in pool:
+                writer.close()
+        self.idle.clear()
+
+
+# ------------------------------------------
+# ✅ 3. Retries with jittered exponential backoff
+# ------------------------------------------
+
+def backoff_delay(attempt, base=0.2, cap=10.0, rng=random):
+    # "Full jitter": pick a random delay in [0, min(cap, base * 2**attempt)].
+    # Spreading the retries out stops all workers from retrying in lock-step.
+    return rng.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def parse_retry_after(value, now=None):
+    # Retry-After is either delay-seconds ("120") or an HTTP-date
+    # ("Wed, 21 Oct 2015 07:28:00 GMT", RFC 9110). Returns seconds to wait,
+    # or None when the header is missing or unreadable (→ plain backoff).
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+async def fetch_json(client, url, limiter=None, retries=5, base_delay=0.2, stats=None):
+    stats = stats if stats is not None else {}
+    for attempt in range(retries + 1):
+        if limiter:
+            await limiter.acquire()
+        try:
+            status, headers, body = await client.get(url)
+            stats["requests"] = stats.get("requests", 0) + 1
+            if status == 200:
+                return json.loads(body)
+            error = HTTPError(status, url, parse_retry_after(headers.get("retry-after")))
+            if status not in RETRYABLE_STATUS:
+                raise error
+        except (ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError, OSError) as e:
+            stats["requests"] = stats.get("requests", 0) + 1
+            error = e
+
+        if attempt == retries:
+            raise error
+        stats["retries"] = stats.get("retries", 0) + 1
+        delay = backoff_delay(attempt, base_delay)
+        if isinstance(error, HTTPError) and error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+        await asyncio.sleep(delay)
+
+
+# ------------------------------------------
+# ✅ 4. Bulk fetch → JSONL
+# ------------------------------------------
+
+async def bulk_fetch(urls, out_path, concurrency=20, rate=50, burst=None,
+                     retries=5, base_delay=0.2, timeout=10):
+    # Fetch every URL and append one JSON object per line to `out_path`.
+    # Failed URLs are written as {"url": ..., "error": ...} so nothing is lost.
+    # Returns a stats dict (ok, failed, requests, retries, seconds, per_second).
+    queue = asyncio.Queue(maxsize=concurrency * 2)   # backpressure on the producer
+    limiter = TokenBucket(rate, burst) if rate else None
+    client = AsyncHTTPClient(timeout=timeout)
+    stats = {"ok": 0, "failed": 0, "requests": 0, "retries": 0}
+    started = time.perf_counter()
+
+    with open(out_path, "w", encoding="utf-8") as out:
+
+        async def worker():
+            while True:
+                url = await queue.get()
+                if url is None:
+                    queue.task_done()
+                    return
+                try:
+                    record = await fetch_json(client, url, limiter, retries, base_delay, stats)
+                    stats["ok"] += 1
+                except Exception as e:
+                    record = {"url": url, "error": str(e)}
+                    stats["failed"] += 1
+                out.write(json.dumps(record) + "\n")   # streamed as it arrives
+                queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            for url in urls:
+                await queue.put(url)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await client.close()
+
+    stats["seconds"] = time.perf_counter() - started
+    stats["per_second"] = (stats["ok"] + stats["failed"]) / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+async def all_pokemon_urls(base_url=BASE_URL, limit=2000, timeout=10):
+    client = AsyncHTTPClient(timeout=timeout)
+    try:
+        listing = await fetch_json(client, f"{base_url}pokemon?limit={limit}")
+    finally:
+        await client.close()
+    return [item["url"] for item in listing["results"]]
+
+
+async def fetch_all_pokemon(out_path="pokemon.jsonl", base_url=BASE_URL, **kwargs):
+    urls = await all_pokemon_urls(base_url)
+    return await bulk_fetch(urls, out_path, **kwargs)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    from stub_http_server import StubPokeServer
+
+    if "--live" in sys.argv:
+        stats = asyncio.run(fetch_all_pokemon("pokemon.jsonl", concurrency=10, rate=20))
+        print(f"🌐 Live run: {stats}")
+    else:
+        # Offline: 1000 fake Pokémon, 10% of replies are 503 and every 50th is a 429
+        with StubPokeServer(count=1000, failure_rate=0.1, throttle_every=50) as server:
+            stats = asyncio.run(fetch_all_pokemon(
+                "pokemon_stub.jsonl", base_url=server.base_url,
+                concurrency=32, rate=2000, base_delay=0.01,
+            ))
+            print(f"🧪 Stub run: {stats}")
+            print(f"📊 Server saw {server.hits} requests")
+        with open("pokemon_stub.jsonl", encoding="utf-8") as f:
+            print(f"📄 Lines written: {sum(1 for _ in f)}")
+        os.remove("pokemon_stub.jsonl")
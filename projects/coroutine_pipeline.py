@@ -0,0 +1,271 @@
+# ==============================================================
+# 📨 PUSH-BASED COROUTINE PIPELINES (built on the echo() .send() pattern)
+# ==============================================================
+
+# lessons/51.iterables.py shows a generator that RECEIVES values:
+#     def echo():
+#         while True:
+#             val = yield
+#             print(f"Received: {val}")
+#     gen = echo()
+#     next(gen)          # prime it
+#     gen.send("Hello")
+#
+# Normal generator pipelines are PULL based: the consumer asks for the next item.
+# Coroutine pipelines are PUSH based: the producer sends each event forward,
+# which fits event ingestion (sockets, message queues) where data arrives on its own.
+#
+#     source ──send──▶ filter ──send──▶ map ──send──▶ batch ──send──▶ sink
+#
+# ✅ @coroutine          → primes the generator (no more forgetting next(gen))
+# ✅ filter_/map_/batch/aggregate/sink stages
+# ✅ broadcast           → fan-out: one event to many targets
+# ✅ merge               → fan-in: many sources into one target, closes it once
+#                          every source has finished
+# ✅ close() propagates  → batch/aggregate flush their leftovers when the stream ends
+
+import functools
+
+
+def coroutine(function):
+    # Decorator that creates the generator AND advances it to the first `yield`
+    @functools.wraps(function)
+    def start(*args, **kwargs):
+        gen = function(*args, **kwargs)
+        next(gen)
+        return gen
+    return start
+
+
+# ------------------------------------------
+# ✅ 1. Sources
+# ------------------------------------------
+
+def push(iterable, target, close=True):
+    # Send every item of `iterable` into `target` (then close it)
+    send = target.send
+    for item in iterable:
+        send(item)
+    if close:
+        target.close()
+
+
+# ------------------------------------------
+# ✅ 2. Processing stages
+# ------------------------------------------
+
+@coroutine
+def filter_(predicate, target):
+    send = target.send
+    try:
+        while True:
+            item = yield
+            if predicate(item):
+                send(item)
+    except GeneratorExit:
+        target.close()
+
+
+@coroutine
+def map_(function, target):
+    send = target.send
+    try:
+        while True:
+            send(function((yield)))
+    except GeneratorExit:
+        target.close()
+
+
+@coroutine
+def batch(size, target):
+    # Groups events into lists of `size`; the last partial batch is sent on close()
+    send = target.send
+    buffer = []
+    append = buffer.append
+    try:
+        while True:
+            append((yield))
+            if len(buffer) >= size:
+                send(buffer)
+                buffer = []
+                append = buffer.append
+    except GeneratorExit:
+        if buffer:
+            send(buffer)
+        target.close()
+
+
+@coroutine
+def unbatch(target):
+    # Opposite of batch(): a list in, its items out one by one
+    send = target.send
+    try:
+        while True:
+            for item in (yield):
+                send(item)
+    except GeneratorExit:
+        target.close()
+
+
+@coroutine
+def aggregate(function, initial, target, every=None):
+    # Running reduction, e.g. aggregate(lambda acc, x: acc + x, 0, target).
+    # Sends the current value every `every` events (if set) and once more on close.
+    acc = initial
+    seen = 0
+    try:
+        while True:
+            acc = function(acc, (yield))
+            seen += 1
+            if every and seen % every == 0:
+                target.send(acc)
+    except GeneratorExit:
+        if not every or seen % every:
+            target.send(acc)
+        target.close()
+
+
+# ------------------------------------------
+# ✅ 3. Fan-out / fan-in
+# ------------------------------------------
+
+@coroutine
+def broadcast(*targets):
+    sends = [t.send for t in targets]
+    try:
+        while True:
+            item = yield
+            for send in sends:
+                send(item)
+    except GeneratorExit:
+        for t in targets:
+            t.close()
+
+
+class merge:
+    # Fan-in: merge(target, sources=3) hands out 3 inputs; the target is closed
+    # only after ALL of them have been closed.
+    #
+    #   m = merge(sink_, sources=2)
+    #   push(stream_a, m.input())
+    #   push(stream_b, m.input())
+
+    def __init__(self, target, sources):
+        self.target = target
+        self.remaining = sources
+
+    @coroutine
+    def _input(self):
+        send = self.target.send
+        try:
+            while True:
+                send((yield))
+        except GeneratorExit:
+            self.remaining -= 1
+            if self.remaining == 0:
+                self.target.close()
+
+    def input(self):
+        return self._input()
+
+
+# ------------------------------------------
+# ✅ 4. Sinks
+# ------------------------------------------
+
+@coroutine
+def sink(results=None):
+    # Appends everything it receives to `results` (a list you own)
+    append = results.append if results is not None else None
+    while True:
+        item = yield
+        if append is not None:
+            append(item)
+
+
+@coroutine
+def counter(totals, key="count"):
+    # Counts items; the total is written into totals[key] on close()
+    n = 0
+    try:
+        while True:
+            yield
+            n += 1
+    except GeneratorExit:
+        totals[key] = totals.get(key, 0) + n
+
+
+@coroutine
+def printer(prefix="Received: "):
+    # The lesson's echo(), as a pipeline sink
+    while True:
+        print(f"{prefix}{(yield)}")
+
+
+if __name__ == "__main__":
+    import time
+
+    # Fan-out + aggregation example
+    results = []
+    evens = []
+    push(range(10), broadcast(
+        filter_(lambda x: x % 2 == 0, sink(evens)),
+        aggregate(lambda acc, x: acc + x, 0, sink(results)),
+    ))
+    print(f"🔀 evens={evens} total={results}")
+
+    # Fan-in example
+    merged = []
+    m = merge(sink(merged), sources=2)
+    a, b = m.input(), m.input()
+    push("abc", a)
+    push("xyz", b)
+    print(f"🔗 merged={merged}")
+
+    # ---------------------------------------------------------------
+    # Benchmark: 1M events through 5 stages, PUSH vs PULL
+    # stages: filter → map → map → batch(100) → count
+    # ---------------------------------------------------------------
+    n = 1_000_000
+    events = range(n)
+
+    def keep(x):
+        return x % 7 != 0
+
+    def double(x):
+        return x * 2
+
+    def inc(x):
+        return x + 1
+
+    totals = {}
+    t0 = time.perf_counter()
+    push(events, filter_(keep, map_(double, map_(inc, batch(100, counter(totals))))))
+    push_time = time.perf_counter() - t0
+
+    def pull_filter(src):
+        for x in src:
+            if keep(x):
+                yield x
+
+    def pull_map(function, src):
+        for x in src:
+            yield function(x)
+
+    def pull_batch(size, src):
+        buffer = []
+        for x in src:
+            buffer.append(x)
+            if len(buffer) >= size:
+                yield buffer
+                buffer = []
+        if buffer:
+            yield buffer
+
+    t0 = time.perf_counter()
+    pulled = sum(1 for _ in pull_batch(100, pull_map(inc, pull_map(double, pull_filter(events)))))
+    pull_time = time.perf_counter() - t0
+
+    assert pulled == totals["count"]
+    print(f"📨 push: {n / push_time:,.0f} events/s ({push_time:.2f}s)")
+    print(f"📥 pull: {n / pull_time:,.0f} events/s ({pull_time:.2f}s)")
@@ -0,0 +1,350 @@
+# ==============================================================
+# 📥 STREAMING, RESUMABLE, PARALLEL DOWNLOAD MANAGER
+# ==============================================================
+
+# The binary download snippet in lessons/45.API_requesting.py is:
+#     img = requests.get("http://example.com/image.jpg")
+#     with open("image.jpg", "wb") as f:
+#         f.write(img.content)
+#
+# img.content holds the WHOLE file in RAM → a 4 GB file needs 4 GB of memory,
+# and if the connection drops at 99% you start again from zero.
+#
+# This manager:
+# ✅ streams with stream=True + iter_content(chunk_size) → memory stays at ~chunk_size per worker
+# ✅ preallocates the target file (truncate to the final size) and writes each
+#    chunk at its own offset
+# ✅ resumes: progress of every byte range is kept in "<dest>.part.json", and the
+#    next run asks only for the missing bytes with a "Range: bytes=start-end" header
+# ✅ parallel: large files are split into N byte ranges downloaded by N threads
+# ✅ incremental checksum: the hash is fed with the contiguous finished prefix of
+#    the file WHILE the download is running, so verification needs no extra full pass
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+
+import requests  # Third-party module. Install via: pip install requests
+from requests.adapters import HTTPAdapter
+
+CHUNK_SIZE = 1024 * 1024   # 1 MiB per read → also the memory used per worker
+
+
+class ChecksumError(Exception):
+    pass
+
+
+# ------------------------------------------
+# ✅ 1. Progress state (what is already on disk)
+# ------------------------------------------
+
+class DownloadState:
+    # segments: list of [start, end, done] where `end` is inclusive (HTTP style)
+    # and `done` is how many bytes of that range are already written.
+
+    def __init__(self, path, size, etag, segments):
+        self.path = path
+        self.size = size
+        self.etag = etag
+        self.segments = segments
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load_or_create(cls, path, size, etag, parts):
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+            # Only resume if the remote file is the same one we started on
+            if saved["size"] == size and saved["etag"] == etag:
+                return cls(path, size, etag, saved["segments"])
+
+        step = -(-size // parts)    # ceiling division
+        segments = [[start, min(start + step, size) - 1, 0] for start in range(0, size, step)]
+        return cls(path, size, etag, segments)
+
+    def advance(self, index, nbytes):
+        with self.lock:
+            self.segments[index][2] += nbytes
+
+    def remaining(self, index):
+        start, end, done = self.segments[index]
+        return start + done, end
+
+    def contiguous_prefix(self):
+        # How many bytes from offset 0 are finished with no holes
+        with self.lock:
+            frontier = 0
+            for start, end, done in self.segments:
+                if start != frontier:
+                    break
+                frontier = start + done
+                if frontier != end + 1:
+                    break
+            return frontier
+
+    def save(self):
+        with self.lock:
+            data = {"size": self.size, "etag": self.etag, "segments": self.segments}
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)      # atomic, never a half-written state file
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# ------------------------------------------
+# ✅ 2. Incremental hasher over the finished prefix
+# ------------------------------------------
+
+class PrefixHasher:
+    # Reads bytes [hashed, frontier) back from the partial file in small chunks
+    # and feeds them to the hash, so the checksum is ready when the download ends.
+
+    def __init__(self, part_path, algorithm, chunk_size=CHUNK_SIZE):
+        self.part_path = part_path
+        self.hash = hashlib.new(algorithm)
+        self.hashed = 0
+        self.chunk_size = chunk_size
+        self.buffer = bytearray(chunk_size)        # reused for every read
+
+    def catch_up(self, frontier):
+        if frontier <= self.hashed:
+            return
+        view = memoryview(self.buffer)
+        with open(self.part_path, "rb") as f:
+            f.seek(self.hashed)
+            while self.hashed < frontier:
+                want = min(self.chunk_size, frontier - self.hashed)
+                n = f.readinto(view[:want])
+                if not n:
+                    break
+                self.hash.update(view[:n])
+                self.hashed += n
+        view.release()
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+
+# ------------------------------------------
+# ✅ 3. The manager
+# ------------------------------------------
+
+class DownloadManager:
+    #   dm = DownloadManager(workers=8)
+    #   dm.download("https://example.com/big.iso", "big.iso",
+    #               checksum="9f86d08...", algorithm="sha256")
+
+    def __init__(self, workers=4, chunk_size=CHUNK_SIZE, min_segment=8 * CHUNK_SIZE,
+                 timeout=30, session=None):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.min_segment = min_segment
+        self.timeout = timeout
+        if session is None:                     # a caller's session keeps its own adapters
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def probe(self, url):
+        # HEAD request → (size or None, supports ranges?, etag)
+        r = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+        r.raise_for_status()
+        size = r.headers.get("Content-Length")
+        ranges = r.headers.get("Accept-Ranges", "").lower() == "bytes"
+        etag = r.headers.get("ETag") or r.headers.get("Last-Modified")
+        return (int(size) if size is not None else None), ranges, etag
+
+    def download(self, url, dest, checksum=None, algorithm="sha256"):
+        size, ranges, etag = self.probe(url)
+        part_path = dest + ".part"
+
+        if not size or not ranges:
+            digest = self._download_stream(url, part_path, algorithm)
+        else:
+            parts = max(1, min(self.workers, size // self.min_segment or 1))
+            digest = self._download_ranges(url, part_path, size, etag, parts, algorithm)
+
+        if checksum is not None and digest != checksum.lower():
+            raise ChecksumError(f"{algorithm} mismatch for {dest}: expected {checksum}, got {digest}")
+        os.replace(part_path, dest)
+        return digest
+
+    # -- single stream (server does not support Range / unknown size) ------
+    def _download_stream(self, url, part_path, algorithm):
+        hasher = hashlib.new(algorithm)
+        with self.session.get(url, stream=True, timeout=self.timeout) as r:
+            r.raise_for_status()
+            with open(part_path, "wb") as f:
+                for chunk in r.iter_content(chunk_size=self.chunk_size):
+                    f.write(chunk)
+                    hasher.update(chunk)       # checksum computed while streaming
+        return hasher.hexdigest()
+
+    # -- parallel byte ranges ----------------------------------------------
+    def _download_ranges(self, url, part_path, size, etag, parts, algorithm):
+        state = DownloadState.load_or_create(part_path + ".json", size, etag, parts)
+
+        # Preallocate: a fresh file is truncated to the final size, an existing
+        # partial file is kept (that's what makes resuming possible)
+        mode = "r+b" if os.path.exists(part_path) else "w+b"
+        with open(part_path, mode) as f:
+            f.truncate(size)
+
+        hasher = PrefixHasher(part_path, algorithm, self.chunk_size)
+        try:
+            with ThreadPoolExecutor(max_workers=len(state.segments)) as pool:
+                futures = [
+                    pool.submit(self._fetch_segment, url, part_path, state, i, etag)
+                    for i in range(len(state.segments))
+                ]
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=0.5, return_when=FIRST_EXCEPTION)
+                    state.save()
+                    hasher.catch_up(state.contiguous_prefix())
+                    for future in done:
+                        future.result()        # re-raise worker errors
+        finally:
+            state.save()                       # whatever was written survives for the next run
+
+        hasher.catch_up(size)
+        state.remove()
+        return hasher.hexdigest()
+
+    def _fetch_segment(self, url, part_path, state, index, etag):
+        start, end = state.remaining(index)
+        if start > end:
+            return                              # finished in an earlier run
+        headers = {"Range": f"bytes={start}-{end}"}
+        if etag:
+            headers["If-Range"] = etag          # server sends 200 (full body) if the file changed
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise requests.exceptions.HTTPError(
+                    f"Expected 206 Partial Content for {headers['Range']}, got {r.status_code}"
+                )
+            with open(part_path, "r+b") as f:  # each thread has its own handle/offset
+                f.seek(start)
+                for chunk in r.iter_content(chunk_size=self.chunk_size):
+                    f.write(chunk)
+                    # flush BEFORE recording progress: the hasher reads the file
+                    # back and the state file claims these bytes are written
+                    f.flush()
+                    state.advance(index, len(chunk))
+
+
+def _local_range_server(payload, cut_after=0, cuts=0):
+    # A tiny HTTP server for offline checks: HEAD, Range / If-Range → 206, and
+    # the first `cuts` GET responses drop the connection after `cut_after` bytes
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    etag = '"%s"' % hashlib.sha256(payload).hexdigest()[:16]
+    remaining_cuts = [cuts]
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _headers(self, status, length, extra=()):
+            self.send_response(status)
+            self.send_header("Content-Length", str(length))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", etag)
+            for key, value in extra:
+                self.send_header(key, value)
+            self.end_headers()
+
+        def do_HEAD(self):
+            self._headers(200, len(payload))
+
+        def do_GET(self):
+            start, end = 0, len(payload) - 1
+            wanted = self.headers.get("Range")
+            if wanted and self.headers.get("If-Range", etag) == etag:
+                first, _, last = wanted.removeprefix("bytes=").partition("-")
+                start, end = int(first), int(last or end)
+                self._headers(206, end - start + 1, [("Content-Range", f"bytes {start}-{end}/{len(payload)}")])
+            else:
+                self._headers(200, len(payload))
+            body = payload[start:end + 1]
+            with lock:
+                cut = remaining_cuts[0] > 0
+                remaining_cuts[0] -= cut
+            if cut:
+                self.wfile.write(body[:cut_after])
+                self.close_connection = True       # client sees a truncated body
+                return
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/file.bin"
+
+
+def _offline_checks():
+    import tempfile
+    import time
+
+    payload = os.urandom(6 * 1024 * 1024 + 123)
+    expected = hashlib.sha256(payload).hexdigest()
+    # chunk_size below the 8 KiB file buffer: progress must still match the disk
+    dm = DownloadManager(workers=4, chunk_size=4096, min_segment=1024 * 1024)
+    with tempfile.TemporaryDirectory() as tmp:
+        dest = os.path.join(tmp, "file.bin")
+
+        server, url = _local_range_server(payload)
+        t0 = time.perf_counter()
+        assert dm.download(url, dest, checksum=expected) == expected
+        print(f"✅ 4 ranges, 4 KiB chunks: checksum ok in {time.perf_counter() - t0:.2f}s")
+        server.shutdown()
+        server.server_close()
+        os.remove(dest)
+
+        # Every segment is cut off after 700,001 bytes; the second run resumes
+        server, url = _local_range_server(payload, cut_after=700_001, cuts=4)
+        try:
+            dm.download(url, dest, checksum=expected)
+            raise AssertionError("the first run should have been interrupted")
+        except requests.exceptions.RequestException:
+            with open(dest + ".part.json", encoding="utf-8") as f:
+                saved = sum(done for _, _, done in json.load(f)["segments"])
+            print(f"✂️ interrupted run saved progress for {saved:,} bytes")
+        assert dm.download(url, dest, checksum=expected) == expected
+        with open(dest, "rb") as f:
+            assert f.read() == payload
+        print(f"🔁 resumed run finished the other {len(payload) - saved:,} bytes, checksum ok")
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: python download_manager.py <url> <dest> [sha256]")
+        print("(no arguments: offline checks against a local range server)\n")
+        _offline_checks()
+        sys.exit(0)
+
+    url, dest = sys.argv[1], sys.argv[2]
+    expected = sys.argv[3] if len(sys.argv) > 3 else None
+    try:
+        digest = DownloadManager(workers=8).download(url, dest, checksum=expected)
+        print(f"✅ Saved {dest} (sha256 {digest})")
+    except ChecksumError as e:
+        print(f"🛑 {e}")
+    except requests.exceptions.RequestException as e:
+        print(f"❗ Download failed (run again to resume): {e}")
@@ -0,0 +1,148 @@
+# ==============================================================
+# 🐇 FAST FIBONACCI ENGINE (fast doubling + Pisano periods)
+# ==============================================================
+
+# lessons/51.iterables.py has this generator:
+#     def fibonacci(n):
+#         a, b = 0, 1
+#         count = 0
+#         while count < n:
+#             yield a
+#             a, b = b, a + b
+#             count += 1
+#
+# To reach F(10**7) it performs ten million big-integer additions.
+#
+# Fast doubling uses two identities:
+#     F(2k)   = F(k) * (2*F(k+1) - F(k))
+#     F(2k+1) = F(k)**2 + F(k+1)**2
+# Walking the bits of n from the top, every bit costs a few multiplications,
+# so F(n) needs only O(log n) big-int operations.
+#
+# ✅ fib(n)               → F(n) exactly
+# ✅ fib_pair(n)          → (F(n), F(n+1))
+# ✅ fib_mod(n, m)        → F(n) mod m, never builds the huge number
+# ✅ pisano_period(m)     → period of F mod m (cached), shrinks n before fib_mod
+# ✅ fibonacci_from(start) → streaming generator starting at ANY index
+
+import functools
+
+
+def fib_pair(n):
+    # Returns (F(n), F(n+1)) using fast doubling, most significant bit first
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    a, b = 0, 1                          # (F(0), F(1))
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)           # F(2k)
+        d = a * a + b * b                # F(2k+1)
+        if bit == "1":
+            a, b = d, c + d              # move to (F(2k+1), F(2k+2))
+        else:
+            a, b = c, d                  # stay at (F(2k), F(2k+1))
+    return a, b
+
+
+def fib(n):
+    return fib_pair(n)[0]
+
+
+def _fib_pair_mod(n, m):
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * ((2 * b - a) % m) % m
+        d = (a * a + b * b) % m
+        if bit == "1":
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a, b
+
+
+# Computing a Pisano period walks at most 6*m terms, so only do it for moderate m.
+PISANO_LIMIT = 10 ** 6
+
+
+@functools.lru_cache(maxsize=256)
+def pisano_period(m):
+    # Length of the cycle of F(n) mod m (it always starts again with 0, 1)
+    if m < 1:
+        raise ValueError("m must be positive")
+    if m == 1:
+        return 1
+    a, b = 0, 1
+    for i in range(1, 6 * m + 1):        # the period never exceeds 6*m
+        a, b = b, (a + b) % m
+        if a == 0 and b == 1:
+            return i
+    raise AssertionError("unreachable: Pisano period is at most 6*m")
+
+
+def fib_mod(n, m):
+    # F(n) mod m. For moderate m the index is first reduced by the Pisano period,
+    # which makes repeated queries with the same modulus especially cheap.
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if m == 1:
+        return 0
+    if m <= PISANO_LIMIT:
+        n %= pisano_period(m)
+    return _fib_pair_mod(n, m)[0]
+
+
+def fibonacci_from(start=0, count=None, mod=None):
+    # Yields F(start), F(start+1), ... (forever if count is None).
+    # The first pair is found with fast doubling, the rest by simple addition.
+    if mod is None:
+        a, b = fib_pair(start)
+    else:
+        a, b = _fib_pair_mod(start % pisano_period(mod) if mod <= PISANO_LIMIT else start, mod)
+    produced = 0
+    while count is None or produced < count:
+        yield a
+        if mod is None:
+            a, b = b, a + b
+        else:
+            a, b = b, (a + b) % mod
+        produced += 1
+
+
+def fibonacci(n):
+    # The original generator from lessons/51.iterables.py (kept for comparison)
+    a, b = 0, 1
+    count = 0
+    while count < n:
+        yield a
+        a, b = b, a + b
+        count += 1
+
+
+if __name__ == "__main__":
+    import time
+
+    # Sanity check against the lesson's generator
+    assert list(fibonacci(200)) == [fib(i) for i in range(200)]
+    assert list(fibonacci_from(150, 50)) == list(fibonacci(200))[150:]
+    assert all(fib_mod(i, 97) == fib(i) % 97 for i in range(500))
+    print("✅ fast doubling matches the step-by-step generator")
+
+    for n in (10 ** 5, 3 * 10 ** 5):
+        t0 = time.perf_counter()
+        for last in fibonacci(n + 1):
+            pass
+        slow = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        fast_value = fib(n)
+        fast = time.perf_counter() - t0
+        assert fast_value == last
+        print(f"⏱️ F({n:,}): generator {slow:.3f}s, fast doubling {fast:.4f}s → {slow / fast:,.0f}x faster")
+
+    t0 = time.perf_counter()
+    digits = fib(10 ** 7).bit_length()
+    print(f"🚀 F(10,000,000) has {digits:,} bits, computed in {time.perf_counter() - t0:.2f}s")
+
+    t0 = time.perf_counter()
+    r = fib_mod(10 ** 18, 10 ** 9 + 7)
+    print(f"🔢 F(10**18) mod 1e9+7 = {r} in {(time.perf_counter() - t0) * 1000:.3f} ms")
+    print(f"🔁 Pisano period of 1000 = {pisano_period(1000)}")
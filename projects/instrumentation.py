@@ -0,0 +1,322 @@
+# ==============================================================
+# ⏱️ PROFILING & TIMING DECORATORS (built on lessons/41.decorators.py)
+# ==============================================================
+
+# The decorator lesson wraps functions to add sprinkles and cream:
+#     def sprinkles(function):
+#         def wrapper(*args, **kwargs):
+#             print("Added sprinkles and ", end="")
+#             function(*args, **kwargs)
+#         return wrapper
+#
+# The exact same pattern can add MEASUREMENTS instead of sprinkles:
+# ✅ @instrument            → call count, errors, total time, latency percentiles
+# ✅ HDR-style histogram    → p50/p90/p99/p999 in O(1) memory per function
+# ✅ profile_rate=0.01      → 1% of calls run under cProfile, merged per function
+# ✅ REGISTRY               → one global place to dump everything as a table or JSON
+# ✅ disable()              → the wrapper becomes a flag check + a plain call
+#                             (see measure_overhead(): well under 1 µs per call)
+
+import cProfile
+import functools
+import io
+import json
+import math
+import pstats
+import random
+import threading
+import time
+
+# A one-element list is cheaper to read inside the wrapper than calling a function,
+# and mutating it (instead of rebinding a global) is visible to every wrapper.
+_ENABLED = [True]
+# Set while a sampled call in this thread is being profiled: a nested sampled
+# call must not start a second profiler (it would take over the profile hook)
+_PROFILING = threading.local()
+
+
+def enable():
+    _ENABLED[0] = True
+
+
+def disable():
+    _ENABLED[0] = False
+
+
+def is_enabled():
+    return _ENABLED[0]
+
+
+# ------------------------------------------
+# ✅ 1. HDR-style latency histogram
+# ------------------------------------------
+
+class LatencyHistogram:
+    # Values (nanoseconds) are stored in log-linear buckets like HdrHistogram:
+    # every power of two is split into `2**precision_bits` equal sub-buckets,
+    # so the relative error of any reported percentile is at most 1 / 2**precision_bits
+    # (precision_bits=7 → <1%), no matter if the value is 100 ns or 100 s.
+
+    def __init__(self, precision_bits=7):
+        self.precision_bits = precision_bits
+        self.sub_buckets = 1 << precision_bits
+        self.counts = {}              # bucket index → count (sparse: only used buckets)
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value):
+        if value < self.sub_buckets:
+            return value              # small values are stored exactly
+        shift = value.bit_length() - self.precision_bits - 1
+        return ((shift + 1) << self.precision_bits) + (value >> shift) - self.sub_buckets
+
+    def _lowest_value(self, index):
+        if index < self.sub_buckets:
+            return index
+        shift = (index >> self.precision_bits) - 1
+        return ((index & (self.sub_buckets - 1)) + self.sub_buckets) << shift
+
+    def record(self, value):
+        value = int(value)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        if not self.total:
+            return 0
+        target = max(1, math.ceil(self.total * p / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._lowest_value(index), self.max)
+        return self.max
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+
+# ------------------------------------------
+# ✅ 2. Per-function stats + global registry
+# ------------------------------------------
+
+class FunctionStats:
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.histogram = LatencyHistogram()
+        self.profile = None           # pstats.Stats, filled by sampled calls
+        self.profiled_calls = 0
+        self.lock = threading.Lock()
+
+    def add(self, elapsed_ns, failed):
+        with self.lock:
+            self.calls += 1
+            self.total_ns += elapsed_ns
+            if failed:
+                self.errors += 1
+            self.histogram.record(elapsed_ns)
+
+    def reset(self):
+        # Zero in place: decorated wrappers keep pointing at this object
+        with self.lock:
+            self.calls = 0
+            self.errors = 0
+            self.total_ns = 0
+            self.histogram = LatencyHistogram()
+            self.profile = None
+            self.profiled_calls = 0
+
+    def add_profile(self, profiler):
+        with self.lock:
+            if self.profile is None:
+                self.profile = pstats.Stats(profiler)
+            else:
+                self.profile.add(profiler)
+            self.profiled_calls += 1
+
+    def summary(self):
+        h = self.histogram
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.calls / 1e3 if self.calls else 0.0,
+            "p50_us": h.percentile(50) / 1e3,
+            "p90_us": h.percentile(90) / 1e3,
+            "p99_us": h.percentile(99) / 1e3,
+            "p999_us": h.percentile(99.9) / 1e3,
+            "max_us": h.max / 1e3,
+            "profiled_calls": self.profiled_calls,
+        }
+
+    def profile_report(self, sort="cumulative", limit=15):
+        if self.profile is None:
+            return ""
+        out = io.StringIO()
+        self.profile.stream = out
+        self.profile.sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+
+class Registry:
+    def __init__(self):
+        self.functions = {}           # qualified name → FunctionStats
+        self.lock = threading.Lock()
+
+    def get(self, name):
+        stats = self.functions.get(name)
+        if stats is None:
+            with self.lock:
+                stats = self.functions.setdefault(name, FunctionStats(name))
+        return stats
+
+    def reset(self):
+        # Keeps every registered function (wrappers hold their stats object),
+        # only the numbers start over
+        with self.lock:
+            for stats in self.functions.values():
+                stats.reset()
+
+    def summaries(self):
+        return [s.summary() for s in sorted(self.functions.values(), key=lambda s: -s.total_ns)]
+
+    def to_json(self, indent=2):
+        return json.dumps(self.summaries(), indent=indent)
+
+    def to_table(self):
+        columns = ["name", "calls", "errors", "total_ms", "mean_us",
+                   "p50_us", "p90_us", "p99_us", "p999_us", "max_us"]
+        rows = [[f"{row[c]:.3f}" if isinstance(row[c], float) else str(row[c]) for c in columns]
+                for row in self.summaries()]
+        widths = [max(len(c), *(len(r[i]) for r in rows)) if rows else len(c)
+                  for i, c in enumerate(columns)]
+        lines = [" | ".join(c.ljust(w) for c, w in zip(columns, widths)),
+                 "-+-".join("-" * w for w in widths)]
+        lines += [" | ".join(v.rjust(w) if i else v.ljust(w) for i, (v, w) in enumerate(zip(r, widths)))
+                  for r in rows]
+        return "\n".join(lines)
+
+
+REGISTRY = Registry()
+
+
+# ------------------------------------------
+# ✅ 3. The decorator
+# ------------------------------------------
+
+def instrument(function=None, *, name=None, profile_rate=0.0, registry=None):
+    # Works both as @instrument and as @instrument(name=..., profile_rate=0.01)
+    def decorator(function):
+        stats = (registry or REGISTRY).get(name or f"{function.__module__}.{function.__qualname__}")
+        enabled = _ENABLED
+        clock = time.perf_counter_ns
+        sample = random.random
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled[0]:
+                return function(*args, **kwargs)      # disabled: flag check + call only
+
+            profiler = None
+            if profile_rate and sample() < profile_rate and not getattr(_PROFILING, "active", False):
+                profiler = cProfile.Profile()
+                try:
+                    profiler.enable()
+                except ValueError:
+                    # Python 3.12+: another profiler (other thread, or an outside
+                    # tool) holds the hook → this call is simply not sampled
+                    profiler = None
+                else:
+                    _PROFILING.active = True
+            failed = True
+            start = clock()
+            try:
+                result = function(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                elapsed = clock() - start
+                if profiler is not None:
+                    profiler.disable()
+                    _PROFILING.active = False
+                    stats.add_profile(profiler)
+                stats.add(elapsed, failed)
+
+        wrapper.stats = stats
+        return wrapper
+
+    if function is not None:
+        return decorator(function)
+    return decorator
+
+
+# ------------------------------------------
+# ✅ 4. Measuring the decorator's own cost
+# ------------------------------------------
+
+def measure_overhead(calls=1_000_000):
+    # Returns nanoseconds added per call by @instrument, enabled and disabled,
+    # compared with calling the bare function.
+    def bare(x):
+        return x
+
+    scratch = Registry()
+    wrapped = instrument(bare, registry=scratch)
+
+    def run(f):
+        start = time.perf_counter_ns()
+        for i in range(calls):
+            f(i)
+        return (time.perf_counter_ns() - start) / calls
+
+    was_enabled = is_enabled()
+    try:
+        baseline = run(bare)
+        disable()
+        off = run(wrapped) - baseline
+        enable()
+        on = run(wrapped) - baseline
+    finally:
+        _ENABLED[0] = was_enabled
+    return {"baseline_ns": baseline, "disabled_overhead_ns": off, "enabled_overhead_ns": on}
+
+
+if __name__ == "__main__":
+
+    @instrument
+    def get_ice_cream(flavor):
+        time.sleep(0.0005)
+        return f"Here is you {flavor} ice-cream!"
+
+    @instrument(profile_rate=0.05)
+    def add_sprinkles(n):
+        return sum(i * i for i in range(n))
+
+    for i in range(200):
+        get_ice_cream("pista")
+        add_sprinkles(10_000 + i)
+
+    print("📊 Table:\n" + REGISTRY.to_table())
+    print("\n🧾 JSON (first entry):\n" + json.dumps(REGISTRY.summaries()[0], indent=2))
+    print("\n🔬 Sampled cProfile for add_sprinkles:")
+    print(add_sprinkles.stats.profile_report(limit=5))
+
+    overhead = measure_overhead()
+    print(f"⚙️ Overhead per call: disabled {overhead['disabled_overhead_ns']:.0f} ns, "
+          f"enabled {overhead['enabled_overhead_ns']:.0f} ns")
+    assert overhead["disabled_overhead_ns"] < 1000, "disabled overhead must stay under 1 µs"
@@ -0,0 +1,427 @@
+# ==============================================================
+# 🧮 FLAT-ARRAY MATRIX: one typed buffer, strides, zero-copy views
+# ==============================================================
+
+# lessons/19.2d-collections.py stores a matrix as a list of lists:
+#     n = [[1, 2, 3],
+#          [2, 3, 6], ...]
+# Every row is its own list object and every number its own int object,
+# scattered around memory; transposing or taking a sub-block means copying.
+#
+# Matrix keeps ALL values in one array.array (row-major) and describes the
+# shape with (offset, row_stride, col_stride):
+#     element (i, j) lives at  buffer[offset + i * row_stride + j * col_stride]
+#
+# ✅ m.T, m[1:3, ::2]          → O(1) views sharing the same buffer (writes show through)
+# ✅ +, -, *, / elementwise    → map() over whole rows (extended array slices, in C)
+# ✅ m @ other                 → blocked multiply: B is transposed into contiguous
+#                                rows once, then tiles of (rows of A) x (rows of Bᵀ)
+#                                are multiplied so each tile stays in cache
+# ✅ Matrix.from_lists(n) / m.tolist()  → the lesson's nested-list format
+
+import math
+import operator
+from array import array
+from itertools import repeat
+
+# math.sumprod is a single C loop (Python 3.12+); fall back to sum(map(mul))
+if hasattr(math, "sumprod"):
+    _dot = math.sumprod
+else:
+    def _dot(a, b):
+        return sum(map(operator.mul, a, b))
+
+_FLOAT_CODES = "fd"
+
+
+def _rsub(a, b):
+    return b - a
+
+
+def _unit_slice(i, n):
+    # Integer index → the 1-wide slice it selects, like Matrix._index's check
+    if i < 0:
+        i += n
+    if not 0 <= i < n:
+        raise IndexError("matrix index out of range")
+    return slice(i, i + 1)
+
+
+class Matrix:
+    #   m = Matrix.from_lists([[1, 2, 3], [4, 5, 6]])
+    #   m[0, 1]        → 2
+    #   m[0]           → row view: prints/compares like [1, 2, 3], m[0][1] = 7 writes through
+    #   m[0] = [7, 8, 9]  replaces a row
+    #   m.T            → 3x2 view, no copy
+    #   m[:, 1:]       → 2x2 view, no copy
+    #   (m @ m.T).tolist()
+
+    __slots__ = ("buffer", "rows", "cols", "offset", "row_stride", "col_stride")
+
+    BLOCK = 64                     # tile size for matmul
+
+    def __init__(self, buffer, rows, cols, offset=0, row_stride=None, col_stride=1):
+        self.buffer = buffer
+        self.rows = rows
+        self.cols = cols
+        self.offset = offset
+        self.row_stride = cols if row_stride is None else row_stride
+        self.col_stride = col_stride
+
+    # -- construction --------------------------------------------------------
+    @classmethod
+    def zeros(cls, rows, cols, typecode="d"):
+        buffer = array(typecode, bytes(array(typecode).itemsize * rows * cols))
+        return cls(buffer, rows, cols)
+
+    @classmethod
+    def identity(cls, n, typecode="d"):
+        m = cls.zeros(n, n, typecode)
+        m.buffer[::n + 1] = array(typecode, repeat(1, n))
+        return m
+
+    @classmethod
+    def from_flat(cls, values, rows, cols, typecode="d"):
+        buffer = values if isinstance(values, array) else array(typecode, values)
+        if len(buffer) != rows * cols:
+            raise ValueError(f"expected {rows * cols} values, got {len(buffer)}")
+        return cls(buffer, rows, cols)
+
+    @classmethod
+    def from_lists(cls, nested, typecode=None):
+        # [[1, 2, 3], [4, 5, 6]] → 2x3 Matrix ('q' for ints, 'd' otherwise)
+        rows = len(nested)
+        cols = len(nested[0]) if rows else 0
+        if any(len(row) != cols for row in nested):
+            raise ValueError("all rows must have the same length")
+        if typecode is None:
+            typecode = "q" if all(type(x) is int for row in nested for x in row) else "d"
+        buffer = array(typecode)
+        for row in nested:
+            buffer.extend(row)
+        return cls(buffer, rows, cols)
+
+    # -- shape & element access --------------------------------------------------
+    @property
+    def shape(self):
+        return (self.rows, self.cols)
+
+    @property
+    def typecode(self):
+        return self.buffer.typecode
+
+    def __len__(self):
+        return self.rows
+
+    def is_contiguous(self):
+        return (self.col_stride == 1 and self.row_stride == self.cols
+                and self.offset == 0 and len(self.buffer) == self.rows * self.cols)
+
+    def _index(self, i, j):
+        if i < 0:
+            i += self.rows
+        if j < 0:
+            j += self.cols
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("matrix index out of range")
+        return self.offset + i * self.row_stride + j * self.col_stride
+
+    def _view(self, rows, cols):
+        # rows/cols are slices or ints; an int keeps that dimension with size 1
+        # (bounds-checked first: a slice would quietly give an empty view)
+        if isinstance(rows, int):
+            rows = _unit_slice(rows, self.rows)
+        if isinstance(cols, int):
+            cols = _unit_slice(cols, self.cols)
+        r = range(self.rows)[rows]
+        c = range(self.cols)[cols]
+        offset = self.offset + r.start * self.row_stride + c.start * self.col_stride
+        return Matrix(self.buffer, len(r), len(c), offset,
+                      self.row_stride * r.step, self.col_stride * c.step)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            i, j = key
+            if isinstance(i, int) and isinstance(j, int):
+                return self.buffer[self._index(i, j)]
+            return self._view(i, j)
+        if isinstance(key, int):
+            # m[0] → [1, 2, 3] like the lesson's n[0], but live: m[0][1] = x writes through
+            return MatrixRow(self, _unit_slice(key, self.rows).start)
+        return self._view(key, slice(None))
+
+    def __setitem__(self, key, value):
+        if not isinstance(key, tuple):
+            if isinstance(key, int) and not isinstance(value, (Matrix, int, float)):
+                # m[i] = [a, b, c] replaces the whole row
+                values = array(self.typecode, value)
+                if len(values) != self.cols:
+                    raise ValueError(f"expected {self.cols} values for the row, got {len(values)}")
+                self._set_row(_unit_slice(key, self.rows).start, values)
+                return
+            key = (key, slice(None))             # m[i] = 0, m[1:3] = other → row views
+        i, j = key
+        if isinstance(i, int) and isinstance(j, int):
+            self.buffer[self._index(i, j)] = value
+            return
+        view = self._view(i, j)
+        if isinstance(value, Matrix):
+            if value.shape != view.shape:
+                raise ValueError(f"shape mismatch: {view.shape} vs {value.shape}")
+            for r in range(view.rows):
+                view._set_row(r, value._row_values(r))
+        else:
+            for r in range(view.rows):
+                view._set_row(r, repeat(value, view.cols))
+
+    # -- rows as array slices (C-level strided copies) ------------------------------
+    def _row_bounds(self, i):
+        start = self.offset + i * self.row_stride
+        stop = start + self.cols * self.col_stride
+        return start, (stop if stop >= 0 else None)
+
+    def _row_values(self, i):
+        start, stop = self._row_bounds(i)
+        return self.buffer[start:stop:self.col_stride]
+
+    def _set_row(self, i, values):
+        start, stop = self._row_bounds(i)
+        self.buffer[start:stop:self.col_stride] = array(self.typecode, values)
+
+    def row(self, i):
+        return self._row_values(range(self.rows)[i]).tolist()
+
+    def col(self, j):
+        return self.T.row(j)
+
+    def iter_rows(self):
+        return map(self._row_values, range(self.rows))
+
+    # -- views ------------------------------------------------------------------
+    @property
+    def T(self):
+        # Transposed view: swap shape and strides, share the buffer
+        return Matrix(self.buffer, self.cols, self.rows, self.offset, self.col_stride, self.row_stride)
+
+    def copy(self, typecode=None):
+        # Contiguous row-major copy
+        buffer = array(typecode or self.typecode)
+        if buffer.typecode != self.typecode:
+            for values in self.iter_rows():
+                buffer.fromlist(values.tolist())
+        elif self.is_contiguous():
+            buffer = array(self.typecode, self.buffer)
+        else:
+            for values in self.iter_rows():
+                buffer.extend(values)
+        return Matrix(buffer, self.rows, self.cols)
+
+    def flat(self):
+        # All values row-major as one array (no copy when already contiguous)
+        return self.buffer if self.is_contiguous() else self.copy().buffer
+
+    # -- export -----------------------------------------------------------------------
+    def tolist(self):
+        return [values.tolist() for values in self.iter_rows()]
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __repr__(self):
+        return f"Matrix.from_lists({self.tolist()!r})"
+
+    def __str__(self):
+        # Same "matrix format" as the lesson's nested loops
+        return "\n".join(" ".join(map(str, values)) for values in self.iter_rows())
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.shape == other.shape and all(map(operator.eq, self.iter_rows(), other.iter_rows()))
+
+    __hash__ = None                # mutable
+
+    # -- elementwise ops ------------------------------------------------------------------
+    def _result_typecode(self, other, op):
+        codes = {self.typecode, other.typecode if isinstance(other, Matrix) else
+                 ("q" if isinstance(other, int) else "d")}
+        if op is operator.truediv or codes & set(_FLOAT_CODES):
+            return "d"
+        return "q"
+
+    def _elementwise(self, other, op):
+        typecode = self._result_typecode(other, op)
+        if isinstance(other, Matrix):
+            if other.shape != self.shape:
+                raise ValueError(f"shape mismatch: {self.shape} vs {other.shape}")
+            if self.is_contiguous() and other.is_contiguous():
+                return Matrix(array(typecode, map(op, self.buffer, other.buffer)), self.rows, self.cols)
+            buffer = array(typecode)
+            for a, b in zip(self.iter_rows(), other.iter_rows()):
+                buffer.extend(map(op, a, b))
+        else:                                  # scalar broadcast
+            if self.is_contiguous():
+                return Matrix(array(typecode, map(op, self.buffer, repeat(other))), self.rows, self.cols)
+            buffer = array(typecode)
+            for a in self.iter_rows():
+                buffer.extend(map(op, a, repeat(other)))
+        return Matrix(buffer, self.rows, self.cols)
+
+    def __add__(self, other):
+        return self._elementwise(other, operator.add)
+
+    def __sub__(self, other):
+        return self._elementwise(other, operator.sub)
+
+    def __mul__(self, other):
+        return self._elementwise(other, operator.mul)
+
+    def __truediv__(self, other):
+        return self._elementwise(other, operator.truediv)
+
+    def __rsub__(self, other):
+        return self._elementwise(other, _rsub)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self._elementwise(-1, operator.mul)
+
+    def apply(self, func, typecode=None):
+        # func applied to every element, e.g. m.apply(math.sqrt)
+        buffer = array(typecode or self.typecode)
+        for values in self.iter_rows():
+            buffer.extend(map(func, values))
+        return Matrix(buffer, self.rows, self.cols)
+
+    def sum(self):
+        return sum(map(sum, self.iter_rows()))
+
+    # -- matrix multiply -------------------------------------------------------------------
+    def __matmul__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.cols != other.rows:
+            raise ValueError(f"cannot multiply {self.shape} by {other.shape}")
+        typecode = "d" if {self.typecode, other.typecode} & set(_FLOAT_CODES) else "q"
+        n, m = self.rows, other.cols
+        # Both operands as contiguous rows: rows of A, rows of Bᵀ (= columns of B).
+        # They are unpacked to lists once, so the n·m dot products below don't
+        # re-box every float they read from the arrays.
+        a_rows = [values.tolist() for values in self.iter_rows()]
+        b_cols = [values.tolist() for values in other.T.iter_rows()]
+        out = array(typecode, bytes(array(typecode).itemsize * n * m))
+        block = self.BLOCK
+        for i0 in range(0, n, block):
+            a_tile = a_rows[i0:i0 + block]
+            for j0 in range(0, m, block):
+                b_tile = b_cols[j0:j0 + block]
+                jn = len(b_tile)
+                for di, a in enumerate(a_tile):
+                    start = (i0 + di) * m + j0
+                    # one tile row: dot(a, b) for every b in the tile, each dot in C
+                    out[start:start + jn] = array(typecode, map(_dot, repeat(a, jn), b_tile))
+        return Matrix(out, n, m)
+
+
+class MatrixRow:
+    # m[i]: one row of a Matrix as a live 1-D view. Reads and writes go straight
+    # to the matrix's buffer; it prints and compares like the list m.row(i).
+
+    __slots__ = ("matrix", "index")
+
+    def __init__(self, matrix, index):
+        self.matrix = matrix
+        self.index = index
+
+    def __len__(self):
+        return self.matrix.cols
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return self.tolist()[j]
+        return self.matrix[self.index, j]
+
+    def __setitem__(self, j, value):
+        if isinstance(j, slice):
+            values = self.tolist()
+            values[j] = value
+            self.matrix[self.index] = values     # length is checked there
+        else:
+            self.matrix[self.index, j] = value
+
+    def __iter__(self):
+        return iter(self.matrix._row_values(self.index))
+
+    def tolist(self):
+        return self.matrix._row_values(self.index).tolist()
+
+    def __eq__(self, other):
+        if isinstance(other, (MatrixRow, list, tuple, array)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None                # mutable
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+
+def matmul_lists(a, b):
+    # The nested-loop way with lists of lists, for comparison
+    n, k, m = len(a), len(b), len(b[0])
+    result = [[0] * m for _ in range(n)]
+    for i in range(n):
+        for j in range(m):
+            total = 0
+            for x in range(k):
+                total += a[i][x] * b[x][j]
+            result[i][j] = total
+    return result
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    n = Matrix.from_lists([[1, 2, 3], [2, 3, 6], [6, 8, 9], [2, 5, 7]])
+    print("Matrix format:")
+    print(n)
+    print(f"\nn[0] → {n[0]}, n[0, 1] → {n[0, 1]}")
+    print(f"n.T → {n.T.tolist()}")
+    view = n[1:3, ::2]
+    view[0, 1] = 99                          # writes through to n
+    print(f"n[1:3, ::2] → {view.tolist()}, n[1] is now {n[1]}")
+    assert (n @ n.T).tolist() == matmul_lists(n.tolist(), n.T.tolist())
+
+    size = 200
+    rng = random.Random(3)
+    a = [[rng.random() for _ in range(size)] for _ in range(size)]
+    b = [[rng.random() for _ in range(size)] for _ in range(size)]
+    A, B = Matrix.from_lists(a), Matrix.from_lists(b)
+
+    t0 = time.perf_counter()
+    slow = matmul_lists(a, b)
+    t_lists = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fast = A @ B
+    t_matrix = time.perf_counter() - t0
+    assert all(map(math.isclose, fast.buffer, (x for row in slow for x in row)))
+    print(f"\n⏱️ {size}x{size} multiply: nested lists {t_lists:.2f}s vs Matrix {t_matrix:.3f}s "
+          f"({t_lists / t_matrix:.0f}x)")
+
+    big = Matrix.from_flat(array("d", (rng.random() for _ in range(1_000_000))), 1000, 1000)
+    big_lists = big.tolist()
+    t0 = time.perf_counter()
+    [[x + y for x, y in zip(r1, r2)] for r1, r2 in zip(big_lists, big_lists)]
+    t_lists = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    big + big
+    t_matrix = time.perf_counter() - t0
+    print(f"⏱️ 1000x1000 add: nested lists {t_lists:.3f}s vs Matrix {t_matrix:.3f}s")
+    t0 = time.perf_counter()
+    big.T[10:500, 3:900]
+    print(f"⏱️ transposed slice view: {(time.perf_counter() - t0) * 1e6:.1f} µs (no copy)")
+    print(f"📦 memory: Matrix {big.buffer.itemsize * len(big.buffer) / 1e6:.0f} MB vs "
+          f"≈{(1000 * 56 + 1_000_000 * (8 + 24)) / 1e6:.0f} MB for lists of floats")
@@ -0,0 +1,289 @@
+# ==============================================================
+# 🧠 MEMOIZATION DECORATOR (LRU / TTL / size limits / single-flight)
+# ==============================================================
+
+# lessons/41.decorators.py ends with a wrapper that forwards every argument:
+#     def sprinkles(function):
+#         def wrapper(*args, **kwargs):
+#             ...
+#             function(*args, **kwargs)
+#         return wrapper
+#
+# Because the wrapper sees ALL the arguments, it can remember the result
+# for those arguments and skip the call next time. That is memoization.
+#
+# @memoize adds what functools.lru_cache does not have:
+# ✅ TTL               → entries expire after `ttl` seconds
+# ✅ max_bytes         → limit by (approximate) memory instead of entry count
+# ✅ key strategies    → lists/dicts/sets as arguments ("freeze"), "pickle", "repr" or your own
+# ✅ single-flight     → 10 threads missing the same key at once → the function runs ONCE,
+#                        the other 9 wait for that result
+# ✅ counters          → hits, misses, evictions, expirations (wrapper.cache_info())
+# ✅ async functions   → `async def` is detected and gets an asyncio-aware cache
+
+import asyncio
+import functools
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+_KWARGS_MARK = object()     # separates positional args from keyword args inside a key
+
+
+# ------------------------------------------
+# ✅ 1. Key strategies
+# ------------------------------------------
+
+def freeze(value):
+    # Turn unhashable containers into hashable equivalents (recursively)
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(freeze(v) for v in value))
+    if isinstance(value, dict):
+        return ("dict", frozenset((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(freeze(v) for v in value))
+    if isinstance(value, bytearray):
+        return ("bytearray", bytes(value))
+    return value
+
+
+def hash_key(args, kwargs):
+    if kwargs:
+        return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    return args
+
+
+def freeze_key(args, kwargs):
+    return hash_key(tuple(freeze(a) for a in args), {k: freeze(v) for k, v in kwargs.items()})
+
+
+def pickle_key(args, kwargs):
+    return pickle.dumps((args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def repr_key(args, kwargs):
+    return repr((args, sorted(kwargs.items())))
+
+
+KEY_STRATEGIES = {"hash": hash_key, "freeze": freeze_key, "pickle": pickle_key, "repr": repr_key}
+
+
+def _make_key_function(key):
+    if callable(key):
+        return key
+    try:
+        return KEY_STRATEGIES[key]
+    except KeyError:
+        raise ValueError(f"Unknown key strategy {key!r}, use one of {sorted(KEY_STRATEGIES)}") from None
+
+
+# ------------------------------------------
+# ✅ 2. The cache store (shared by the sync and async wrappers)
+# ------------------------------------------
+
+class CacheStore:
+    # OrderedDict keeps entries in "least recently used first" order:
+    # move_to_end() on every hit, popitem(last=False) to evict the oldest.
+
+    def __init__(self, maxsize=128, ttl=None, max_bytes=None, sizeof=sys.getsizeof):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.data = OrderedDict()          # key → (value, expires_at, nbytes)
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key, now):
+        entry = self.data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return _MISSING
+        value, expires_at, _ = entry
+        if expires_at is not None and now >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return _MISSING
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value, now):
+        if key in self.data:
+            self._remove(key)
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return                           # would never fit, don't evict everything for it
+        expires_at = now + self.ttl if self.ttl is not None else None
+        self.data[key] = (value, expires_at, nbytes)
+        self.nbytes += nbytes
+        while ((self.maxsize is not None and len(self.data) > self.maxsize)
+               or (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+            oldest = next(iter(self.data))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key):
+        _, _, nbytes = self.data.pop(key)
+        self.nbytes -= nbytes
+
+    def clear(self):
+        self.data.clear()
+        self.nbytes = 0
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self.data),
+            "bytes": self.nbytes,
+            "maxsize": self.maxsize,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+        }
+
+
+# ------------------------------------------
+# ✅ 3. The decorator
+# ------------------------------------------
+
+def memoize(function=None, *, maxsize=128, ttl=None, max_bytes=None,
+            key="hash", sizeof=sys.getsizeof, clock=time.monotonic):
+    # @memoize                                    → LRU with 128 entries
+    # @memoize(maxsize=None, ttl=60)              → unbounded, entries live 60 s
+    # @memoize(max_bytes=50_000_000, key="freeze") → ~50 MB, list/dict arguments allowed
+    make_key = _make_key_function(key)
+
+    def decorator(function):
+        store = CacheStore(maxsize, ttl, max_bytes, sizeof)
+        if asyncio.iscoroutinefunction(function):
+            wrapper = _async_wrapper(function, store, make_key, clock)
+        else:
+            wrapper = _sync_wrapper(function, store, make_key, clock)
+        wrapper.cache_info = store.info
+        wrapper.cache_store = store
+        return wrapper
+
+    if function is not None:
+        return decorator(function)
+    return decorator
+
+
+def _sync_wrapper(function, store, make_key, clock):
+    lock = threading.Lock()
+    in_flight = {}                      # key → [threading.Event, result, exception]
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        k = make_key(args, kwargs)
+        with lock:
+            value = store.get(k, clock())
+            if value is not _MISSING:
+                return value
+            call = in_flight.get(k)
+            leader = call is None
+            if leader:
+                call = in_flight[k] = [threading.Event(), None, None]
+
+        if not leader:
+            # Somebody else is already computing this key → wait for their answer
+            call[0].wait()
+            if call[2] is not None:
+                raise call[2]
+            return call[1]
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            call[2] = e                 # errors are shared with waiters but NOT cached
+            raise
+        else:
+            call[1] = result
+            with lock:
+                store.put(k, result, clock())
+            return result
+        finally:
+            with lock:
+                del in_flight[k]
+            call[0].set()
+
+    def cache_clear():
+        with lock:
+            store.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+def _async_wrapper(function, store, make_key, clock):
+    in_flight = {}                      # key → asyncio.Task (single event loop)
+
+    def finished(k, task):
+        # Runs before any awaiting caller resumes, so they find the value cached
+        if in_flight.get(k) is task:
+            del in_flight[k]
+        if not task.cancelled() and task.exception() is None:
+            store.put(k, task.result(), clock())     # errors are shared but NOT cached
+
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs):
+        k = make_key(args, kwargs)
+        value = store.get(k, clock())
+        if value is not _MISSING:
+            return value
+
+        task = in_flight.get(k)
+        if task is None:
+            # The computation is its own task, owned by no caller in particular
+            task = asyncio.ensure_future(function(*args, **kwargs))
+            in_flight[k] = task
+            task.add_done_callback(functools.partial(finished, k))
+        # shield(): cancelling one caller (the first one included) only stops
+        # that caller waiting; the others still get the shared result
+        return await asyncio.shield(task)
+
+    wrapper.cache_clear = store.clear
+    return wrapper
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+
+    @memoize(maxsize=2, key="freeze")
+    def ice_cream(flavor, toppings=()):
+        calls.append(flavor)
+        time.sleep(0.05)
+        return f"Here is you {flavor} ice-cream with {list(toppings)}!"
+
+    # Unhashable argument (a list) works thanks to key="freeze"
+    print(ice_cream("pista", toppings=["sprinkles"]))
+    print(ice_cream("pista", toppings=["sprinkles"]))     # cache hit
+
+    # Single-flight: 8 threads ask for "mango" at the same time → 1 real call
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: ice_cream("mango"), range(8)))
+    print(f"🍨 Real calls so far: {calls}")
+
+    ice_cream("vanilla")                                   # evicts the LRU entry
+    print(f"📊 {ice_cream.cache_info()}")
+
+    @memoize(ttl=0.1)
+    async def fetch(n):
+        await asyncio.sleep(0.05)
+        return n * n
+
+    async def main():
+        results = await asyncio.gather(*(fetch(3) for _ in range(5)))
+        await asyncio.sleep(0.15)                          # let the entry expire
+        await fetch(3)
+        return results
+
+    print(f"⚡ Async results: {asyncio.run(main())}, {fetch.cache_info()}")
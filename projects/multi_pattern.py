@@ -0,0 +1,324 @@
+# ==============================================================
+# 🔎 MULTI-PATTERN SEARCH & REPLACE (Aho–Corasick)
+# ==============================================================
+
+# lessons/46.string_methods.py searches for ONE pattern at a time:
+#     text.find("error")
+#     text.count("error")
+#     text.replace("colour", "color")
+# With 10,000 keywords that is 10,000 passes over the whole text, and chained
+# replace() calls can even rewrite each other's output ("cat" → "dog", then
+# "dog" → "wolf" turns every cat into a wolf).
+#
+# ✅ compile_patterns(patterns)
+#                          → an Aho–Corasick automaton: a trie of every pattern plus
+#                            "failure links", built once and cached (LRU), so the
+#                            same keyword tuple is never compiled twice
+# ✅ finditer / counts    → every occurrence of every pattern (overlaps included)
+#                            in ONE left-to-right pass
+# ✅ scanner()            → feed the text in chunks (files, sockets); matches that
+#                            straddle a chunk boundary are still found, with
+#                            absolute offsets
+# ✅ replace / replace_chunks
+#                          → all patterns replaced in ONE pass (leftmost-longest,
+#                            replacements are never re-scanned). The same trie is
+#                            turned into a nested regex so this pass runs in C
+#                            (a flat longest-first alternation when the trie is
+#                            too deep for re's recursive parser).
+
+import functools
+import re
+from collections import Counter, deque
+
+# finditer() scans huge strings in pieces of this many characters
+_CHUNK = 1 << 20
+# re parses and compiles nested groups recursively: past these limits regex()
+# uses a flat alternation instead of the nested trie pattern
+_MAX_TRIE_DEPTH = 256                 # longest pattern, in characters
+_MAX_NESTING = 100                    # nested (?:...) groups
+
+
+class Automaton:
+    #   ac = compile_patterns(("he", "she", "his", "hers"))    # a tuple: it's the cache key
+    #   ac = Automaton(any_iterable)    → uncached
+    #   list(ac.finditer("ushers"))     → [(1, 4, 'she'), (2, 4, 'he'), (2, 6, 'hers')]
+    #   ac.counts(text)                 → Counter({'he': 2, ...})
+    #   ac.replace(text, {"he": "HE"})  → one pass, leftmost-longest
+    #   scan = ac.scanner()
+    #   for chunk in chunks: for start, end, word in scan.feed(chunk): ...
+
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(patterns))     # unique, in order
+        if not self.patterns or not all(self.patterns):
+            raise ValueError("need at least one pattern, and no empty patterns")
+        self.lengths = [len(p) for p in self.patterns]
+        self.longest = max(self.lengths)
+
+        # 1. Trie: goto[state] maps a character to the next state; out[state] holds
+        #    the indices of the patterns that end there
+        goto = [{}]
+        out = [()]
+        ends = [False]                                  # a pattern ends exactly here
+        for index, word in enumerate(self.patterns):
+            state = 0
+            for ch in word:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                    ends.append(False)
+                state = nxt
+            out[state] = (index,)
+            ends[state] = True
+
+        # 2. Failure links, breadth-first: fail[s] is the longest proper suffix of
+        #    s's text that is also a path in the trie. A state also reports every
+        #    pattern its failure state reports ("she" contains "he").
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] += out[fail[nxt]]               # longest pattern first
+
+        self.goto = goto
+        self.fail = fail
+        self.out = out
+        self.ends = ends
+        self._regex = None
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __repr__(self):
+        return f"Automaton({len(self.patterns)} patterns, {len(self.goto)} states)"
+
+    # -- matching ------------------------------------------------------------------
+    def _scan(self, text, state, offset, found):
+        # Runs the automaton over text from `state`; appends (start, end, index)
+        # with offsets shifted by `offset`, and returns the state it ended in
+        goto, fail, out, lengths = self.goto, self.fail, self.out, self.lengths
+        append = found.append
+        for end, ch in enumerate(text, offset + 1):
+            while True:
+                nxt = goto[state].get(ch)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            if out[state]:
+                for index in out[state]:
+                    append((end - lengths[index], end, index))
+        return state
+
+    def finditer(self, text):
+        # (start, end, pattern) for every occurrence, ordered by end position
+        scan = self.scanner()
+        for i in range(0, len(text), _CHUNK):
+            yield from scan.feed(text[i:i + _CHUNK])
+
+    def findall(self, text):
+        return [word for _, _, word in self.finditer(text)]
+
+    def counts(self, text):
+        # Counter of pattern → occurrences (overlapping, like a find() loop)
+        found = []
+        state = 0
+        for i in range(0, len(text), _CHUNK):
+            state = self._scan(text[i:i + _CHUNK], state, i, found)
+        patterns = self.patterns
+        return Counter(patterns[index] for _, _, index in found)
+
+    def scanner(self):
+        return Scanner(self)
+
+    # -- replacing --------------------------------------------------------------------
+    def regex(self):
+        # The trie as one nested regex: "he", "hers", "his" → h(?:e(?:rs)?|is).
+        # Greedy optionals make it leftmost-LONGEST, like a single sorted scan.
+        if self._regex is None:
+            pattern = None
+            if self.longest <= _MAX_TRIE_DEPTH:
+                pattern, nesting = _trie_pattern(self.goto, self.ends)
+                if nesting > _MAX_NESTING:
+                    pattern = None
+            if pattern is None:
+                # Longest first: at any position the first alternative that
+                # matches is the longest pattern there, as with the trie
+                ordered = sorted(self.patterns, key=len, reverse=True)
+                pattern = "|".join(map(re.escape, ordered))
+            self._regex = re.compile(pattern)
+        return self._regex
+
+    def _replacer(self, new):
+        if callable(new):
+            return lambda m: new(m.group())
+        if isinstance(new, str):
+            return lambda m: new
+        get = new.get
+        return lambda m: get(m.group(), m.group())       # unmapped patterns stay
+
+    def replace(self, text, new):
+        # new: one string for every pattern, a {pattern: replacement} dict, or a
+        # function pattern → replacement
+        return self.regex().sub(self._replacer(new), text)
+
+    def replace_chunks(self, chunks, new):
+        # Streaming replace: yields output pieces. A match can only be decided once
+        # `longest` more characters are known, so that much text is held back.
+        regex = self.regex()
+        replacer = self._replacer(new)
+        hold = self.longest - 1
+        carry = ""
+        for chunk in chunks:
+            buf = carry + chunk
+            safe = len(buf) - hold                    # matches starting here are final
+            pieces = []
+            pos = 0
+            for m in regex.finditer(buf):
+                if m.start() >= safe:
+                    break
+                pieces.append(buf[pos:m.start()])
+                pieces.append(replacer(m))
+                pos = m.end()
+            cut = max(pos, safe)
+            pieces.append(buf[pos:cut])
+            carry = buf[cut:]
+            yield "".join(pieces)
+        yield regex.sub(replacer, carry)
+
+
+class Scanner:
+    # Incremental matcher: the automaton state and the absolute offset survive
+    # between feed() calls, so chunk boundaries don't matter.
+
+    def __init__(self, automaton):
+        self.automaton = automaton
+        self.state = 0
+        self.offset = 0
+
+    def feed(self, chunk):
+        found = []
+        self.state = self.automaton._scan(chunk, self.state, self.offset, found)
+        self.offset += len(chunk)
+        patterns = self.automaton.patterns
+        return [(start, end, patterns[index]) for start, end, index in found]
+
+    def reset(self):
+        self.state = 0
+        self.offset = 0
+
+
+def _trie_pattern(goto, ends):
+    # → (regex for the whole trie, deepest nesting of (?:...) groups).
+    # Built bottom-up without recursion: every state after all of its children.
+    order = [0]
+    for state in order:                               # breadth-first: parents first
+        order.extend(goto[state].values())
+    patterns = {}
+    nesting = {}
+    for state in reversed(order):
+        # Children start with distinct characters, so branch order doesn't matter
+        branches = []
+        leaves = []
+        depth = 0
+        for ch, nxt in goto[state].items():
+            if goto[nxt]:
+                branches.append(re.escape(ch) + patterns.pop(nxt))
+                depth = max(depth, nesting.pop(nxt))
+            else:
+                leaves.append(ch)                     # leaf: one character left
+        if len(leaves) == 1:
+            branches.append(re.escape(leaves[0]))
+        elif leaves:
+            branches.append("[" + "".join(map(_escape_in_class, leaves)) + "]")
+        if ends[state]:
+            patterns[state] = "(?:" + "|".join(branches) + ")?"     # a pattern may stop here
+            depth += 1
+        elif len(branches) == 1:
+            patterns[state] = branches[0]
+        else:
+            patterns[state] = "(?:" + "|".join(branches) + ")"
+            depth += 1
+        nesting[state] = depth
+    return patterns[0], nesting[0]
+
+
+def _escape_in_class(ch):
+    return "\\" + ch if ch in "\\]^-[" else ch
+
+
+@functools.lru_cache(maxsize=64)
+def compile_patterns(patterns):
+    # Same keyword tuple (in the same order) → the same, already built automaton.
+    # compile_patterns.cache_info() / .cache_clear() come from lru_cache.
+    return Automaton(patterns)
+
+
+if __name__ == "__main__":
+    import random
+    import string
+    import time
+
+    ac = compile_patterns(("he", "she", "his", "hers"))
+    print(f"🔎 {ac}: {list(ac.finditer('ushers'))}")
+    print(f"🧵 regex → {ac.regex().pattern}")
+    animals = compile_patterns(("cat", "dog"))
+    print(f"🐱 chained replace: {'cat dog'.replace('cat', 'dog').replace('dog', 'wolf')!r} vs "
+          f"one pass: {animals.replace('cat dog', {'cat': 'dog', 'dog': 'wolf'})!r}")
+
+    rng = random.Random(46)
+    keywords = tuple({"".join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 9)))
+                     for _ in range(10_000)})
+    filler = ["the", "request", "failed", "with", "status", "user", "and", "then", "retry"]
+    words = [rng.choice(keywords) if rng.random() < 0.1 else rng.choice(filler) for _ in range(200_000)]
+    text = " ".join(words)
+    print(f"\n{len(keywords):,} keywords, text of {len(text):,} characters")
+
+    t0 = time.perf_counter()
+    big = compile_patterns(keywords)
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    assert compile_patterns(keywords) is big
+    t_cached = time.perf_counter() - t0
+    print(f"🏗️ compile: {t_build:.2f}s first time, {t_cached * 1e6:.0f} µs from the cache ({big})")
+
+    def bench(label, slow, fast):
+        t0 = time.perf_counter()
+        a = slow()
+        t_slow = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        b = fast()
+        t_fast = time.perf_counter() - t0
+        print(f"⏱️ {label:<34} str {t_slow:6.2f}s vs automaton {t_fast:6.2f}s ({t_slow / t_fast:5.1f}x)")
+        return a, b
+
+    upper = {k: k.upper() for k in keywords}
+
+    def chained(text, mapping):
+        for old, new in mapping.items():
+            text = text.replace(old, new)
+        return text
+
+    a, b = bench("count each keyword", lambda: sum(text.count(k) for k in keywords),
+                 lambda: sum(big.counts(text).values()))
+    assert a == b
+    a, b = bench("replace every keyword", lambda: chained(text, upper), lambda: big.replace(text, upper))
+    assert a == b
+    chunks = [text[i:i + 65_536] for i in range(0, len(text), 65_536)]
+    assert "".join(big.replace_chunks(chunks, upper)) == b
+    print(f"🌊 replace_chunks over {len(chunks)} chunks of 64 KB gives the same text")
+
+    three = {"failed": "FAILED", "retry": "RETRY", "status": "STATUS"}
+    small = compile_patterns(tuple(three))
+    # With a handful of patterns, a few memchr-fast str.replace passes still win
+    bench("replace 3 keywords", lambda: chained(text, three), lambda: small.replace(text, three))
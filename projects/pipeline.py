@@ -0,0 +1,280 @@
+# ==============================================================
+# 🔗 LAZY GENERATOR PIPELINES (map / filter / batch / window / parallel_map)
+# ==============================================================
+
+# lessons/51.iterables.py shows chaining generators:
+#     def gen2():
+#         yield from gen1()
+#         yield from range(3, 6)
+# and lists "Pipeline processing: pass output of one generator to another"
+# as a reason to use generators.
+#
+# This module turns that idea into a reusable tool:
+#
+#     (Stream(read_lines("huge.log"))
+#         .map(str.strip)
+#         .filter(bool)
+#         .parallel_map(parse, workers=8)      # thread or process pool
+#         .batch(1000)
+#         .for_each(save_batch))
+#
+# ✅ lazy          → nothing runs until you iterate; every stage is a generator
+# ✅ constant memory → items flow one at a time, batch/window keep only N items,
+#                    parallel_map keeps at most `max_pending` tasks in flight (backpressure)
+# ✅ ordered or unordered parallel output
+# ✅ per-stage counters → items in/out and throughput (items/second) for each stage
+
+import itertools
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+
+# ------------------------------------------
+# ✅ 1. Per-stage counters
+# ------------------------------------------
+
+class StageStats:
+    def __init__(self, name):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.busy = 0.0               # seconds inside this stage's next(), upstream included
+        self.upstream = 0.0           # seconds of that spent waiting for the previous stage
+
+    @property
+    def seconds(self):
+        # time spent in THIS stage only (not upstream, not downstream)
+        return max(self.busy - self.upstream, 0.0)
+
+    @property
+    def throughput(self):
+        # items produced per second of the stage's own work
+        return self.items_out / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return (f"{self.name:<14} in={self.items_in:<10,} out={self.items_out:<10,} "
+                f"{self.seconds * 1e3:>9,.1f} ms {self.throughput:>14,.0f} items/s")
+
+
+def _counted_input(source, stats):
+    iterator = iter(source)
+    clock = time.perf_counter
+    while True:
+        t0 = clock()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            stats.upstream += clock() - t0
+        stats.items_in += 1
+        yield item
+
+
+def _counted_output(stage, stats):
+    # Times each next() of the stage; while suspended at `yield` the downstream
+    # stages run, and that time is not counted
+    iterator = iter(stage)
+    clock = time.perf_counter
+    while True:
+        t0 = clock()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            stats.busy += clock() - t0
+        stats.items_out += 1
+        yield item
+
+
+# ------------------------------------------
+# ✅ 2. Stage implementations (plain generator functions)
+# ------------------------------------------
+
+def _map(source, function):
+    for item in source:
+        yield function(item)
+
+
+def _filter(source, predicate):
+    for item in source:
+        if predicate(item):
+            yield item
+
+
+def _flat_map(source, function):
+    for item in source:
+        yield from function(item)
+
+
+def _batch(source, size):
+    iterator = iter(source)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _window(source, size, step):
+    # Windows start at items 0, step, 2*step, ...: the deque keeps the last
+    # `size` items; with step > size the items between windows are skipped
+    window = deque(maxlen=size)
+    need = size                   # items to add before the next window is full
+    skip = 0
+    for item in source:
+        if skip:
+            skip -= 1
+            continue
+        window.append(item)
+        need -= 1
+        if need == 0:
+            yield tuple(window)
+            if step >= size:
+                window.clear()
+                need, skip = size, step - size
+            else:
+                need = step
+
+
+def _parallel_map(source, function, executor, max_pending, ordered):
+    iterator = iter(source)
+    if ordered:
+        # FIFO of futures: results come out in input order
+        futures = deque()
+        for item in iterator:
+            futures.append(executor.submit(function, item))
+            if len(futures) >= max_pending:          # backpressure: wait before reading more
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+    else:
+        # Set of futures: whichever finishes first is yielded first
+        pending = set()
+        for item in iterator:
+            pending.add(executor.submit(function, item))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+# ------------------------------------------
+# ✅ 3. The fluent Stream wrapper
+# ------------------------------------------
+
+class Stream:
+    def __init__(self, source, stages=None):
+        self.source = source
+        self.stages = stages or []        # list of StageStats, in order
+
+    def _then(self, name, make_stage):
+        stats = StageStats(name)
+        stage = _counted_output(make_stage(_counted_input(self.source, stats)), stats)
+        return Stream(stage, self.stages + [stats])
+
+    def map(self, function):
+        return self._then("map", lambda src: _map(src, function))
+
+    def filter(self, predicate):
+        return self._then("filter", lambda src: _filter(src, predicate))
+
+    def flat_map(self, function):
+        return self._then("flat_map", lambda src: _flat_map(src, function))
+
+    def batch(self, size):
+        if size < 1:
+            raise ValueError("batch size must be >= 1")
+        return self._then(f"batch({size})", lambda src: _batch(src, size))
+
+    def window(self, size, step=1):
+        if size < 1 or step < 1:
+            raise ValueError("window size and step must be >= 1")
+        return self._then(f"window({size})", lambda src: _window(src, size, step))
+
+    def parallel_map(self, function, workers=4, ordered=True, processes=False, max_pending=None):
+        # processes=True → ProcessPoolExecutor (CPU-bound work, function must be picklable)
+        # processes=False → ThreadPoolExecutor (I/O-bound work)
+        max_pending = max_pending or workers * 4
+
+        def stage(src):
+            pool_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+            with pool_class(max_workers=workers) as executor:
+                yield from _parallel_map(src, function, executor, max_pending, ordered)
+
+        kind = "process" if processes else "thread"
+        return self._then(f"pmap[{kind}x{workers}]", stage)
+
+    def take(self, n):
+        return self._then(f"take({n})", lambda src: itertools.islice(src, n))
+
+    # -- terminal operations ------------------------------------------------
+    def __iter__(self):
+        return iter(self.source)
+
+    def for_each(self, function):
+        for item in self.source:
+            function(item)
+
+    def to_list(self):
+        return list(self.source)
+
+    def reduce(self, function, initial):
+        result = initial
+        for item in self.source:
+            result = function(result, item)
+        return result
+
+    def stats(self):
+        return self.stages
+
+    def report(self):
+        return "\n".join(repr(s) for s in self.stages)
+
+
+def _square(x):
+    return x * x
+
+
+if __name__ == "__main__":
+    import tracemalloc
+
+    # Unbounded source (itertools.count never ends) processed in constant memory
+    tracemalloc.start()
+    pipeline = (
+        Stream(itertools.count())
+        .filter(lambda x: x % 3 == 0)
+        .map(lambda x: x * 2)
+        .window(5)
+        .map(sum)
+        .batch(1000)
+        .take(1000)                      # stop after 1,000 batches = 1,000,000 windows
+    )
+    total = pipeline.reduce(lambda acc, chunk: acc + len(chunk), 0)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"✅ processed {total:,} windows, peak memory {peak / 1024:.0f} KiB")
+    print(pipeline.report())
+
+    # Parallel map with backpressure, ordered and unordered
+    def slow_square(x):
+        time.sleep(0.001)
+        return x * x
+
+    for ordered in (True, False):
+        t0 = time.perf_counter()
+        s = Stream(range(2000)).parallel_map(slow_square, workers=16, ordered=ordered)
+        out = s.to_list()
+        print(f"\n⚙️ parallel_map ordered={ordered}: {time.perf_counter() - t0:.2f}s, "
+              f"in order? {out == sorted(out)}")
+        print(s.report())
+
+    s = Stream(range(200_000)).parallel_map(_square, workers=4, processes=True, max_pending=64)
+    print(f"\n🧮 process pool sum = {sum(s):,}")
+    print(s.report())
@@ -0,0 +1,387 @@
+# ==============================================================
+# 🐾 CACHED, POOLED PokeAPI CLIENT
+# ==============================================================
+
+# lessons/45.API_requesting.py does:
+#     response = requests.get(url)
+# once per Pokémon. Every call:
+# - opens a NEW TCP/TLS connection (slow handshake every time)
+# - has NO timeout (can hang forever)
+# - has NO cache (asking for "pikachu" twice downloads it twice)
+#
+# This client fixes all three:
+# ✅ requests.Session + HTTPAdapter → keeps connections alive in a pool
+# ✅ timeout on every request
+# ✅ two-tier cache: in-memory LRU (bounded) → on-disk SQLite
+# ✅ single-flight: threads missing the same URL at once share ONE request
+# ✅ HTTP semantics: Cache-Control max-age / no-store, ETag, Last-Modified
+# ✅ conditional requests: stale entries are revalidated with
+#    If-None-Match / If-Modified-Since, a "304 Not Modified" reply costs no body
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import requests  # Third-party module. Install via: pip install requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "https://pokeapi.co/api/v2/"
+
+
+# ------------------------------------------
+# ✅ 1. Cache entry + Cache-Control parsing
+# ------------------------------------------
+
+class CacheEntry:
+    __slots__ = ("url", "body", "etag", "last_modified", "expires_at")
+
+    def __init__(self, url, body, etag=None, last_modified=None, expires_at=0.0):
+        self.url = url
+        self.body = body                    # decoded JSON text (str)
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at        # time.time() after which we must revalidate
+
+    def is_fresh(self, now=None):
+        return (now or time.time()) < self.expires_at
+
+    def json(self):
+        return json.loads(self.body)
+
+
+def parse_cache_control(header):
+    # "public, max-age=86400, s-maxage=86400" → {"public": True, "max-age": "86400", ...}
+    directives = {}
+    for part in (header or "").split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        if "=" in part:
+            key, value = part.split("=", 1)
+            directives[key.strip()] = value.strip().strip('"')
+        else:
+            directives[part] = True
+    return directives
+
+
+def freshness_lifetime(headers, default_ttl):
+    # How many seconds a response may be reused WITHOUT asking the server.
+    # Returns None when the response must not be stored at all.
+    directives = parse_cache_control(headers.get("Cache-Control"))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0                            # store, but always revalidate
+    if "max-age" in directives:
+        try:
+            return min(int(directives["max-age"]), default_ttl)
+        except ValueError:
+            pass
+    return default_ttl
+
+
+# ------------------------------------------
+# ✅ 2. Disk tier (SQLite)
+# ------------------------------------------
+
+class SQLiteCache:
+    # One table, one row per URL. A lock makes it safe to share between threads
+    # (sqlite3 connections are opened with check_same_thread=False).
+
+    def __init__(self, path="pokeapi_cache.sqlite3"):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY,"
+            " body TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " expires_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    def get(self, url):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT url, body, etag, last_modified, expires_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def put(self, entry):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (entry.url, entry.body, entry.etag, entry.last_modified, entry.expires_at),
+            )
+            self.conn.commit()
+
+    def delete(self, url):
+        with self.lock:
+            self.conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+# ------------------------------------------
+# ✅ 3. The client
+# ------------------------------------------
+
+class PokeAPIClient:
+    #   client = PokeAPIClient(ttl=3600)
+    #   data = client.pokemon("pikachu")   # network (or disk cache)
+    #   data = client.pokemon("pikachu")   # memory cache, no network
+    #   client.stats → {"memory_hits": 1, "network": 1, ...}
+
+    def __init__(self, base_url=BASE_URL, ttl=24 * 3600, timeout=10, pool_size=10,
+                 cache_path="pokeapi_cache.sqlite3", session=None, memory_size=1024):
+        self.base_url = base_url
+        self.ttl = ttl
+        self.timeout = timeout
+
+        # One Session = one connection pool shared by every request. A session
+        # passed in by the caller is used as is (its adapters, retries and
+        # headers are the caller's business) and is not closed by close().
+        self._own_session = session is None
+        if self._own_session:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+        self.memory = OrderedDict()                         # url → CacheEntry, LRU order
+        self.memory_size = memory_size
+        self.disk = SQLiteCache(cache_path) if cache_path else None
+        self.lock = threading.Lock()
+        self.in_flight = {}                                 # url → [Event, result, exception]
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "revalidated": 0, "network": 0,
+                      "shared": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._own_session:
+            self.session.close()
+        if self.disk:
+            self.disk.close()
+
+    def _count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def _remember(self, entry):
+        # Memory tier: most recently used last, oldest evicted beyond memory_size
+        with self.lock:
+            self.memory[entry.url] = entry
+            self.memory.move_to_end(entry.url)
+            while len(self.memory) > self.memory_size:
+                self.memory.popitem(last=False)
+
+    def _lookup(self, url):
+        # Returns (entry, tier) where tier is "memory_hits" or "disk_hits"
+        with self.lock:
+            entry = self.memory.get(url)
+            if entry is not None:
+                self.memory.move_to_end(url)
+                return entry, "memory_hits"
+        if self.disk:
+            entry = self.disk.get(url)
+            if entry is not None:
+                self._remember(entry)                        # promote to memory tier
+        return entry, "disk_hits"
+
+    def _store(self, entry):
+        self._remember(entry)
+        if self.disk:
+            self.disk.put(entry)
+
+    def _forget(self, url):
+        with self.lock:
+            self.memory.pop(url, None)
+        if self.disk:
+            self.disk.delete(url)
+
+    def get_json(self, path):
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+        cached, tier = self._lookup(url)
+
+        # Fresh → no network at all
+        if cached is not None and cached.is_fresh():
+            self._count(tier)
+            return cached.json()
+
+        # Miss or stale: only one thread per URL goes to the network, the
+        # others wait for its answer (same scheme as projects/memoize.py)
+        with self.lock:
+            call = self.in_flight.get(url)
+            leader = call is None
+            if leader:
+                call = self.in_flight[url] = [threading.Event(), None, None]
+        if not leader:
+            call[0].wait()
+            self._count("shared")
+            if call[2] is not None:
+                raise call[2]
+            return json.loads(call[1])
+
+        try:
+            # The previous leader may have refreshed it while we looked it up
+            cached, tier = self._lookup(url)
+            if cached is not None and cached.is_fresh():
+                self._count(tier)
+                call[1] = cached.body
+            else:
+                call[1] = self._fetch(url, cached)
+        except BaseException as e:
+            call[2] = e
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[url]
+            call[0].set()
+        return json.loads(call[1])
+
+    def _fetch(self, url, cached):
+        # One network round trip, returns the JSON text.
+        # Stale → conditional request (validators from the old response)
+        headers = {"Accept": "application/json"}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        self._count("network")
+
+        if response.status_code == 304:
+            if cached is None:
+                # Nothing here to revalidate: ask again without conditions
+                # rather than storing the 304's empty body
+                response = self.session.get(url, headers={"Accept": "application/json"},
+                                            timeout=self.timeout)
+                self._count("network")
+                if response.status_code == 304:
+                    raise requests.HTTPError(f"304 Not Modified for an unconditional request: {url}",
+                                             response=response)
+            else:
+                self._count("revalidated")
+                lifetime = freshness_lifetime(response.headers, self.ttl)
+                if lifetime is None:
+                    self._forget(url)            # no-store: use the body once, keep nothing
+                else:
+                    cached.expires_at = time.time() + lifetime
+                    cached.etag = response.headers.get("ETag", cached.etag)
+                    cached.last_modified = response.headers.get("Last-Modified", cached.last_modified)
+                    self._store(cached)
+                return cached.body
+
+        response.raise_for_status()          # same best practice as the lesson
+        lifetime = freshness_lifetime(response.headers, self.ttl)
+        if lifetime is None:
+            self._forget(url)
+        else:
+            self._store(CacheEntry(
+                url,
+                response.text,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                expires_at=time.time() + lifetime,
+            ))
+        return response.text
+
+    def pokemon(self, name_or_id):
+        return self.get_json(f"pokemon/{str(name_or_id).strip().lower()}")
+
+    def invalidate(self, path):
+        self._forget(path if path.startswith("http") else f"{self.base_url}{path}")
+
+
+def _offline_checks():
+    # Exercise the cache rules against the local stub server (no internet)
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+    from stub_http_server import StubPokeServer
+
+    with StubPokeServer(count=50, latency=0.05, cache_control="max-age=1", etags=True) as server:
+        with PokeAPIClient(server.base_url, ttl=3600, cache_path=None, memory_size=8) as client:
+            # 1. 16 threads miss the same URL at once → one request
+            with ThreadPoolExecutor(16) as pool:
+                names = set(d["name"] for d in pool.map(lambda _: client.pokemon(7), range(16)))
+            assert names == {"pokemon-7"} and server.hits == 1, server.hits
+            print(f"🧵 16 concurrent misses → {server.hits} request ({client.stats['shared']} shared)")
+
+            # 2. Within max-age: at most one request per URL
+            for _ in range(100):
+                client.pokemon(7)
+            assert server.hits == 1
+            # 3. After max-age: one conditional request, answered 304
+            time.sleep(1.1)
+            client.pokemon(7)
+            assert server.hits == 2 and client.stats["revalidated"] == 1
+            print("♻️ 100 reads within max-age → 0 requests; after expiry → 1 revalidation (304)")
+
+            # 3b. A 304 that says no-store: the body is used once, nothing is kept
+            server.cache_control = "no-store"
+            time.sleep(1.1)
+            assert client.pokemon(7)["name"] == "pokemon-7" and client.stats["revalidated"] == 2
+            assert f"{server.base_url}pokemon/7" not in client.memory
+            server.cache_control = "max-age=1"
+
+            # 4. The memory tier never grows past memory_size
+            for i in range(1, 21):
+                client.pokemon(i)
+            assert len(client.memory) == 8
+            print(f"📦 20 Pokémon cached in memory_size=8 → {len(client.memory)} entries kept")
+
+            # 5. A caller's session keeps its own adapters
+            session = requests.Session()
+            adapter = HTTPAdapter(max_retries=3)
+            session.mount("http://", adapter)
+            with PokeAPIClient(server.base_url, cache_path=None, session=session) as other:
+                other.pokemon(1)
+            assert session.get_adapter(server.base_url) is adapter
+            session.get(server.base_url + "pokemon/2").raise_for_status()    # still open
+            session.close()
+            print(f"🔌 caller session left untouched; stats {client.stats}")
+    return sys.stdin.isatty()
+
+
+if __name__ == "__main__":
+    if not _offline_checks():
+        raise SystemExit                  # not interactive: skip the live lookup
+
+    pokemon_name = input("Enter Pokémon name: ").strip().lower()
+
+    with PokeAPIClient(ttl=3600) as client:
+        try:
+            data = client.pokemon(pokemon_name)
+            print("\n========= Pokémon Info =========")
+            print(f"Name       : {data['name']}")
+            print(f"ID         : {data['id']}")
+            print(f"Height     : {data['height']} decimetres")
+            print(f"Weight     : {data['weight']} hectograms")
+
+            # Second lookup is served from the cache
+            t0 = time.perf_counter()
+            client.pokemon(pokemon_name)
+            print(f"\n⚡ Cached lookup took {(time.perf_counter() - t0) * 1000:.3f} ms")
+        except requests.exceptions.HTTPError as e:
+            print(f"🛑 HTTP error occurred: {e}")
+        except requests.exceptions.Timeout:
+            print("⏱️ Timeout error! The server took too long to respond.")
+        except requests.exceptions.RequestException as e:
+            print(f"❗ General error: {e}")
+
+        print(f"📊 Cache stats: {client.stats}")
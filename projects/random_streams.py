@@ -0,0 +1,247 @@
+# ==============================================================
+# 🎲 RANDOM STREAMS: seeded per-worker generators + batch draws
+# ==============================================================
+
+# lessons/21.random_numbers.py draws one value at a time from the module-level
+# generator that every thread shares:
+#     number = random.randint(1, 30)
+#     random.choice(l)
+#     random.shuffle(cards)
+#
+# - results depend on who else called random.* in between (not reproducible
+#   once threads or processes join in)
+# - randint/choice run ~10 lines of Python per value (~300 ns each)
+#
+# ✅ RandomStream(seed, stream_id)  → an independent generator per worker, derived
+#    from (seed, stream_id) by hashing: same ids → same numbers, in any thread,
+#    process or machine, whatever the scheduling
+# ✅ batch draws into typed arrays (millions per call):
+#    floats   → starmap(rng.random, ...) — the C function called from a C loop
+#    integers → random BYTES + bytes.translate for small ranges, getrandbits()
+#               batches + rejection for large ones (all unbiased)
+# ✅ AliasTable → weighted sampling in O(1) per draw (Vose's alias method)
+# ✅ shuffle(array) → in-place Fisher–Yates with the random indices drawn in batches
+
+import hashlib
+import math
+import operator
+import random
+from array import array
+from itertools import compress, repeat, starmap
+
+# Bytes-at-a-time integer path for ranges up to this size
+_BYTE_RANGE = 256
+# Draw at most this many values per internal batch (bounds temporary memory)
+_CHUNK = 1 << 20
+
+
+def derive_seed(*key):
+    # (root_seed, stream_id, ...) → 256-bit seed; different keys give unrelated streams
+    text = ":".join(map(repr, key)).encode()
+    return int.from_bytes(hashlib.blake2b(text, digest_size=32).digest(), "big")
+
+
+class RandomStream:
+    #   rng = RandomStream(seed=42, stream_id=3)     # e.g. one per worker
+    #   rng.integers(1, 30, 10_000_000)              → array('q')
+    #   rng.floats(10_000_000)                       → array('d')
+    #   rng.choice(["rock", "paper", "scissors"], 5)
+    #   rng.shuffle(cards)                           # in place
+    #   workers = RandomStream(42).spawn(8)          # 8 independent child streams
+
+    def __init__(self, seed=None, stream_id=0, _key=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(128)
+        self.key = _key or (seed, stream_id)
+        self.rng = random.Random(derive_seed(*self.key))
+
+    def spawn(self, n):
+        # n child streams, independent of each other and of this one
+        return [RandomStream(_key=self.key + (i,)) for i in range(n)]
+
+    def __repr__(self):
+        return f"RandomStream(key={self.key!r})"
+
+    # -- single values (same API as the random module) ----------------------------
+    def random(self):
+        return self.rng.random()
+
+    def randint(self, a, b):
+        return self.rng.randint(a, b)
+
+    # -- batches -----------------------------------------------------------------------
+    def floats(self, n, low=0.0, high=1.0):
+        # n floats in [low, high) → array('d'); the 0..1 draws are exactly the
+        # values self.rng.random() would have returned one by one
+        out = array("d", starmap(self.rng.random, repeat((), n)))
+        if (low, high) != (0.0, 1.0):
+            out = array("d", map(operator.add, map(operator.mul, out, repeat(high - low)), repeat(low)))
+        return out
+
+    def integers(self, low, high, n, typecode="q"):
+        # n ints in [low, high] (both inclusive, like randint) → array(typecode)
+        span = high - low + 1
+        if span <= 0:
+            raise ValueError("high must be >= low")
+        out = array(typecode)
+        while len(out) < n:
+            need = min(n - len(out), _CHUNK)
+            if span <= _BYTE_RANGE:
+                out.extend(self._small_integers(low, span, need))
+            else:
+                out.extend(self._large_integers(low, span, need))
+        return out
+
+    def _small_integers(self, low, span, n):
+        # Random bytes; bytes ≥ the largest multiple of span are deleted (rejection,
+        # keeps it unbiased), the rest are mapped b → b % span by a translate table
+        limit = _BYTE_RANGE - _BYTE_RANGE % span
+        reject = bytes(range(limit, 256))
+        table = bytes(b % span for b in range(256))
+        kept = b""
+        while len(kept) < n:
+            extra = (n - len(kept)) * 256 // limit + 16
+            kept += self.rng.randbytes(extra).translate(None, reject)
+        values = kept[:n].translate(table)
+        return values if low == 0 else map(operator.add, values, repeat(low))
+
+    def _large_integers(self, low, span, n):
+        # getrandbits(k) called from a C loop; values ≥ span are rejected (< 50%)
+        bits = (span - 1).bit_length()
+        out = []
+        while len(out) < n:
+            draw = list(starmap(self.rng.getrandbits, repeat((bits,), (n - len(out)) * 2)))
+            out.extend(compress(draw, map(operator.lt, draw, repeat(span))))
+        del out[n:]
+        return out if low == 0 else map(operator.add, out, repeat(low))
+
+    def choice(self, population, n):
+        # n picks with replacement → list
+        picks = self.integers(0, len(population) - 1, n)
+        return list(map(population.__getitem__, picks))
+
+    def shuffle(self, seq):
+        # In-place Fisher–Yates: position i swaps with j = floor(u * (i + 1)).
+        # The j's are computed in batches; only the swaps run as a Python loop.
+        n = len(seq)
+        i = n - 1
+        while i > 0:
+            count = min(i, _CHUNK)
+            sizes = range(i + 1, i + 1 - count, -1)
+            js = map(int, map(operator.mul, starmap(self.rng.random, repeat((), count)), sizes))
+            for pos, j in zip(range(i, i - count, -1), js):
+                seq[pos], seq[j] = seq[j], seq[pos]
+            i -= count
+        return seq
+
+
+def streams(seed, n):
+    # One independent stream per worker: streams(42, 8)[k] is the same on every run
+    return [RandomStream(seed, i) for i in range(n)]
+
+
+# ------------------------------------------
+# ✅ Weighted sampling: Vose's alias method
+# ------------------------------------------
+
+class AliasTable:
+    # Build once in O(k), then every draw is one uniform column + one coin flip:
+    #   table = AliasTable(["rock", "paper", "scissors"], [5, 3, 2])
+    #   table.sample(rng, 1_000_000)
+
+    def __init__(self, population, weights):
+        k = len(weights)
+        if k == 0 or len(population) != k:
+            raise ValueError("need one weight per item (at least one item)")
+        total = math.fsum(weights)
+        if total <= 0 or min(weights) < 0:
+            raise ValueError("weights must be non-negative and not all zero")
+        scaled = [w * k / total for w in weights]
+        prob = array("d", repeat(1.0, k))
+        alias = array("q", range(k))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+        # leftovers are 1.0 up to rounding
+        self.population = list(population)
+        self.prob = prob
+        self.alias = alias
+        # column i → (what a failed coin gives, what a kept coin gives); the coin
+        # (False/True) then indexes the pair directly
+        self._index_pairs = [(alias[i], i) for i in range(k)]
+        self._item_pairs = [(self.population[alias[i]], self.population[i]) for i in range(k)]
+
+    def _draw(self, stream, n, pairs):
+        columns = stream.integers(0, len(self.prob) - 1, n)
+        keep = map(operator.lt, stream.floats(n), map(self.prob.__getitem__, columns))
+        return map(operator.getitem, map(pairs.__getitem__, columns), keep)
+
+    def sample_indices(self, stream, n):
+        return array("q", self._draw(stream, n, self._index_pairs))
+
+    def sample(self, stream, n):
+        return list(self._draw(stream, n, self._item_pairs))
+
+
+def _worker_sum(seed, stream_id, n):
+    # Module-level so ProcessPoolExecutor can pickle it
+    return sum(RandomStream(seed, stream_id).integers(1, 30, n))
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from collections import Counter
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000     # pass 10000000 for 10M per call
+
+    # Reproducibility: same (seed, stream id) → same numbers, whatever runs them
+    serial = [_worker_sum(42, i, 100_000) for i in range(4)]
+    with ThreadPoolExecutor(4) as pool:
+        threaded = list(pool.map(_worker_sum, repeat(42), range(4), repeat(100_000)))
+    with ProcessPoolExecutor(4) as pool:
+        processes = list(pool.map(_worker_sum, repeat(42), range(4), repeat(100_000)))
+    assert serial == threaded == processes
+    print(f"🔁 4 workers, serial = threads = processes: {serial}")
+
+    rng = RandomStream(seed=1)
+    stdlib = random.Random(1)
+
+    def bench(label, slow, fast):
+        t0 = time.perf_counter()
+        slow()
+        t_slow = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        fast()
+        t_fast = time.perf_counter() - t0
+        print(f"⏱️ {label:<24} stdlib {t_slow:5.2f}s vs stream {t_fast:5.2f}s ({t_slow / t_fast:4.1f}x)")
+
+    print(f"\n{n:,} values per call:")
+    bench("randint(1, 30)", lambda: [stdlib.randint(1, 30) for _ in range(n)],
+          lambda: rng.integers(1, 30, n))
+    bench("randint(0, 10**6)", lambda: [stdlib.randint(0, 10 ** 6) for _ in range(n)],
+          lambda: rng.integers(0, 10 ** 6, n))
+    bench("random()", lambda: [stdlib.random() for _ in range(n)], lambda: rng.floats(n))
+    hands = ["rock", "paper", "scissors"]
+    bench("choice(l)", lambda: [stdlib.choice(hands) for _ in range(n)], lambda: rng.choice(hands, n))
+    table = AliasTable(hands, [5, 3, 2])
+    # With 3 weights choices()' bisect is already cheap; the alias table pays off
+    # when there are many categories (O(1) per draw vs O(log k))
+    bench("choices(3 weights)", lambda: stdlib.choices(hands, [5, 3, 2], k=n),
+          lambda: table.sample(rng, n))
+    many = list(range(100_000))
+    weights = [stdlib.random() for _ in many]
+    big_table = AliasTable(many, weights)
+    bench("choices(100k weights)", lambda: stdlib.choices(many, weights, k=n),
+          lambda: big_table.sample(rng, n))
+    cards = array("q", range(n))
+    bench("shuffle (array)", lambda: stdlib.shuffle(cards), lambda: rng.shuffle(cards))
+    print(f"\n🎯 weighted check: {Counter(table.sample(rng, 100_000))}")
+    ints = rng.integers(1, 30, n)
+    print(f"📊 integers(1, 30): min {min(ints)}, max {max(ints)}, mean {sum(ints) / n:.3f} (expected 15.5)")
@@ -0,0 +1,281 @@
+# ==============================================================
+# 📐 RECTANGLES: numeric accessors, cached area, bulk RectangleArray
+# ==============================================================
+
+# lessons/42.property-decorator.py returns formatted STRINGS from its getters:
+#     @property
+#     def area(self):
+#         return f"{self._width * self._height:.2f} sq. cm"
+#
+# Nice for printing, painful for math: summing areas means parsing "32.40 sq. cm"
+# back into a float, and the area is recomputed + reformatted on every access.
+#
+# ✅ Rectangle       → same width/height/area strings as the lesson, plus raw
+#                      numbers: width_cm, height_cm, area_sq_cm
+# ✅ cached area     → computed once, invalidated by the width/height setters
+#                      and deleters (the only places the dimensions change)
+# ✅ RectangleArray  → millions of rectangles as two array('d') columns;
+#                      validation runs over the whole column in one C-level pass
+#                      (all(map(operator.gt, ...))) instead of a setter call each
+
+import math
+import operator
+from array import array
+from itertools import compress, repeat
+
+
+def _check_dimension(name, value):
+    # Same rule as the lesson's setters (NaN is rejected too: NaN <= 0 is False)
+    if not value > 0:
+        raise ValueError(f"{name} must be a positive number.")
+    return value
+
+
+# ------------------------------------------
+# ✅ 1. Rectangle with numeric accessors + cached area
+# ------------------------------------------
+
+class Rectangle:
+    __slots__ = ("_width", "_height", "_area")
+
+    def __init__(self, width, height):
+        self._width = _check_dimension("Width", width)
+        self._height = _check_dimension("Height", height)
+        self._area = None                     # cache, filled on first access
+
+    # -- raw numbers ---------------------------------------------------------
+    @property
+    def width_cm(self):
+        return self._width
+
+    @width_cm.setter
+    def width_cm(self, value):
+        self._width = _check_dimension("Width", value)
+        self._area = None                     # invalidate the cached area
+
+    @width_cm.deleter
+    def width_cm(self):
+        self._width = None
+        self._area = None
+
+    @property
+    def height_cm(self):
+        return self._height
+
+    @height_cm.setter
+    def height_cm(self, value):
+        self._height = _check_dimension("Height", value)
+        self._area = None
+
+    @height_cm.deleter
+    def height_cm(self):
+        self._height = None
+        self._area = None
+
+    @property
+    def area_sq_cm(self):
+        # None while a dimension is deleted
+        area = self._area
+        if area is None and self._width is not None and self._height is not None:
+            area = self._area = self._width * self._height
+        return area
+
+    # -- the lesson's formatted properties (built on the numeric ones) ---------
+    @property
+    def width(self):
+        return f"{self._width:.2f} cm" if self._width is not None else "not set"
+
+    @width.setter
+    def width(self, value):
+        self.width_cm = value
+
+    @width.deleter
+    def width(self):
+        print("⚠️ Width deleted!")
+        del self.width_cm
+
+    @property
+    def height(self):
+        return f"{self._height:.2f} cm" if self._height is not None else "not set"
+
+    @height.setter
+    def height(self, value):
+        self.height_cm = value
+
+    @height.deleter
+    def height(self):
+        print("⚠️ Height deleted!")
+        del self.height_cm
+
+    @property
+    def area(self):
+        area = self.area_sq_cm
+        if area is None:
+            return "Dimensions are not fully set."
+        return f"{area:.2f} sq. cm"
+
+    def __repr__(self):
+        return f"Rectangle({self._width!r}, {self._height!r})"
+
+
+# ------------------------------------------
+# ✅ 2. Bulk rectangles
+# ------------------------------------------
+
+def _as_column(values):
+    # Always a private copy: the caller's array can't change our columns behind
+    # the validation and the cached areas
+    return array("d", values)
+
+
+def _validate_column(name, column):
+    # One pass in C; only on failure do we go back to find the first bad index
+    if not all(map(operator.gt, column, repeat(0.0))):
+        bad = next(compress(range(len(column)), map(operator.not_, map(operator.gt, column, repeat(0.0)))))
+        raise ValueError(f"{name} must be a positive number (index {bad}: {column[bad]!r}).")
+
+
+class RectangleArray:
+    #   rects = RectangleArray(widths, heights)     # validated in bulk
+    #   rects.areas()                               → read-only memoryview, cached
+    #   rects.set_widths(new_widths)                # validated in bulk, cache invalidated
+    #   rects.widths, rects.heights                 → read-only memoryviews of the columns
+    #   rects[3]                                    → Rectangle
+    #   rects[3] = Rectangle(2, 5)
+
+    __slots__ = ("_widths", "_heights", "_areas")
+
+    def __init__(self, widths=(), heights=()):
+        widths, heights = _as_column(widths), _as_column(heights)
+        if len(widths) != len(heights):
+            raise ValueError("widths and heights must have the same length")
+        _validate_column("Width", widths)
+        _validate_column("Height", heights)
+        self._widths = widths
+        self._heights = heights
+        self._areas = None
+
+    @classmethod
+    def _wrap(cls, widths, heights):
+        # Columns that are already private and validated (slices, scale())
+        rects = cls.__new__(cls)
+        rects._widths, rects._heights, rects._areas = widths, heights, None
+        return rects
+
+    # Read-only views: writes must go through set_widths()/set_heights()/[i] = ...,
+    # which validate and invalidate the cached areas
+    @property
+    def widths(self):
+        return memoryview(self._widths).toreadonly()
+
+    @property
+    def heights(self):
+        return memoryview(self._heights).toreadonly()
+
+    @classmethod
+    def from_rectangles(cls, rectangles):
+        widths, heights = array("d"), array("d")
+        for r in rectangles:
+            widths.append(r.width_cm)
+            heights.append(r.height_cm)
+        return cls(widths, heights)
+
+    def __len__(self):
+        return len(self._widths)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._wrap(self._widths[index], self._heights[index])
+        return Rectangle(self._widths[index], self._heights[index])
+
+    def __setitem__(self, index, rect):
+        width = _check_dimension("Width", rect.width_cm)
+        height = _check_dimension("Height", rect.height_cm)
+        self._widths[index] = width
+        self._heights[index] = height
+        self._areas = None
+
+    def __iter__(self):
+        return map(Rectangle, self._widths, self._heights)
+
+    # -- bulk setters ------------------------------------------------------------
+    def set_widths(self, widths):
+        widths = _as_column(widths)
+        if len(widths) != len(self):
+            raise ValueError("expected one width per rectangle")
+        _validate_column("Width", widths)
+        self._widths = widths
+        self._areas = None
+
+    def set_heights(self, heights):
+        heights = _as_column(heights)
+        if len(heights) != len(self):
+            raise ValueError("expected one height per rectangle")
+        _validate_column("Height", heights)
+        self._heights = heights
+        self._areas = None
+
+    def scale(self, factor):
+        # Multiply every dimension by `factor` (must be positive)
+        _check_dimension("Scale factor", factor)
+        self._widths = array("d", map(operator.mul, self._widths, repeat(factor)))
+        self._heights = array("d", map(operator.mul, self._heights, repeat(factor)))
+        self._areas = None
+
+    # -- computed columns ----------------------------------------------------------
+    def _area_column(self):
+        if self._areas is None:
+            self._areas = array("d", map(operator.mul, self._widths, self._heights))
+        return self._areas
+
+    def areas(self):
+        # Read-only view of the cached column, like widths/heights
+        return memoryview(self._area_column()).toreadonly()
+
+    def total_area(self):
+        return math.fsum(self._area_column())
+
+    def formatted_areas(self):
+        # The lesson's "32.40 sq. cm" strings, for display only
+        return list(map("{:.2f} sq. cm".format, self._area_column()))
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    r = Rectangle(4.5, 7.2)
+    print(f"🧮 Area: {r.area} → as a number: {r.area_sq_cm}")
+    r.width = 10
+    print(f"🧮 New Area: {r.area}")                 # cache invalidated by the setter
+    del r.width
+    print(f"🧮 Area after deletion: {r.area}")
+
+    n = 1_000_000
+    rng = random.Random(1)
+    widths = array("d", (rng.uniform(0.1, 100) for _ in range(n)))
+    heights = array("d", (rng.uniform(0.1, 100) for _ in range(n)))
+
+    t0 = time.perf_counter()
+    objs = [Rectangle(w, h) for w, h in zip(widths, heights)]
+    total_obj = math.fsum(o.area_sq_cm for o in objs)
+    t_objs = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    rects = RectangleArray(widths, heights)
+    total_bulk = rects.total_area()
+    t_bulk = time.perf_counter() - t0
+    assert total_obj == total_bulk
+    print(f"\n⏱️ {n:,} rectangles, validate + total area: objects {t_objs:.2f}s vs "
+          f"RectangleArray {t_bulk:.3f}s ({t_objs / t_bulk:.0f}x)")
+
+    t0 = time.perf_counter()
+    rects.areas()
+    print(f"♻️ cached areas(): {(time.perf_counter() - t0) * 1e6:.1f} µs")
+
+    bad = array("d", widths)
+    bad[123_456] = -1.0
+    try:
+        rects.set_widths(bad)
+    except ValueError as e:
+        print(f"🚫 Error: {e}")
@@ -0,0 +1,324 @@
+# ==============================================================
+# 🪣 RESERVOIR SAMPLING: uniform & weighted samples of endless streams
+# ==============================================================
+
+# lessons/21.random_numbers.py samples from lists that are already in memory:
+#     random.choice(l)
+# That needs the whole list. For a stream of a billion log lines, sensor
+# readings or database rows we want k items in O(k) memory, in ONE pass.
+#
+# ✅ ReservoirSampler (Algorithm L, Li 1994): uniform sample of size k.
+#    Instead of rolling a die for every item, it computes how many items to SKIP
+#    until the next replacement (≈ k·log(n/k) replacements in total), and the
+#    skipping itself runs in C over blocks pulled with itertools.islice.
+# ✅ WeightedReservoirSampler (A-ExpJ, Efraimidis & Spirakis): item i is kept
+#    with probability proportional to its weight. Exponential jumps again skip
+#    most items; the jump target is found with bisect over accumulate(weights).
+# ✅ merge(): shards sampled separately (threads, processes, machines) combine
+#    into an exact sample of the whole stream.
+# ✅ sample_lines(path, k): k random lines of a file of any size.
+
+import heapq
+import math
+import random
+from bisect import bisect_left
+from itertools import accumulate, islice
+from operator import itemgetter
+
+# Items pulled from the iterator at a time (C-level list(islice(...)))
+BLOCK = 1 << 16
+
+_ALMOST_ONE = math.nextafter(1.0, 0.0)
+
+
+def _log_uniform(rng):
+    # log(u) for u uniform in (0, 1]; expovariate never takes log(0)
+    return -rng.expovariate(1.0)
+
+
+# ------------------------------------------
+# ✅ 1. Uniform: Algorithm L
+# ------------------------------------------
+
+class ReservoirSampler:
+    #   sampler = ReservoirSampler(100, rng=random.Random(7))
+    #   sampler.feed(stream)             # may be called again with more data
+    #   sampler.sample                   → list of 100 items
+    #   sampler.seen                     → how many items went past
+
+    def __init__(self, k, rng=None):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.rng = rng or random.Random()
+        self.sample = []
+        self.seen = 0
+        self._w = None            # Algorithm L threshold (largest key in the reservoir)
+        self._next = None         # stream index of the next item to take
+
+    def _advance(self):
+        # W shrinks like the max of k uniforms; the gap to the next kept item is geometric
+        self._w = min(self._w * math.exp(_log_uniform(self.rng) / self.k), _ALMOST_ONE)
+        self._next += math.floor(_log_uniform(self.rng) / math.log1p(-self._w)) + 1
+
+    def _start(self, w):
+        self._w = min(w, _ALMOST_ONE)
+        self._next = self.seen - 1
+        self._next += math.floor(_log_uniform(self.rng) / math.log1p(-self._w)) + 1
+
+    def feed(self, iterable):
+        it = iter(iterable)
+        if len(self.sample) < self.k:                      # fill phase
+            head = list(islice(it, self.k - len(self.sample)))
+            self.sample.extend(head)
+            self.seen += len(head)
+            if len(self.sample) < self.k:
+                return self
+            self._start(math.exp(_log_uniform(self.rng) / self.k))
+        k, sample, randrange = self.k, self.sample, self.rng.randrange
+        while True:
+            block = list(islice(it, BLOCK))
+            if not block:
+                return self
+            start = self.seen
+            end = start + len(block)
+            while self._next < end:
+                sample[randrange(k)] = block[self._next - start]
+                self._advance()
+            self.seen = end
+
+    def feed_sequence(self, seq):
+        # Sequences with len() + indexing (list, array, range, mmap'd records...):
+        # skipped items are never even touched → O(k·log(n/k)) time
+        offset = self.seen
+        n = len(seq)
+        if len(self.sample) < self.k:
+            take = min(self.k - len(self.sample), n)
+            self.sample.extend(seq[i] for i in range(take))
+            self.seen += take
+            if len(self.sample) < self.k:
+                return self
+            self._start(math.exp(_log_uniform(self.rng) / self.k))
+        end = offset + n
+        while self._next < end:
+            self.sample[self.rng.randrange(self.k)] = seq[self._next - offset]
+            self._advance()
+        self.seen = end
+        return self
+
+    def add(self, item):
+        return self.feed((item,))
+
+    @classmethod
+    def merge(cls, samplers, rng=None):
+        # Combine shard samples into one uniform sample of everything they saw.
+        # How many items come from each shard follows the multivariate
+        # hypergeometric distribution (drawn one slot at a time).
+        samplers = list(samplers)
+        k = samplers[0].k
+        if any(s.k != k for s in samplers):
+            raise ValueError("all samplers must have the same k")
+        merged = cls(k, rng)
+        pools = [list(s.sample) for s in samplers]
+        remaining = [s.seen for s in samplers]
+        total = sum(remaining)
+        for _ in range(min(k, total)):
+            pick = merged.rng.random() * total
+            for i, left in enumerate(remaining):
+                if pick < left:
+                    break
+                pick -= left
+            # take a random not-yet-used item from shard i (its sample is uniform)
+            pool = pools[i]
+            j = merged.rng.randrange(len(pool))
+            pool[j], pool[-1] = pool[-1], pool[j]
+            merged.sample.append(pool.pop())
+            remaining[i] -= 1
+            total -= 1
+        merged.seen = sum(s.seen for s in samplers)
+        if len(merged.sample) == k:
+            # Threshold = k-th smallest of `seen` uniform keys ~ Beta(k, seen - k + 1),
+            # so the merged sampler can keep consuming the stream
+            merged._start(merged.rng.betavariate(k, merged.seen - k + 1))
+        return merged
+
+
+def algorithm_r(iterable, k, rng=None):
+    # The textbook version: one random number for EVERY item (for comparison)
+    rng = rng or random.Random()
+    sample = []
+    for i, item in enumerate(iterable):
+        if i < k:
+            sample.append(item)
+        else:
+            j = rng.randrange(i + 1)
+            if j < k:
+                sample[j] = item
+    return sample
+
+
+# ------------------------------------------
+# ✅ 2. Weighted: A-ExpJ
+# ------------------------------------------
+
+class WeightedReservoirSampler:
+    #   sampler = WeightedReservoirSampler(10)
+    #   sampler.feed(((item, weight), ...))          # or feed(items, weight=func)
+    #   sampler.sample                               → list of 10 items
+    #
+    # Keys are kept in log form, log(u) / w, to avoid u ** (1 / w) underflowing.
+
+    def __init__(self, k, rng=None):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.rng = rng or random.Random()
+        self.heap = []            # (log key, tiebreak, item); heap[0] = smallest key
+        self.seen = 0
+        self.total_weight = 0.0
+        self._jump = None         # weight still to skip before the next insertion
+        self._tiebreak = 0
+
+    @property
+    def sample(self):
+        return [item for _, _, item in sorted(self.heap, reverse=True)]
+
+    def _push(self, item, key):
+        self._tiebreak += 1
+        entry = (key, self._tiebreak, item)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        else:
+            heapq.heapreplace(self.heap, entry)
+
+    def _new_jump(self):
+        # X = log(r) / log(T): total weight to pass before the next replacement
+        self._jump = _log_uniform(self.rng) / self.heap[0][0]
+
+    def feed(self, iterable, weight=None):
+        # iterable of (item, weight) pairs, or of items with weight=callable
+        it = iter(iterable)
+        get_weight = weight or itemgetter(1)
+        get_item = (lambda x: x) if weight else itemgetter(0)
+        rng = self.rng
+        while True:
+            block = list(islice(it, BLOCK))
+            if not block:
+                return self
+            weights = list(map(get_weight, block))
+            if min(weights) < 0:
+                raise ValueError("weights must be non-negative")
+            self.seen += len(block)
+            self.total_weight += math.fsum(weights)
+            i = 0
+            while len(self.heap) < self.k and i < len(block):      # fill phase
+                if weights[i] > 0:
+                    self._push(get_item(block[i]), _log_uniform(rng) / weights[i])
+                i += 1
+            if len(self.heap) < self.k or i == len(block):
+                continue
+            if self._jump is None:
+                self._new_jump()
+            # cum[j] = weight of block[i..j]; jump targets are found by bisect in C
+            cum = list(accumulate(islice(weights, i, None)))
+            base = 0.0
+            while True:
+                j = bisect_left(cum, base + self._jump)
+                if j == len(cum):                     # jump goes past this block
+                    self._jump -= cum[-1] - base if cum else 0.0
+                    break
+                w = weights[i + j]
+                # the item that the jump lands on enters with a key above the threshold
+                t_w = math.exp(self.heap[0][0] * w)
+                r2 = t_w + (1.0 - t_w) * rng.random()
+                self._push(get_item(block[i + j]), math.log(r2) / w if r2 < 1.0 else 0.0)
+                self._new_jump()
+                base = cum[j]
+
+    def add(self, item, weight):
+        return self.feed(((item, weight),))
+
+    @classmethod
+    def merge(cls, samplers, rng=None):
+        # Keys are comparable across shards: keep the k largest
+        samplers = list(samplers)
+        k = samplers[0].k
+        merged = cls(k, rng)
+        entries = heapq.nlargest(k, (e for s in samplers for e in s.heap))
+        for key, _, item in entries:
+            merged._push(item, key)
+        merged.seen = sum(s.seen for s in samplers)
+        merged.total_weight = math.fsum(s.total_weight for s in samplers)
+        return merged
+
+
+# ------------------------------------------
+# ✅ 3. Files
+# ------------------------------------------
+
+def sample_lines(path, k, rng=None, encoding="utf-8"):
+    # k uniformly random lines of a file of any size, one pass, O(k) memory
+    with open(path, encoding=encoding) as f:
+        return ReservoirSampler(k, rng).feed(f).sample
+
+
+def _sample_shard(args):
+    # Worker for the distributed demo: sample range(start, stop) as a stream
+    start, stop, k, seed = args
+    return ReservoirSampler(k, random.Random(seed)).feed(iter(range(start, stop)))
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from collections import Counter
+    from concurrent.futures import ProcessPoolExecutor
+
+    k = 100
+    rng = random.Random(11)
+
+    # Uniformity check: every position should be picked ~ equally often
+    counts = Counter()
+    for trial in range(2_000):
+        counts.update(ReservoirSampler(5, random.Random(trial)).feed(iter(range(50))).sample)
+    print(f"🎯 uniform: each of 50 items picked {min(counts.values())}–{max(counts.values())} "
+          f"times (expected {2_000 * 5 / 50:.0f})")
+
+    weighted = Counter()
+    for trial in range(2_000):
+        s = WeightedReservoirSampler(1, random.Random(trial)).feed([("a", 1), ("b", 2), ("c", 7)])
+        weighted.update(s.sample)
+    print(f"⚖️ weighted 1:2:7 → {dict(sorted(weighted.items()))}")
+
+    n = 10_000_000
+    t0 = time.perf_counter()
+    algorithm_r(iter(range(n)), k, rng)
+    t_r = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    ReservoirSampler(k, rng).feed(iter(range(n)))
+    t_l = time.perf_counter() - t0
+    print(f"\n⏱️ {n:,} items: Algorithm R {t_r:.2f}s vs Algorithm L {t_l:.2f}s ({t_r / t_l:.0f}x)")
+
+    t0 = time.perf_counter()
+    WeightedReservoirSampler(k, rng).feed(zip(range(n), range(1, n + 1)))
+    print(f"⏱️ {n:,} weighted items (A-ExpJ): {time.perf_counter() - t0:.2f}s")
+
+    big = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000     # pass 1000000000 for 1B
+    t0 = time.perf_counter()
+    single = ReservoirSampler(k, rng).feed(iter(range(big)))
+    t_single = time.perf_counter() - t0
+    shards = 8
+    bounds = [big * i // shards for i in range(shards + 1)]
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor() as pool:
+        parts = list(pool.map(_sample_shard, [(bounds[i], bounds[i + 1], k, i) for i in range(shards)]))
+    merged = ReservoirSampler.merge(parts, rng)
+    t_merged = time.perf_counter() - t0
+    assert merged.seen == single.seen == big
+    # (the sharded run only gets faster with several CPU cores)
+    print(f"🌊 {big:,}-item stream: 1 process {t_single:.1f}s, {shards} shards + merge {t_merged:.1f}s, "
+          f"memory = {k} items; sample mean {sum(merged.sample) / k / big:.3f}·n (expected ≈0.5)")
+    print(f"📏 sequence fast path on range({big:,}): ", end="")
+    t0 = time.perf_counter()
+    ReservoirSampler(k, rng).feed_sequence(range(big))
+    print(f"{(time.perf_counter() - t0) * 1e3:.1f} ms")
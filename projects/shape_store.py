@@ -0,0 +1,267 @@
+# ==============================================================
+# 🔷 COLUMNAR SHAPE STORE: batched area() across a Shape hierarchy
+# ==============================================================
+
+# lessons/37.polymorphism.py loops over shapes and lets Python pick the method:
+#     for shape in shape_list:
+#         shape.area()          # dynamic dispatch, once per object
+#
+# That is elegant for two shapes. For tens of millions, every iteration pays for
+# an attribute lookup, a method call and a new float object.
+#
+# The store below flips the layout:
+# - shapes are grouped BY TYPE
+# - each group keeps its fields in columns (array('d') of radii, of sides, ...)
+# - a registered "kernel" computes all areas of a group in one pass with
+#   map() over operator functions (the loop runs in C)
+# - unknown subclasses still work: they fall back to calling shape.area() per object
+#
+# Polymorphism is still there — it just happens once per TYPE, not once per object.
+
+import math
+import operator
+from array import array
+from itertools import repeat
+
+
+# ------------------------------------------
+# ✅ 1. Shape hierarchy (same formulas as the lesson, but area() RETURNS the value)
+# ------------------------------------------
+
+class Shape:
+    def __init__(self, color, dimension):
+        self.color = color
+        self.dimension = dimension
+
+    def area(self):
+        raise NotImplementedError("area() should be overridden by child classes")
+
+
+class Circle(Shape):
+    def __init__(self, color, dimension, radius):
+        super().__init__(color, dimension)
+        self.radius = radius
+
+    def area(self):
+        return 3.14 * (self.radius ** 2)
+
+
+class Triangle(Shape):
+    def __init__(self, color, dimension, side):
+        super().__init__(color, dimension)
+        self.side = side
+
+    def area(self):
+        return 0.5 * self.side * self.side
+
+
+# ------------------------------------------
+# ✅ 2. Vectorized kernels, registered per exact type
+# ------------------------------------------
+
+# Kernels return lazy iterators. r * r is used instead of r ** 2, so results can
+# differ from area() in the last bit (pow() is not always correctly rounded).
+
+def circle_areas(radius):
+    return map(operator.mul, map(operator.mul, radius, radius), repeat(3.14))
+
+
+def triangle_areas(side):
+    return map(operator.mul, map(operator.mul, side, side), repeat(0.5))
+
+
+# Totals can factor the constant out: Σ 3.14·r² = 3.14 · Σ r·r
+# (math.sumprod is a single C loop on Python 3.12+)
+if hasattr(math, "sumprod"):
+    def sum_of_squares(column):
+        return math.sumprod(column, column)
+else:
+    def sum_of_squares(column):
+        return sum(map(operator.mul, column, column))
+
+
+def circle_total(radius):
+    return 3.14 * sum_of_squares(radius)
+
+
+def triangle_total(side):
+    return 0.5 * sum_of_squares(side)
+
+
+class ShapeStore:
+    #   store = ShapeStore()
+    #   store.extend(shapes)          # any mix of Shape subclasses
+    #   store.areas()                 → array('d'), same order as added
+    #   store.areas_by_type()         → {Circle: array(...), Triangle: array(...), ...}
+    #   store.total_area()
+
+    # type → (field names, kernel(*columns) → iterable of areas, total(*columns) or None)
+    # Every store starts from a copy of these; register() only changes one store.
+    default_kernels = {
+        Circle: (("radius",), circle_areas, circle_total),
+        Triangle: (("side",), triangle_areas, triangle_total),
+    }
+
+    def __init__(self):
+        self.kernels = dict(self.default_kernels)
+        self.groups = {}             # type → list of column arrays (or list of objects)
+        self.group_ids = {}          # type → small int id
+        self.group_types = []        # id → type
+        self.order = array("H")      # group id of every shape, in insertion order
+
+    def __len__(self):
+        return len(self.order)
+
+    def register(self, shape_type, fields, kernel, total=None):
+        # Teach this store a new shape type, e.g.
+        # store.register(Rect, ("w", "h"), lambda w, h: map(operator.mul, w, h))
+        # Objects of that type already added through the fallback are moved
+        # into columns, so the group never mixes objects and columns.
+        fields = tuple(fields)
+        if shape_type in self.kernels and shape_type in self.groups:
+            if self.kernels[shape_type][0] != fields:
+                raise ValueError(f"{shape_type.__name__} already has columns {self.kernels[shape_type][0]}")
+        elif shape_type in self.groups:
+            objects = self.groups[shape_type]
+            self.groups[shape_type] = [array("d", map(operator.attrgetter(f), objects)) for f in fields]
+        self.kernels[shape_type] = (fields, kernel, total)
+
+    def _group(self, shape_type):
+        gid = self.group_ids.get(shape_type)
+        if gid is None:
+            gid = self.group_ids[shape_type] = len(self.group_types)
+            self.group_types.append(shape_type)
+            spec = self.kernels.get(shape_type)
+            # exact type match only: a subclass may override area()
+            self.groups[shape_type] = [array("d") for _ in spec[0]] if spec else []
+        return gid
+
+    def add(self, shape):
+        shape_type = type(shape)
+        gid = self._group(shape_type)
+        spec = self.kernels.get(shape_type)
+        if spec:
+            for column, field in zip(self.groups[shape_type], spec[0]):
+                column.append(getattr(shape, field))
+        else:
+            self.groups[shape_type].append(shape)
+        self.order.append(gid)
+
+    def extend(self, shapes):
+        for shape in shapes:
+            self.add(shape)
+
+    def add_columns(self, shape_type, **columns):
+        # Bulk-load a registered type straight from columns (no objects at all):
+        # store.add_columns(Circle, radius=array('d', ...))
+        fields = self.kernels[shape_type][0]
+        gid = self._group(shape_type)
+        lengths = {len(columns[f]) for f in fields}
+        if len(lengths) != 1:
+            raise ValueError("all columns must have the same length")
+        for column, field in zip(self.groups[shape_type], fields):
+            column.extend(columns[field])
+        self.order.extend(repeat(gid, lengths.pop()))
+
+    # -- computing areas ----------------------------------------------------
+    def _group_areas(self, shape_type):
+        # unregistered types fall back to classic dynamic dispatch per object
+        return array("d", self._group_area_iter(shape_type))
+
+    def _group_area_iter(self, shape_type):
+        spec = self.kernels.get(shape_type)
+        if spec:
+            return spec[1](*self.groups[shape_type])
+        return map(operator.methodcaller("area"), self.groups[shape_type])
+
+    def areas_by_type(self):
+        return {t: self._group_areas(t) for t in self.group_types}
+
+    def areas(self):
+        # Areas in insertion order. Each group's results are consumed through its
+        # own iterator, picked by the group id of every position — all in C:
+        #     result[i] = next(iterators[order[i]])
+        if len(self.group_types) == 1:
+            return self._group_areas(self.group_types[0])
+        iterators = [iter(self._group_areas(t)) for t in self.group_types]
+        return array("d", map(next, map(iterators.__getitem__, self.order)))
+
+    def total_area(self):
+        # Aggregates never materialize the per-shape areas (equal up to float rounding)
+        total = 0.0
+        for t in self.group_types:
+            spec = self.kernels.get(t)
+            if spec and spec[2]:
+                total += spec[2](*self.groups[t])
+            else:
+                total += sum(self._group_area_iter(t))
+        return total
+
+    def nbytes(self):
+        # Memory held by the columns (objects of fallback types are not counted)
+        columns = [c for t in self.group_types if t in self.kernels for c in self.groups[t]]
+        return sum(c.itemsize * len(c) for c in columns) + self.order.itemsize * len(self.order)
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    class Square(Shape):                 # not registered → per-object fallback
+        def __init__(self, color, dimension, side):
+            super().__init__(color, dimension)
+            self.side = side
+
+        def area(self):
+            return self.side * self.side
+
+    n = 1_000_000
+    rng = random.Random(42)
+    kinds = (Circle, Triangle, Square)
+    shapes = [rng.choice(kinds)("Red", "2D", rng.uniform(1, 10)) for _ in range(n)]
+
+    t0 = time.perf_counter()
+    per_object = [shape.area() for shape in shapes]
+    t_dispatch = time.perf_counter() - t0
+
+    store = ShapeStore()
+    store.extend(shapes)
+    t0 = time.perf_counter()
+    batched = store.areas()
+    t_batched = time.perf_counter() - t0
+    assert all(map(math.isclose, batched, per_object))
+
+    print(f"🔁 per-object area(): {t_dispatch:.3f}s")
+    # Mixed types + an unregistered class: the per-position interleave and the
+    # per-object fallback cost more than they save, so this path is for convenience
+    print(f"🚀 ShapeStore.areas() (mixed, Square via fallback): {t_batched:.3f}s "
+          f"({t_dispatch / t_batched:.1f}x)")
+
+    # Registered types only, loaded as columns (the intended hot path)
+    radii = array("d", (rng.uniform(1, 10) for _ in range(n)))
+    circles = ShapeStore()
+    circles.add_columns(Circle, radius=radii)
+    objs = [Circle("Red", "2D", r) for r in radii]
+
+    t0 = time.perf_counter()
+    slow = [c.area() for c in objs]
+    t_dispatch = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fast = circles.areas()
+    t_batched = time.perf_counter() - t0
+    assert all(map(math.isclose, fast, slow))
+    print(f"⚪ {n:,} circle areas: per-object {t_dispatch:.3f}s vs columnar {t_batched:.3f}s "
+          f"({t_dispatch / t_batched:.1f}x)")
+
+    t0 = time.perf_counter()
+    slow_total = sum(c.area() for c in objs)
+    t_dispatch = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fast_total = circles.total_area()
+    t_batched = time.perf_counter() - t0
+    assert math.isclose(slow_total, fast_total)
+    print(f"➕ total area: per-object {t_dispatch:.3f}s vs columnar {t_batched:.3f}s "
+          f"({t_dispatch / t_batched:.1f}x)")
+    print(f"📦 memory: columns {circles.nbytes() / n:.0f} bytes per circle vs "
+          f"~{sys.getsizeof(objs[0]) + sys.getsizeof(objs[0].__dict__) + 24} bytes per object")
@@ -0,0 +1,468 @@
+# ==============================================================
+# 🗺️ SPARSE GRIDS: DOK, COO and CSR boards for mostly-empty 2D data
+# ==============================================================
+
+# lessons/19.2d-collections.py (and the quiz's `options` list of lists) build
+# grids with nested lists, so EVERY cell exists:
+#     board = [[None] * cols for _ in range(rows)]
+# A 100,000 x 100,000 board is 10 billion cells ≈ 80 GB of pointers, even if
+# only 0.1% of the cells hold anything.
+#
+# Three classic sparse layouts, all storing only the non-empty cells:
+# ✅ DOKGrid  (dict of keys)   {row: {col: value}}        → random reads/writes, O(1)
+# ✅ COOGrid  (coordinates)    rows[], cols[], values[]   → fastest bulk appends / loading
+# ✅ CSRGrid  (compressed rows) indptr[], indices[], values[]
+#                                                         → most compact, fastest row scans,
+#                                                           column scans via a cached transpose
+# ✅ conversions: dok.to_coo(), coo.to_csr(), csr.to_dok(), ... (any → any)
+# ✅ neighbors(r, c): the occupied cells around (r, c), typical for game boards
+# ✅ bulk updates: update(rows, cols, values) on every layout
+#
+# Index arrays are array('q') (8 bytes each). Values go in a typed array when a
+# typecode is given ('d', 'q', ...), otherwise in a list (any Python object).
+
+import bisect
+from array import array
+from itertools import compress, repeat
+
+_NEIGHBOR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+_ORTHOGONAL_OFFSETS = ((-1, 0), (0, -1), (0, 1), (1, 0))
+
+
+def _values(typecode, items=()):
+    return array(typecode, items) if typecode else list(items)
+
+
+def _check_cell(grid, r, c):
+    if not (0 <= r < grid.rows and 0 <= c < grid.cols):
+        raise IndexError(f"cell ({r}, {c}) outside a {grid.rows}x{grid.cols} grid")
+
+
+def _check_line(size, i, what):
+    if not 0 <= i < size:
+        raise IndexError(f"{what} {i} outside 0..{size - 1}")
+
+
+# ------------------------------------------
+# ✅ 1. DOK: dict of rows → dict of cols → value
+# ------------------------------------------
+
+class DOKGrid:
+    #   board = DOKGrid(100_000, 100_000)
+    #   board[5, 7] = "♞"
+    #   board[5, 7]          → "♞"   (board.default for empty cells)
+    #   del board[5, 7]
+    #   for c, v in board.row(5): ...
+
+    def __init__(self, rows, cols, default=None, typecode=None):
+        self.rows = rows
+        self.cols = cols
+        self.default = default
+        self.typecode = typecode         # only used when converting to COO/CSR
+        self._data = {}                  # row → {col: value}
+        self._nnz = 0
+
+    def __len__(self):
+        return self._nnz
+
+    nnz = property(__len__)
+
+    def __getitem__(self, cell):
+        r, c = cell
+        _check_cell(self, r, c)
+        row = self._data.get(r)
+        if row is None:
+            return self.default
+        return row.get(c, self.default)
+
+    def __setitem__(self, cell, value):
+        r, c = cell
+        _check_cell(self, r, c)
+        if value == self.default:        # writing the default empties the cell
+            self.__delitem__(cell)
+            return
+        row = self._data.get(r)
+        if row is None:
+            row = self._data[r] = {}
+        if c not in row:
+            self._nnz += 1
+        row[c] = value
+
+    def __delitem__(self, cell):
+        r, c = cell
+        row = self._data.get(r)
+        if row is not None and c in row:
+            del row[c]
+            self._nnz -= 1
+            if not row:
+                del self._data[r]
+
+    def __contains__(self, cell):
+        r, c = cell
+        row = self._data.get(r)
+        return row is not None and c in row
+
+    def items(self):
+        # ((r, c), value) in row-major order
+        for r in sorted(self._data):
+            row = self._data[r]
+            for c in sorted(row):
+                yield (r, c), row[c]
+
+    def row(self, r):
+        _check_line(self.rows, r, "row")
+        row = self._data.get(r, {})
+        return ((c, row[c]) for c in sorted(row))
+
+    def col(self, c):
+        # O(number of non-empty rows); use CSRGrid for many column scans
+        _check_line(self.cols, c, "column")
+        data = self._data
+        return ((r, data[r][c]) for r in sorted(data) if c in data[r])
+
+    def neighbors(self, r, c, diagonal=True):
+        offsets = _NEIGHBOR_OFFSETS if diagonal else _ORTHOGONAL_OFFSETS
+        data = self._data
+        for dr, dc in offsets:
+            row = data.get(r + dr)
+            if row is not None and c + dc in row:
+                yield (r + dr, c + dc), row[c + dc]
+
+    def update(self, rows, cols, values):
+        # Bulk write of many cells (later cells win)
+        data = self._data
+        setdefault = data.setdefault
+        default = self.default
+        n_rows, n_cols = self.rows, self.cols
+        for r, c, v in zip(rows, cols, values):
+            if not (0 <= r < n_rows and 0 <= c < n_cols):
+                raise IndexError(f"cell ({r}, {c}) outside a {n_rows}x{n_cols} grid")
+            if v == default:
+                self.__delitem__((r, c))
+                continue
+            row = setdefault(r, {})
+            if c not in row:
+                self._nnz += 1
+            row[c] = v
+
+    def to_coo(self):
+        coo = COOGrid(self.rows, self.cols, self.default, self.typecode)
+        for r in sorted(self._data):
+            row = self._data[r]
+            cols = sorted(row)
+            coo.row_ids.extend(repeat(r, len(cols)))
+            coo.col_ids.extend(cols)
+            coo.values.extend(map(row.__getitem__, cols))
+        return coo
+
+    def to_csr(self):
+        return self.to_coo().to_csr()
+
+    def to_dok(self):
+        return self
+
+
+# ------------------------------------------
+# ✅ 2. COO: three parallel arrays
+# ------------------------------------------
+
+class COOGrid:
+    #   coo = COOGrid(100_000, 100_000, typecode="d")
+    #   coo.update(rows, cols, values)      # bulk append, no per-cell objects
+    #   csr = coo.to_csr()                  # sort once, then scan rows fast
+
+    def __init__(self, rows, cols, default=None, typecode=None):
+        self.rows = rows
+        self.cols = cols
+        self.default = default
+        self.typecode = typecode
+        self.row_ids = array("q")
+        self.col_ids = array("q")
+        self.values = _values(typecode)
+
+    def __len__(self):
+        return len(self.row_ids)
+
+    nnz = property(__len__)
+
+    def append(self, r, c, value):
+        _check_cell(self, r, c)
+        self.row_ids.append(r)
+        self.col_ids.append(c)
+        self.values.append(value)
+
+    def update(self, rows, cols, values):
+        # Bulk append; duplicates are resolved when converting (last one wins)
+        start = len(self.row_ids)
+        self.row_ids.extend(rows)
+        self.col_ids.extend(cols)
+        self.values.extend(values)
+        n = len(self.row_ids)
+        if not len(self.col_ids) == len(self.values) == n:
+            del self.row_ids[start:], self.col_ids[start:], self.values[start:]
+            raise ValueError("rows, cols and values must have the same length")
+        new_rows, new_cols = self.row_ids[start:], self.col_ids[start:]
+        if new_rows and not (0 <= min(new_rows) and max(new_rows) < self.rows
+                             and 0 <= min(new_cols) and max(new_cols) < self.cols):
+            del self.row_ids[start:], self.col_ids[start:], self.values[start:]
+            raise IndexError(f"cells outside a {self.rows}x{self.cols} grid")
+
+    def items(self):
+        return zip(zip(self.row_ids, self.col_ids), self.values)
+
+    def to_csr(self, duplicates="last"):
+        # Sort by (row, col) once; duplicates are merged ("last" wins or "sum")
+        cols = self.cols
+        keys = list(map(int.__add__, map(cols.__mul__, self.row_ids), self.col_ids))
+        order = sorted(range(len(keys)), key=keys.__getitem__)       # stable
+        values = self.values
+        default = self.default
+        indptr = array("q", bytes(8 * (self.rows + 1)))
+        indices = array("q")
+        out = _values(self.typecode)
+        last_key = -1
+        for i in order:
+            key = keys[i]
+            if key == last_key:                  # duplicate cell
+                if duplicates == "sum":
+                    out[-1] += values[i]
+                else:
+                    out[-1] = values[i]
+                continue
+            last_key = key
+            indices.append(key % cols)
+            out.append(values[i])
+            indptr[key // cols + 1] += 1
+        csr = CSRGrid(self.rows, self.cols, indptr, indices, out, default)
+        csr._accumulate_indptr()
+        # Cells equal to the default are empty in every layout (DOK never stores
+        # them either). Only skipped when it can't match: None in a typed array.
+        if not (default is None and self.typecode):
+            csr._drop_defaults()
+        return csr
+
+    def to_dok(self):
+        dok = DOKGrid(self.rows, self.cols, self.default, self.typecode)
+        dok.update(self.row_ids, self.col_ids, self.values)
+        return dok
+
+    def to_coo(self):
+        return self
+
+
+# ------------------------------------------
+# ✅ 3. CSR: compressed sparse rows
+# ------------------------------------------
+
+class CSRGrid:
+    # Row r's cells are indices[indptr[r]:indptr[r + 1]] (sorted columns) with
+    # the matching values — a row scan is two array slices.
+    #   csr[r, c]            → binary search inside row r
+    #   csr.row(r) / csr.col(c) / csr.neighbors(r, c)
+
+    def __init__(self, rows, cols, indptr, indices, values, default=None):
+        self.rows = rows
+        self.cols = cols
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+        self.default = default
+        self._transpose = None           # cached CSC (CSR of the transpose) for column scans
+
+    @property
+    def typecode(self):
+        return self.values.typecode if isinstance(self.values, array) else None
+
+    def __len__(self):
+        return len(self.indices)
+
+    nnz = property(__len__)
+
+    def _accumulate_indptr(self):
+        indptr = self.indptr
+        total = 0
+        for r in range(1, len(indptr)):
+            total += indptr[r]
+            indptr[r] = total
+
+    def _drop_defaults(self):
+        # Remove cells whose value equals the default (e.g. sums that cancelled out)
+        keep = [v != self.default for v in self.values]
+        if all(keep):
+            return
+        row_of = array("q")
+        for r in range(self.rows):
+            row_of.extend(repeat(r, self.indptr[r + 1] - self.indptr[r]))
+        coo = COOGrid(self.rows, self.cols, self.default, self.typecode)
+        coo.update(compress(row_of, keep), compress(self.indices, keep), compress(self.values, keep))
+        fresh = coo.to_csr()
+        self.indptr, self.indices, self.values = fresh.indptr, fresh.indices, fresh.values
+
+    def _find(self, r, c):
+        start, stop = self.indptr[r], self.indptr[r + 1]
+        i = bisect.bisect_left(self.indices, c, start, stop)
+        return i if i < stop and self.indices[i] == c else -1
+
+    def __getitem__(self, cell):
+        r, c = cell
+        _check_cell(self, r, c)
+        i = self._find(r, c)
+        return self.values[i] if i >= 0 else self.default
+
+    def __setitem__(self, cell, value):
+        # Only existing cells can change in place; new cells go through update()
+        r, c = cell
+        _check_cell(self, r, c)
+        i = self._find(r, c)
+        if i < 0:
+            raise KeyError(f"({r}, {c}) is empty; use update() to add cells to a CSRGrid")
+        self.values[i] = value
+        self._transpose = None
+
+    def __contains__(self, cell):
+        r, c = cell
+        return 0 <= r < self.rows and self._find(r, c) >= 0
+
+    def row(self, r):
+        _check_line(self.rows, r, "row")
+        start, stop = self.indptr[r], self.indptr[r + 1]
+        return zip(self.indices[start:stop], self.values[start:stop])
+
+    def transpose(self):
+        if self._transpose is None:
+            coo = COOGrid(self.cols, self.rows, self.default, self.typecode)
+            row_of = array("q")
+            for r in range(self.rows):
+                row_of.extend(repeat(r, self.indptr[r + 1] - self.indptr[r]))
+            coo.update(self.indices, row_of, self.values)
+            self._transpose = coo.to_csr()
+        return self._transpose
+
+    def col(self, c):
+        # First call builds the transpose (O(nnz log nnz)); later calls are row scans
+        return self.transpose().row(c)
+
+    def items(self):
+        indices, values = self.indices, self.values
+        for r in range(self.rows):
+            for i in range(self.indptr[r], self.indptr[r + 1]):
+                yield (r, indices[i]), values[i]
+
+    def neighbors(self, r, c, diagonal=True):
+        # For each neighbouring row, a bisect finds the columns c-1..c+1 at once
+        offsets = _NEIGHBOR_OFFSETS if diagonal else _ORTHOGONAL_OFFSETS
+        wanted = {}
+        for dr, dc in offsets:
+            wanted.setdefault(r + dr, set()).add(c + dc)
+        indices, values = self.indices, self.values
+        for nr in sorted(wanted):
+            if not 0 <= nr < self.rows:
+                continue
+            start, stop = self.indptr[nr], self.indptr[nr + 1]
+            i = bisect.bisect_left(indices, c - 1, start, stop)
+            while i < stop and indices[i] <= c + 1:
+                if indices[i] in wanted[nr]:
+                    yield (nr, indices[i]), values[i]
+                i += 1
+
+    def update(self, rows, cols, values):
+        # Bulk merge: O(nnz + k log k) rebuild, new values win over old ones
+        merged = self.to_coo()
+        merged.update(rows, cols, values)
+        fresh = merged.to_csr()
+        self.indptr, self.indices, self.values = fresh.indptr, fresh.indices, fresh.values
+        self._transpose = None
+
+    def to_coo(self):
+        coo = COOGrid(self.rows, self.cols, self.default, self.typecode)
+        row_of = array("q")
+        for r in range(self.rows):
+            row_of.extend(repeat(r, self.indptr[r + 1] - self.indptr[r]))
+        coo.update(row_of, self.indices, self.values)
+        return coo
+
+    def to_dok(self):
+        return self.to_coo().to_dok()
+
+    def to_csr(self):
+        return self
+
+    def nbytes(self):
+        total = self.indptr.itemsize * len(self.indptr) + self.indices.itemsize * len(self.indices)
+        if isinstance(self.values, array):
+            total += self.values.itemsize * len(self.values)
+        return total
+
+
+# ------------------------------------------
+# ✅ 4. Nested lists in and out (small grids only)
+# ------------------------------------------
+
+def from_dense(nested, default=None, typecode=None):
+    # [[...], [...]] → DOKGrid, skipping cells equal to `default`; ragged rows are fine
+    rows = len(nested)
+    cols = max(map(len, nested), default=0)
+    grid = DOKGrid(rows, cols, default, typecode)
+    for r, row in enumerate(nested):
+        for c, value in enumerate(row):
+            if value != default:
+                grid[r, c] = value
+    return grid
+
+
+def to_dense(grid):
+    # Any layout → nested lists (allocates every cell!)
+    dense = [[grid.default] * grid.cols for _ in range(grid.rows)]
+    for (r, c), value in grid.items():
+        dense[r][c] = value
+    return dense
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    board = from_dense([[None, "♜", None], [None, None, "♞"], ["♝", None, None]])
+    print(f"♟️ {board.nnz} pieces, neighbors of (1, 1): {list(board.neighbors(1, 1))}")
+    csr = board.to_csr()
+    assert to_dense(csr) == to_dense(board) == to_dense(csr.to_coo().to_dok())
+    print(f"🔁 DOK → CSR → COO → DOK round trip OK, column 2: {list(csr.col(2))}")
+
+    size = 100_000
+    nnz = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000     # 10000000 = 0.1% of 100k x 100k
+    rng = random.Random(5)
+    rows = array("q", (rng.randrange(size) for _ in range(nnz)))
+    cols = array("q", (rng.randrange(size) for _ in range(nnz)))
+    values = array("d", (rng.random() for _ in range(nnz)))
+    print(f"\n🗺️ {size:,} x {size:,} grid, {nnz:,} filled cells "
+          f"(dense nested lists would need ≈{size * size * 8 / 1e9:,.0f} GB)")
+
+    t0 = time.perf_counter()
+    coo = COOGrid(size, size, typecode="d")
+    coo.update(rows, cols, values)
+    t_coo = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    csr = coo.to_csr()
+    t_csr = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    dok = coo.to_dok()
+    t_dok = time.perf_counter() - t0
+    print(f"📥 load COO {t_coo:.2f}s, COO → CSR {t_csr:.2f}s, COO → DOK {t_dok:.2f}s")
+    print(f"📦 CSR {csr.nbytes() / 1e6:.0f} MB ({csr.nbytes() / csr.nnz:.0f} B per cell incl. indptr)")
+
+    probe = [(rng.randrange(size), rng.randrange(size)) for _ in range(100_000)]
+    for name, grid in (("DOK", dok), ("CSR", csr)):
+        t0 = time.perf_counter()
+        for cell in probe:
+            grid[cell]
+        t_get = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        scanned = sum(1 for r in range(0, size, 10) for _ in grid.row(r))
+        t_rows = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for r, c in probe[:10_000]:
+            list(grid.neighbors(r, c))
+        t_nb = time.perf_counter() - t0
+        print(f"⏱️ {name}: 100k reads {t_get:.2f}s, {size // 10:,} row scans ({scanned:,} cells) "
+              f"{t_rows:.2f}s, 10k neighbor queries {t_nb:.2f}s")
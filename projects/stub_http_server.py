@@ -0,0 +1,160 @@
+# ==============================================================
+# 🧪 LOCAL STUB "PokeAPI" SERVER (for offline throughput / retry checks)
+# ==============================================================
+
+# The real PokeAPI is on the internet: slow, rate limited, and not
+# something we want to hammer while testing a bulk fetcher.
+#
+# This stub runs on 127.0.0.1 in a background thread and answers:
+#     GET /api/v2/pokemon?limit=N   → {"count": N, "results": [{"name", "url"}, ...]}
+#     GET /api/v2/pokemon/<id|name> → {"id", "name", "height", "weight", ...}
+#
+# Knobs to exercise the client:
+# - latency      → seconds to sleep before each reply
+# - failure_rate → fraction of requests answered with 503 (retryable)
+# - throttle_every → every Nth request answers 429 + Retry-After
+# - cache_control  → Cache-Control header sent with each Pokémon
+# - etags          → send an ETag and answer If-None-Match with 304 Not Modified
+#
+# Usage:
+#     with StubPokeServer(count=1000, failure_rate=0.1) as server:
+#         print(server.base_url)   # http://127.0.0.1:<port>/api/v2/
+#         ...
+#         print(server.hits)       # how many requests reached the server
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"        # keep-alive, like the real API
+
+    def log_message(self, format, *args):
+        pass                              # keep the console quiet
+
+    def _send_json(self, status, payload, extra_headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_not_modified(self, headers):
+        self.send_response(304)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        stub = self.server.stub
+        hit = stub._record_hit()
+
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        if stub.throttle_every and hit % stub.throttle_every == 0:
+            self._send_json(429, {"detail": "slow down"}, {"Retry-After": "0"})
+            return
+        if stub.failure_rate and stub.random.random() < stub.failure_rate:
+            self._send_json(503, {"detail": "try again"})
+            return
+
+        path, _, query = self.path.partition("?")
+        parts = [p for p in path.split("/") if p]
+        # ["api", "v2", "pokemon"] or ["api", "v2", "pokemon", "<key>"]
+        if parts[:3] != ["api", "v2", "pokemon"]:
+            self._send_json(404, {"detail": "Not found."})
+            return
+
+        if len(parts) == 3:
+            params = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+            limit = min(int(params.get("limit", 20)), stub.count)
+            results = [
+                {"name": f"pokemon-{i}", "url": f"{stub.base_url}pokemon/{i}/"}
+                for i in range(1, limit + 1)
+            ]
+            self._send_json(200, {"count": stub.count, "results": results})
+            return
+
+        key = parts[3]
+        if key.startswith("pokemon-"):
+            key = key[len("pokemon-"):]
+        if not key.isdigit() or not 1 <= int(key) <= stub.count:
+            self._send_json(404, {"detail": "Not found."})
+            return
+
+        i = int(key)
+        headers = {}
+        if stub.cache_control:
+            headers["Cache-Control"] = stub.cache_control
+        if stub.etags:
+            headers["ETag"] = f'"pokemon-{i}-v1"'
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                self._send_not_modified(headers)
+                return
+        self._send_json(200, {
+            "id": i,
+            "name": f"pokemon-{i}",
+            "height": i % 20 + 1,
+            "weight": i * 7 % 1000 + 1,
+            "types": [{"slot": 1, "type": {"name": ("fire", "water", "grass")[i % 3]}}],
+        }, headers)
+
+
+class StubPokeServer:
+    def __init__(self, count=1000, latency=0.0, failure_rate=0.0,
+                 throttle_every=0, seed=0, host="127.0.0.1", port=0,
+                 cache_control=None, etags=False):
+        self.count = count
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.throttle_every = throttle_every
+        self.cache_control = cache_control
+        self.etags = etags
+        self.random = random.Random(seed)
+        self.hits = 0
+        self._lock = threading.Lock()
+
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.stub = self
+        host, port = self.httpd.server_address[:2]
+        self.base_url = f"http://{host}:{port}/api/v2/"
+        self._thread = None
+
+    def _record_hit(self):
+        with self._lock:
+            self.hits += 1
+            return self.hits
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    from urllib.request import urlopen
+
+    with StubPokeServer(count=5) as server:
+        print(f"🧪 Stub server running at {server.base_url}")
+        with urlopen(f"{server.base_url}pokemon/3") as r:
+            print(f"📦 {json.loads(r.read())}")
+        print(f"📊 Hits so far: {server.hits}")
@@ -0,0 +1,349 @@
+# ==============================================================
+# 🎓 INDEXED STUDENT REGISTRY (class-level queries, weak references)
+# ==============================================================
+
+# lessons/39.class-methods.py keeps ONE piece of class-level state:
+#     class Student:
+#         count = 0
+#         def __init__(self, name, gpa):
+#             ...
+#             Student.count += 1
+#
+# There is no way to ask "who is Kedar?" or "who has a GPA between 8.5 and 9.0?"
+# without keeping your own list and scanning it (O(n) per question).
+#
+# Here the class keeps a registry of every instance:
+# ✅ name index          → Student.find("Kedar")                      O(1)
+# ✅ sorted GPA index    → Student.gpa_between(8.5, 9.0)              O(log n + k)
+#                          Student.top(10), Student.percentile_rank(8.9)
+# ✅ weak references     → the registry never keeps a student alive; when the
+#                          last real reference goes away, the student disappears
+#                          from every index automatically
+#
+# The GPA index is a "bucketed sorted list" (the idea behind sortedcontainers):
+# many small sorted lists + the max of each, so an insert only shifts ~1000
+# items instead of the whole array, and lookups are two bisects.
+
+import bisect
+import gc
+import itertools
+import weakref
+
+
+# ------------------------------------------
+# ✅ 1. Bucketed sorted list
+# ------------------------------------------
+
+class SortedKeyList:
+    LOAD = 1000                        # target bucket size
+
+    def __init__(self, keys=()):
+        self._buckets = []
+        self._maxes = []
+        self._len = 0
+        self._offsets = None           # cached prefix sums of bucket sizes
+        keys = sorted(keys)
+        if keys:
+            self._buckets = [keys[i:i + self.LOAD] for i in range(0, len(keys), self.LOAD)]
+            self._maxes = [b[-1] for b in self._buckets]
+            self._len = len(keys)
+
+    def __len__(self):
+        return self._len
+
+    def add(self, key):
+        self._offsets = None
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+        else:
+            i = bisect.bisect_left(self._maxes, key)
+            if i == len(self._maxes):
+                i -= 1
+                self._buckets[i].append(key)
+                self._maxes[i] = key
+            else:
+                bisect.insort(self._buckets[i], key)
+            if len(self._buckets[i]) > 2 * self.LOAD:       # split big buckets
+                bucket = self._buckets[i]
+                half = len(bucket) // 2
+                self._buckets[i:i + 1] = [bucket[:half], bucket[half:]]
+                self._maxes[i:i + 1] = [bucket[half - 1], bucket[-1]]
+        self._len += 1
+
+    def remove(self, key):
+        i = bisect.bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            raise ValueError(f"{key!r} not in list")
+        bucket = self._buckets[i]
+        j = bisect.bisect_left(bucket, key)
+        if j == len(bucket) or bucket[j] != key:
+            raise ValueError(f"{key!r} not in list")
+        del bucket[j]
+        self._len -= 1
+        self._offsets = None
+        if not bucket:
+            del self._buckets[i]
+            del self._maxes[i]
+        elif j == len(bucket):
+            self._maxes[i] = bucket[-1]
+
+    def _locate(self, key, right=False):
+        # (bucket index, position in bucket) of the bisect point for `key`
+        find = bisect.bisect_right if right else bisect.bisect_left
+        i = find(self._maxes, key)
+        if i == len(self._maxes):
+            return i, 0
+        return i, find(self._buckets[i], key)
+
+    def rank(self, key, right=False):
+        # Number of items < key (or <= key with right=True)
+        i, j = self._locate(key, right)
+        if self._offsets is None:
+            self._offsets = [0, *itertools.accumulate(len(b) for b in self._buckets)]
+        return self._offsets[i] + j
+
+    def irange(self, low, high):
+        # Items with low <= item <= high, in ascending order
+        i, j = self._locate(low)
+        for bucket in itertools.islice(self._buckets, i, None):
+            for item in itertools.islice(bucket, j, None):
+                if item > high:
+                    return
+                yield item
+            j = 0
+
+    def __reversed__(self):
+        for bucket in reversed(self._buckets):
+            yield from reversed(bucket)
+
+    def __iter__(self):
+        for bucket in self._buckets:
+            yield from bucket
+
+
+# ------------------------------------------
+# ✅ 2. The registry
+# ------------------------------------------
+
+class StudentRegistry:
+    def __init__(self):
+        self._ids = itertools.count()
+        self._refs = {}                        # uid → weakref to student
+        self._by_name = {}                     # name → {uid, ...}
+        self._by_gpa = SortedKeyList()         # (gpa, uid)
+
+    def __len__(self):
+        return len(self._refs)
+
+    def _forget(self, uid, name, gpa):
+        self._refs.pop(uid, None)
+        uids = self._by_name.get(name)
+        if uids is not None:
+            uids.discard(uid)
+            if not uids:
+                del self._by_name[name]
+        try:
+            self._by_gpa.remove((gpa, uid))
+        except ValueError:             # already gone (e.g. interpreter shutdown)
+            pass
+
+    def _register_ref(self, student):
+        uid = next(self._ids)
+        name, gpa = student.name, student.gpa
+        # The callback fires when the student is garbage-collected
+        self._refs[uid] = weakref.ref(student, lambda _ref: self._forget(uid, name, gpa))
+        self._by_name.setdefault(name, set()).add(uid)
+        return uid
+
+    def add(self, student):
+        uid = self._register_ref(student)
+        self._by_gpa.add((student.gpa, uid))
+        return uid
+
+    def add_many(self, students):
+        # Bulk load: one sort instead of n inserts. The cyclic GC is paused while
+        # millions of weakrefs/sets are created (it would rescan them again and again).
+        students = list(students)
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            keys = [(s.gpa, self._register_ref(s)) for s in students]
+        finally:
+            if was_enabled:
+                gc.enable()
+        keys.extend(self._by_gpa)
+        self._by_gpa = SortedKeyList(keys)
+        return [uid for _, uid in keys[:len(students)]]
+
+    def update_gpa(self, uid, student, old_gpa):
+        # Re-index after a GPA change (the weakref callback must forget the NEW gpa)
+        self._by_gpa.remove((old_gpa, uid))
+        self._by_gpa.add((student.gpa, uid))
+        name, gpa = student.name, student.gpa
+        self._refs[uid] = weakref.ref(student, lambda _ref: self._forget(uid, name, gpa))
+
+    def update_name(self, uid, student, old_name):
+        # Re-index after a rename (the weakref callback must forget the NEW name)
+        uids = self._by_name.get(old_name)
+        if uids is not None:
+            uids.discard(uid)
+            if not uids:
+                del self._by_name[old_name]
+        name, gpa = student.name, student.gpa
+        self._by_name.setdefault(name, set()).add(uid)
+        self._refs[uid] = weakref.ref(student, lambda _ref: self._forget(uid, name, gpa))
+
+    def _get(self, uid):
+        ref = self._refs.get(uid)
+        return ref() if ref is not None else None
+
+    # -- queries ---------------------------------------------------------------
+    def find(self, name):
+        return [s for s in map(self._get, sorted(self._by_name.get(name, ()))) if s is not None]
+
+    def gpa_between(self, low, high):
+        return [s for s in (self._get(uid) for _, uid in self._by_gpa.irange((low, -1), (high, float("inf"))))
+                if s is not None]
+
+    def count_between(self, low, high):
+        return self._by_gpa.rank((high, float("inf"))) - self._by_gpa.rank((low, -1))
+
+    def top(self, k):
+        out = []
+        for _, uid in reversed(self._by_gpa):
+            s = self._get(uid)
+            if s is not None:
+                out.append(s)
+                if len(out) == k:
+                    break
+        return out
+
+    def percentile_rank(self, gpa):
+        # Percentage of students with a GPA at or below `gpa`
+        if not len(self._by_gpa):
+            return 0.0
+        return 100.0 * self._by_gpa.rank((gpa, float("inf"))) / len(self._by_gpa)
+
+
+# ------------------------------------------
+# ✅ 3. Student, as in the lesson + class-level queries
+# ------------------------------------------
+
+class Student:
+    count = 0
+    registry = StudentRegistry()
+
+    def __init__(self, name, gpa, _register=True):
+        self._name = name
+        self._gpa = gpa
+        self._uid = Student.registry.add(self) if _register else None
+        Student.count += 1
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        old = self._name
+        self._name = value
+        if self._uid is not None:
+            Student.registry.update_name(self._uid, self, old)
+
+    @property
+    def gpa(self):
+        return self._gpa
+
+    @gpa.setter
+    def gpa(self, value):
+        old = self._gpa
+        self._gpa = value
+        if self._uid is not None:
+            Student.registry.update_gpa(self._uid, self, old)
+
+    def get_info(self):
+        return f"👤 Name: {self.name}\n📊 GPA: {self.gpa}"
+
+    def __repr__(self):
+        return f"Student({self.name!r}, {self.gpa})"
+
+    @classmethod
+    def create_many(cls, rows):
+        # Fast bulk creation: [(name, gpa), ...] indexed with one sort
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            students = [cls(name, gpa, _register=False) for name, gpa in rows]
+        finally:
+            if was_enabled:
+                gc.enable()
+        uids = cls.registry.add_many(students)
+        for s, uid in zip(students, uids):
+            s._uid = uid
+        return students
+
+    @classmethod
+    def get_student_count(cls):
+        return f"📚 Total number of students: {cls.count}"
+
+    @classmethod
+    def alive(cls):
+        return len(cls.registry)
+
+    @classmethod
+    def find(cls, name):
+        return cls.registry.find(name)
+
+    @classmethod
+    def gpa_between(cls, low, high):
+        return cls.registry.gpa_between(low, high)
+
+    @classmethod
+    def top(cls, k):
+        return cls.registry.top(k)
+
+    @classmethod
+    def percentile_rank(cls, gpa):
+        return cls.registry.percentile_rank(gpa)
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    s1 = Student("Kedar", 8.98)
+    s2 = Student("Pravin", 8.97)
+    print(Student.get_student_count())
+    print(f"🔎 find('Kedar') → {Student.find('Kedar')}")
+    s2.gpa = 9.5
+    print(f"🏆 top(1) → {Student.top(1)}")
+    del s1, s2
+    print(f"🗑️ after del: {Student.alive()} alive, find('Pravin') → {Student.find('Pravin')}")
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000     # pass 10000000 for the full run
+    rng = random.Random(0)
+    t0 = time.perf_counter()
+    students = Student.create_many((f"student-{i}", round(rng.uniform(5, 10), 2)) for i in range(n))
+    print(f"\n📥 Indexed {n:,} students in {time.perf_counter() - t0:.1f}s")
+
+    t0 = time.perf_counter()
+    hits = Student.registry.count_between(8.5, 9.0)
+    t_index = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    scan = sum(1 for s in students if 8.5 <= s.gpa <= 9.0)
+    t_scan = time.perf_counter() - t0
+    assert hits == scan
+    print(f"🎯 GPA 8.5–9.0: {hits:,} students, index {t_index * 1e6:.0f} µs vs scan {t_scan:.2f}s")
+
+    t0 = time.perf_counter()
+    best = Student.top(5)
+    print(f"🏅 top(5) in {(time.perf_counter() - t0) * 1e6:.0f} µs → {[s.gpa for s in best]}")
+    t0 = time.perf_counter()
+    pr = Student.percentile_rank(9.0)
+    print(f"📈 percentile rank of 9.0 = {pr:.2f}% in {(time.perf_counter() - t0) * 1e6:.0f} µs")
+
+    t0 = time.perf_counter()
+    del students[: n // 2]                        # weakrefs: half the students vanish
+    print(f"♻️ dropped half: {Student.alive():,} alive ({time.perf_counter() - t0:.1f}s to unindex)")
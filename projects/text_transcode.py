@@ -0,0 +1,204 @@
+# ==============================================================
+# 🔤 BULK chr()/ord() TRANSCODING & CHARACTER CLASSIFICATION
+# ==============================================================
+
+# lessons/61.IMP_builtin_functions.py uses chr()/ord() one character at a time:
+#     for code in range(ord('a'), ord('z') + 1):
+#         print(chr(code), end=' ')
+#
+# On gigabytes of text a Python-level call per character is the bottleneck
+# (~50-100 ns each). The standard library already has C loops that touch every
+# character for us — we only have to phrase the problem in their terms:
+#
+# ✅ str  → code points : s.encode("utf-32-le") + array("I").frombytes()   (= ord() of everything)
+# ✅ code points → str  : arr.tobytes().decode("utf-32-le")                 (= chr() of everything)
+# ✅ code-point transforms (shift, remap) : str.translate with a cached table
+# ✅ classification counts : bytes.translate(None, delete) for ASCII,
+#                            the str.is*() predicates mapped over Unicode text
+# ✅ 0/1 masks per character : bytes.translate with a 256-entry table
+# ✅ files of any size : read in chunks with an incremental UTF-8 decoder
+
+import codecs
+import functools
+import re
+import sys
+from array import array
+
+# "I" is 4 bytes on every mainstream platform; fall back to "L" just in case
+_CP_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+# ------------------------------------------
+# ✅ 1. Whole-string ord()/chr()
+# ------------------------------------------
+
+def to_code_points(text):
+    # "Hi😀" → array('I', [72, 105, 128512])
+    points = array(_CP_TYPECODE)
+    points.frombytes(text.encode(_UTF32, "surrogatepass"))
+    return points
+
+
+def from_code_points(points):
+    # array('I', [72, 105, 128512]) → "Hi😀"  (accepts any sequence of ints)
+    if not isinstance(points, array) or points.typecode != _CP_TYPECODE:
+        points = array(_CP_TYPECODE, points)
+    return points.tobytes().decode(_UTF32, "surrogatepass")
+
+
+# ------------------------------------------
+# ✅ 2. Code-point transforms via translate tables
+# ------------------------------------------
+
+@functools.lru_cache(maxsize=64)
+def shift_table(offset, start, stop):
+    # Table that moves every code point in [start, stop] by `offset`, wrapping around
+    # (offset=3, 'a', 'z' → Caesar cipher on lowercase letters)
+    first, last = ord(start), ord(stop)
+    width = last - first + 1
+    return str.maketrans({c: first + (c - first + offset) % width for c in range(first, last + 1)})
+
+
+def shift(text, offset, start="a", stop="z"):
+    return text.translate(shift_table(offset, start, stop))
+
+
+def caesar(text, offset):
+    # Shifts both lowercase and uppercase letters; everything else stays put
+    return text.translate(shift_table(offset, "a", "z")).translate(shift_table(offset, "A", "Z"))
+
+
+def remap(text, mapping):
+    # mapping: {"a": "4", "e": "3", "ß": "ss", "x": None (delete)}
+    return text.translate(str.maketrans(mapping))
+
+
+# ------------------------------------------
+# ✅ 3. Bulk classification
+# ------------------------------------------
+
+_ASCII_CLASSES = {
+    "digit": bytes(range(ord("0"), ord("9") + 1)),
+    "alpha": bytes(range(ord("a"), ord("z") + 1)) + bytes(range(ord("A"), ord("Z") + 1)),
+    "upper": bytes(range(ord("A"), ord("Z") + 1)),
+    "lower": bytes(range(ord("a"), ord("z") + 1)),
+    # str.isspace() and re's \s also count the separators \x1c-\x1f as space
+    "space": b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f",
+}
+_ASCII_CLASSES["alnum"] = _ASCII_CLASSES["alpha"] + _ASCII_CLASSES["digit"]
+
+# Same classes for full Unicode: exactly the str predicates (isdigit() counts
+# "²", isalpha() does not count "½" or "Ⅻ"). re's \d / \w classes disagree with
+# them, so only "space" uses a regex (\s is exactly str.isspace()).
+# sum() over map() of a str method still runs entirely in C.
+_UNICODE_PATTERNS = {
+    "space": re.compile(r"\s"),
+}
+_UNICODE_METHODS = {
+    "digit": str.isdigit, "alpha": str.isalpha, "alnum": str.isalnum,
+    "upper": str.isupper, "lower": str.islower,
+}
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+CLASSES = ("digit", "alpha", "alnum", "upper", "lower", "space")
+
+
+def _check_classes(classes):
+    unknown = [cls for cls in classes if cls not in _ASCII_CLASSES]
+    if unknown:
+        raise ValueError(f"unknown character class(es) {unknown}, expected some of {CLASSES}")
+
+
+def _count_ascii(data, cls):
+    # Deleting every member of the class and comparing lengths counts them in C
+    return len(data) - len(data.translate(None, _ASCII_CLASSES[cls]))
+
+
+def _count_unicode(text, cls):
+    if cls in _UNICODE_PATTERNS:
+        return _UNICODE_PATTERNS[cls].subn("", text)[1]
+    return sum(map(_UNICODE_METHODS[cls], text))
+
+
+def classify(text, classes=CLASSES):
+    # Counts per class for one string. ASCII text takes the bytes.translate path.
+    _check_classes(classes)
+    counts = {"total": len(text)}
+    if text.isascii():
+        data = text.encode("ascii")
+        counts["ascii"] = len(text)
+        for cls in classes:
+            counts[cls] = _count_ascii(data, cls)
+    else:
+        counts["ascii"] = len(text) - _NON_ASCII.subn("", text)[1]
+        for cls in classes:
+            counts[cls] = _count_unicode(text, cls)
+    return counts
+
+
+def classify_file(path, chunk_size=16 * 1024 * 1024, classes=CLASSES, encoding="utf-8"):
+    # Classify a file of any size: read binary chunks, decode incrementally
+    # (a multi-byte character split between chunks is handled by the decoder).
+    _check_classes(classes)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    totals = {"total": 0, "ascii": 0, **{cls: 0 for cls in classes}}
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(chunk_size)
+            text = decoder.decode(block, final=not block)
+            if text:
+                for key, value in classify(text, classes).items():
+                    totals[key] += value
+            if not block:
+                return totals
+
+
+def ascii_mask(data, cls):
+    # bytes → bytes of 0/1, one per input byte (1 = byte belongs to class)
+    _check_classes((cls,))
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    return data.translate(_mask_table(cls))
+
+
+@functools.lru_cache(maxsize=None)
+def _mask_table(cls):
+    table = bytearray(256)
+    for b in _ASCII_CLASSES[cls]:
+        table[b] = 1
+    return bytes(table)
+
+
+if __name__ == "__main__":
+    import time
+
+    text = "Hello, Wörld! 123 😀"
+    points = to_code_points(text)
+    print(f"🔢 {text!r} → {points.tolist()}")
+    assert from_code_points(points) == text
+    assert points.tolist() == [ord(c) for c in text]
+    print(f"🔐 caesar(+3): {caesar('Attack at dawn', 3)}")
+    print(f"📊 {classify(text)}")
+
+    big = ("The quick brown fox jumps over 13 lazy dogs. " * 500_000)   # ~22 MB of ASCII
+    n = len(big)
+
+    t0 = time.perf_counter()
+    slow = [ord(c) for c in big]
+    t_slow = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fast = to_code_points(big)
+    t_fast = time.perf_counter() - t0
+    print(f"\n⏱️ ord() loop {t_slow:.2f}s vs to_code_points {t_fast:.3f}s ({t_slow / t_fast:.0f}x), "
+          f"{fast.itemsize * len(fast) / 1e6:.0f} MB vs list of ints")
+
+    t0 = time.perf_counter()
+    slow = sum(c.isdigit() for c in big)
+    t_slow = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    counts = classify(big)
+    t_fast = time.perf_counter() - t0
+    assert counts["digit"] == slow
+    print(f"⏱️ per-char isdigit() {t_slow:.2f}s vs classify (all 6 classes) {t_fast:.3f}s "
+          f"→ {n / t_fast / 1e9:.2f} GB/s")
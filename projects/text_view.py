@@ -0,0 +1,331 @@
+# ==============================================================
+# 🔍 TEXT VIEWS: slice, search and split huge text without copying
+# ==============================================================
+
+# lessons/10.String-comprehension.py and lessons/9.python-strings.py slice and
+# search str objects:
+#     name[0:3]          → a NEW string (the characters are copied)
+#     name.find("a")
+# On a 1 GB blob every slice, every line and every field is another copy, and
+# str.split() copies the whole text once more into a list of small strings.
+#
+# TextView keeps the text ENCODED (bytes, bytearray, mmap, memoryview) and only
+# remembers a [start, stop) window into it:
+# ✅ view[a:b]                 → another view, O(1), nothing copied
+# ✅ view[i]                   → the BYTE at offset i, an int (like bytes[i]): one byte
+#                                of UTF-8 is not a character
+# ✅ find / rfind / count / startswith / endswith
+#                              → run in C directly on the underlying buffer with
+#                                start/end bounds (bytes.find, mmap.find, or a
+#                                compiled regex for plain memoryviews)
+# ✅ split / splitlines        → lazy generators of views
+# ✅ str(view), view.tobytes() → materialize only when you actually need the text
+# ✅ TextView.open(path)       → mmap a file of any size (nothing is read up front)
+#
+# Positions are BYTE offsets into the encoded text. For ASCII/Latin-1 text these
+# are the same as str indices. For UTF-8, searching for an encoded needle can
+# never match half a character, so find()/split() results are always safe to slice at.
+
+import mmap
+import re
+
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+_WORD = re.compile(rb"[^ \t\n\r\x0b\x0c]+")
+
+
+class TextView:
+    #   blob = TextView.open("huge.log")          # or TextView(b"...") / TextView(memoryview(...))
+    #   head = blob[:1000]                         # view, no copy
+    #   i = blob.find("ERROR")
+    #   for line in blob.splitlines(): ...         # views
+    #   str(line)                                  # → str, decoded only now
+
+    __slots__ = ("base", "start", "stop", "encoding", "_mmap")
+
+    def __init__(self, data, start=0, stop=None, encoding="utf-8"):
+        if isinstance(data, str):
+            data = data.encode(encoding)
+        if isinstance(data, memoryview):
+            data = data.cast("B") if data.format != "B" or data.ndim != 1 else data
+        self.base = data
+        length = len(data)
+        self.start = max(0, min(start, length))
+        self.stop = length if stop is None else max(self.start, min(stop, length))
+        self.encoding = encoding
+        self._mmap = None
+
+    @classmethod
+    def open(cls, path, encoding="utf-8"):
+        # Memory-map a file read-only; the OS pages data in as it is touched
+        with open(path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:                  # empty file can't be mapped
+                return cls(b"", encoding=encoding)
+        view = cls(mapped, encoding=encoding)
+        view._mmap = mapped
+        return view
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _child(self, start, stop):
+        view = TextView.__new__(TextView)
+        view.base = self.base
+        view.start = start
+        view.stop = stop
+        view.encoding = self.encoding
+        view._mmap = None                       # only the root view owns the mmap
+        return view
+
+    # -- size & slicing ------------------------------------------------------
+    def __len__(self):
+        return self.stop - self.start
+
+    def __bool__(self):
+        return self.stop > self.start
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self._child(self.start + start, self.start + max(start, stop))
+            # strided/reversed slices can't be a window: materialize
+            return self.tobytes()[key].decode(self.encoding, "replace")
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("TextView index out of range")
+        return self.base[self.start + key]
+
+    # -- materializing ---------------------------------------------------------
+    def memoryview(self):
+        # Zero-copy buffer of exactly this window
+        return memoryview(self.base)[self.start:self.stop]
+
+    def tobytes(self):
+        return self.base[self.start:self.stop] if not isinstance(self.base, memoryview) \
+            else self.base[self.start:self.stop].tobytes()
+
+    def decode(self, errors="strict"):
+        return str(self.tobytes(), self.encoding, errors)
+
+    def __str__(self):
+        return self.decode("replace")
+
+    def __repr__(self):
+        preview = self[:40].decode("replace") if len(self) > 40 else self.decode("replace")
+        more = "..." if len(self) > 40 else ""
+        return f"TextView({preview!r}{more}, {len(self)} bytes)"
+
+    def __eq__(self, other):
+        if isinstance(other, TextView):
+            other = other.memoryview()
+        elif isinstance(other, str):
+            other = other.encode(self.encoding)
+        return self.memoryview() == other
+
+    __hash__ = None
+
+    # -- searching --------------------------------------------------------------
+    def _needle(self, sub):
+        if isinstance(sub, TextView):
+            return sub.tobytes()
+        if isinstance(sub, str):
+            return sub.encode(self.encoding)
+        if isinstance(sub, int):
+            # bytes(5) would be five NUL bytes: an int means that byte value
+            return bytes((sub,))
+        return bytes(sub)
+
+    def _bounds(self, start, end):
+        # View-relative [start, end) → absolute offsets in the base buffer
+        s, e, _ = slice(start, end).indices(len(self))
+        return self.start + s, self.start + max(s, e)
+
+    def find(self, sub, start=None, end=None):
+        needle = self._needle(sub)
+        s, e = self._bounds(start, end)
+        if hasattr(self.base, "find"):
+            i = self.base.find(needle, s, e)
+        else:
+            m = re.compile(re.escape(needle)).search(self.base, s, e)
+            i = m.start() if m else -1
+        return i - self.start if i >= 0 else -1
+
+    def rfind(self, sub, start=None, end=None):
+        needle = self._needle(sub)
+        s, e = self._bounds(start, end)
+        if hasattr(self.base, "rfind"):
+            i = self.base.rfind(needle, s, e)
+        else:
+            # A lookahead matches at EVERY start position, overlapping ones too
+            # ("aa" in b"aaa" → 0 and 1); the last one is rfind's answer
+            last = None
+            for last in re.compile(b"(?=" + re.escape(needle) + b")").finditer(self.base, s, e):
+                pass
+            i = last.start() if last else -1
+        return i - self.start if i >= 0 else -1
+
+    def count(self, sub, start=None, end=None):
+        needle = self._needle(sub)
+        s, e = self._bounds(start, end)
+        if hasattr(self.base, "count"):              # bytes / bytearray
+            return self.base.count(needle, s, e)
+        if not needle:
+            return e - s + 1
+        # mmap / memoryview: non-overlapping regex matches, without keeping them
+        return sum(1 for _ in re.compile(re.escape(needle)).finditer(self.base, s, e))
+
+    def __contains__(self, sub):
+        return self.find(sub) >= 0
+
+    def startswith(self, prefix):
+        needle = self._needle(prefix)
+        if hasattr(self.base, "startswith"):        # bytes / bytearray: bounded, in C
+            return self.base.startswith(needle, self.start, self.stop)
+        return len(needle) <= len(self) and self.base[self.start:self.start + len(needle)] == needle
+
+    def endswith(self, suffix):
+        needle = self._needle(suffix)
+        if hasattr(self.base, "endswith"):
+            return self.base.endswith(needle, self.start, self.stop)
+        return len(needle) <= len(self) and self.base[self.stop - len(needle):self.stop] == needle
+
+    # -- splitting ---------------------------------------------------------------
+    def split(self, sep=None, maxsplit=-1):
+        # Like str.split, but lazy and yielding views
+        if sep is None:
+            yield from self._split_whitespace(maxsplit)
+            return
+        needle = self._needle(sep)
+        if not needle:
+            raise ValueError("empty separator")
+        pos = 0
+        while maxsplit != 0:
+            i = self.find(needle, pos)
+            if i < 0:
+                break
+            yield self._child(self.start + pos, self.start + i)
+            pos = i + len(needle)
+            maxsplit -= 1
+        yield self._child(self.start + pos, self.stop)
+
+    def _split_whitespace(self, maxsplit):
+        splits = 0
+        for m in _WORD.finditer(self.base, self.start, self.stop):
+            if splits == maxsplit:
+                # like str.split: the remainder keeps its trailing whitespace
+                yield self._child(m.start(), self.stop)
+                return
+            yield self._child(m.start(), m.end())
+            splits += 1
+
+    def splitlines(self, keepends=False):
+        # Lines end with \n or \r\n (like iterating over a file)
+        pos, stop = self.start, self.stop
+        base = self.base
+        if hasattr(base, "find"):
+            find = base.find
+        else:
+            def find(needle, s, e, _search=_NEWLINE.search):
+                m = _search(base, s, e)
+                return m.start() if m else -1
+        child = self._child
+        while pos < stop:
+            i = find(b"\n", pos, stop)
+            if i < 0:
+                yield child(pos, stop)
+                return
+            end = i + 1
+            if not keepends:
+                end = i - 1 if i > pos and base[i - 1] == 13 else i      # drop \r\n / \n
+            yield child(pos, end)
+            pos = i + 1
+
+    # -- trimming (returns views) ---------------------------------------------------
+    def lstrip(self):
+        m = _WORD.search(self.base, self.start, self.stop)
+        return self._child(m.start() if m else self.stop, self.stop)
+
+    def rstrip(self):
+        stop = self.stop
+        base = self.base
+        while stop > self.start and base[stop - 1] in _WHITESPACE:
+            stop -= 1
+        return self._child(self.start, stop)
+
+    def strip(self):
+        return self.lstrip().rstrip()
+
+
+_NEWLINE = re.compile(rb"\n")
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    import tracemalloc
+
+    name = TextView("Kedar DaMale 123")
+    print(f"✂️ name[0:5] → {name[0:5]!r}, str → {str(name[0:5])!r}")
+    print(f"🔎 find('a') = {name.find('a')}, rfind('a') = {name.rfind('a')}, count('a') = {name.count('a')}")
+    print(f"🧩 split() → {[str(part) for part in name.split()]}")
+    card = TextView("6991-7804-7212")
+    print(f"💳 last 4 digits → {str(card[-4:])}, reversed → {card[-1:-5:-1]}")
+
+    line = "2024-01-01 12:00:00 INFO request served in 12 ms by worker-7\n"
+    blob = (line * 1_500_000).encode()           # ≈ 95 MB of text
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.log")
+        with open(path, "wb") as f:
+            f.write(blob)
+        text = blob.decode()
+
+        # 1. Slicing 100 windows of 5 MB
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        parts = [text[i * 800_000:i * 800_000 + 5_000_000] for i in range(100)]
+        t_str = time.perf_counter() - t0
+        _, peak_str = tracemalloc.get_traced_memory()
+        del parts
+        tracemalloc.reset_peak()
+        with TextView.open(path) as view:
+            t0 = time.perf_counter()
+            parts = [view[i * 800_000:i * 800_000 + 5_000_000] for i in range(100)]
+            t_view = time.perf_counter() - t0
+            _, peak_view = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del parts
+            print(f"\n⏱️ 100 slices of 5 MB: str {t_str:.2f}s / {peak_str / 1e6:.0f} MB vs "
+                  f"TextView {t_view * 1e3:.2f} ms / {peak_view / 1e3:.0f} KB")
+
+            # 2. Searching inside a window (no copy of the window first)
+            t0 = time.perf_counter()
+            c_str = text[10_000_000:90_000_000].count("worker-7")
+            t_str = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            c_view = view[10_000_000:90_000_000].count("worker-7")
+            t_view = time.perf_counter() - t0
+            assert c_str == c_view
+            print(f"⏱️ slice + count: str {t_str:.3f}s vs TextView {t_view:.3f}s ({c_view:,} hits)")
+
+            # 3. Iterating lines, keeping only the ones we need as str
+            t0 = time.perf_counter()
+            slow = sum(1 for ln in text.splitlines() if ln.endswith("worker-7"))
+            t_str = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            fast = sum(1 for ln in view.splitlines() if ln.endswith("worker-7"))
+            t_view = time.perf_counter() - t0
+            assert slow == fast
+            print(f"⏱️ splitlines + endswith over {slow:,} lines: str {t_str:.2f}s vs TextView {t_view:.2f}s "
+                  f"(str.splitlines holds every line at once; views are made one at a time)")
@@ -0,0 +1,214 @@
+# ==============================================================
+# ↔️ TYPED BIDIRECTIONAL CURSOR (array / memoryview / mmap)
+# ==============================================================
+
+# lessons/51.iterables.py builds a BidirectionalIterator on a Python list:
+#     it = BidirectionalIterator([10, 20, 30])
+#     it.next()  # 10
+#     it.prev()  # ...
+#
+# A Python list of floats costs ~32 bytes per number (8-byte pointer + a
+# 24-byte float object), must fit in RAM, and can only step one item at a time.
+#
+# TypedCursor keeps the same next()/prev() behaviour but:
+# ✅ stores numbers compactly (8 bytes per float with typecode "d")
+# ✅ works over array.array, any buffer (bytes/bytearray/memoryview) or an
+#    mmap'ed file → files larger than RAM, the OS pages in only what we touch
+# ✅ seek()/tell() in O(1) and bisect() on sorted columns (e.g. timestamps)
+# ✅ next_n()/prev_n() return memoryview SLICES → no copying, no new objects per item
+
+import array
+import bisect
+import itertools
+import mmap
+import os
+import weakref
+
+
+class TypedCursor:
+    #   cursor = TypedCursor(array.array("d", [1.0, 2.0, 3.0]))
+    #   cursor = TypedCursor.from_file("prices.f64", "d")
+    #
+    # Like the lesson's iterator, the position starts BEFORE the first element
+    # (index -1): next() moves forward and returns the new current item,
+    # prev() moves back and returns the new current item.
+
+    def __init__(self, data, typecode=None):
+        if isinstance(data, array.array):
+            typecode = data.typecode
+        view = memoryview(data)
+        if typecode is not None and view.format != typecode:
+            view = view.cast("B").cast(typecode)
+        self.view = view
+        self.typecode = view.format
+        self.index = -1
+        self._owner = None                     # mmap / file kept alive by the cursor
+        # live next_n()/prev_n() slices (typed memoryviews aren't hashable,
+        # so they are values keyed by a counter rather than WeakSet members)
+        self._views = weakref.WeakValueDictionary()
+        self._view_ids = itertools.count()
+
+    @classmethod
+    def from_file(cls, path, typecode, offset=0):
+        # Memory-map a raw binary file of `typecode` items (e.g. written with
+        # array.tofile()). Nothing is read until the items are actually accessed.
+        itemsize = array.array(typecode).itemsize
+        f = open(path, "rb")
+        try:
+            size = os.fstat(f.fileno()).st_size
+            if size == offset:
+                cursor = cls(array.array(typecode))
+                f.close()
+                return cursor
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            f.close()
+            raise
+        usable = (size - offset) // itemsize * itemsize
+        cursor = cls(memoryview(mapped)[offset:offset + usable], typecode)
+        cursor._owner = (mapped, f)
+        return cursor
+
+    def close(self):
+        # Views handed out by next_n()/prev_n() are released here too: using
+        # one after close() raises ValueError instead of touching an unmapped file
+        owner, self._owner = self._owner, None
+        try:
+            for chunk in list(self._views.values()):
+                chunk.release()
+            self._views.clear()
+            self.view.release()
+            if owner is not None:
+                owner[0].close()
+        except BufferError:
+            # a slice of a returned view is still alive; the read-only map is
+            # unmapped when that slice goes away
+            pass
+        finally:
+            if owner is not None:
+                owner[1].close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return len(self.view)
+
+    # ----------------------------------------------------------
+    # Single steps (same behaviour as BidirectionalIterator)
+    # ----------------------------------------------------------
+    def next(self):
+        if self.index + 1 >= len(self.view):
+            raise StopIteration("Reached the end")
+        self.index += 1
+        return self.view[self.index]
+
+    def prev(self):
+        if self.index - 1 < 0:
+            raise StopIteration("Reached the start")
+        self.index -= 1
+        return self.view[self.index]
+
+    def current(self):
+        if not 0 <= self.index < len(self.view):
+            raise IndexError("cursor is not on an element")
+        return self.view[self.index]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    # ----------------------------------------------------------
+    # Bulk steps → zero-copy views
+    # ----------------------------------------------------------
+    def next_n(self, n):
+        # Items after the current one (up to n), as a memoryview.
+        # The cursor ends on the last returned item.
+        start = self.index + 1
+        chunk = self.view[start:start + n]
+        self.index += len(chunk)
+        self._views[next(self._view_ids)] = chunk
+        return chunk
+
+    def prev_n(self, n):
+        # Up to n items before the current one, in FORWARD order, as a memoryview.
+        # The cursor ends on the first returned item.
+        start = max(0, self.index - n)
+        chunk = self.view[start:max(0, self.index)]
+        self.index = start if len(chunk) else self.index
+        self._views[next(self._view_ids)] = chunk
+        return chunk
+
+    # ----------------------------------------------------------
+    # Random access
+    # ----------------------------------------------------------
+    def seek(self, position, whence=os.SEEK_SET):
+        # O(1) jump, like file.seek(): whence = SEEK_SET / SEEK_CUR / SEEK_END.
+        # Seeking to -1 puts the cursor before the first item again.
+        if whence == os.SEEK_CUR:
+            position += self.index
+        elif whence == os.SEEK_END:
+            position += len(self.view)
+        if not -1 <= position <= len(self.view):
+            raise IndexError("seek position out of range")
+        self.index = position
+        return self.index
+
+    def tell(self):
+        return self.index
+
+    def bisect(self, value):
+        # For SORTED data (timestamps): position of the first item >= value,
+        # found in O(log n) without loading the column into memory.
+        return bisect.bisect_left(self.view, value)
+
+    def seek_value(self, value):
+        # Put the cursor just before the first item >= value so next() returns it
+        return self.seek(self.bisect(value) - 1)
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    # Same usage as the lesson's BidirectionalIterator
+    it = TypedCursor(array.array("i", [10, 20, 30]))
+    print(it.next(), it.next(), it.prev())     # 10 20 10
+
+    # A time series of 20 million (timestamp, value) rows written as two raw columns
+    n = 20_000_000
+    ts_path, val_path = "ts_demo.i64", "val_demo.f64"
+    with open(ts_path, "wb") as f:
+        for start in range(0, n, 1_000_000):
+            array.array("q", range(1_700_000_000_000 + start * 10,
+                                   1_700_000_000_000 + (start + 1_000_000) * 10, 10)).tofile(f)
+    with open(val_path, "wb") as f:
+        block = array.array("d", (i * 0.25 for i in range(1_000_000)))
+        for _ in range(n // 1_000_000):
+            block.tofile(f)
+
+    tracemalloc.start()
+    with TypedCursor.from_file(ts_path, "q") as ts, TypedCursor.from_file(val_path, "d") as values:
+        t0 = time.perf_counter()
+        target = 1_700_000_000_000 + 15_000_000 * 10
+        pos = ts.seek_value(target)             # O(log n) scrub to a timestamp
+        values.seek(pos)
+        window = values.next_n(5)                # zero-copy view of the next 5 values
+        print(f"🔎 Timestamp {target} found at row {pos + 1:,} in "
+              f"{(time.perf_counter() - t0) * 1e6:.0f} µs → values {window.tolist()}")
+        back = values.prev_n(3)
+        print(f"⏪ Three values before: {back.tolist()}")
+        window.release()
+        back.release()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"📦 Scrubbed {os.path.getsize(ts_path) + os.path.getsize(val_path):,} bytes of files "
+          f"with a Python heap peak of {peak / 1024:.0f} KiB")
+
+    os.remove(ts_path)
+    os.remove(val_path)
@@ -0,0 +1,217 @@
+# ==============================================================
+# 📍 COMPACT VECTORS: __slots__ Vector + array-backed VectorArray
+# ==============================================================
+
+# lessons/37.polymorphism.py overloads + like this:
+#     class Vector:
+#         def __init__(self, x, y):
+#             self.x = x
+#             self.y = y
+#         def __add__(self, other):
+#             return Vector(self.x + other.x, self.y + other.y)
+#
+# Every Vector has its own __dict__ (~100+ bytes) on top of the object itself
+# and two float objects (24 bytes each). 10 million particles → gigabytes,
+# and every + creates yet another object.
+#
+# ✅ Vector with __slots__ → no per-instance __dict__, same +, same __str__
+# ✅ VectorArray           → all x's in one array('d'), all y's in another:
+#                            16 bytes per vector, no objects per element
+# ✅ whole-array math      → +, -, scalar *, dot, norm run as map() over the
+#                            arrays with operator/math functions, i.e. the loop
+#                            runs in C instead of Python bytecode
+
+import math
+import operator
+from array import array
+from itertools import repeat
+
+
+class Vector:
+    __slots__ = ("x", "y")          # fixed attributes → no __dict__ per object
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __add__(self, other):
+        return Vector(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return Vector(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, k):
+        return Vector(self.x * k, self.y * k)
+
+    __rmul__ = __mul__
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y
+
+    def norm(self):
+        return math.hypot(self.x, self.y)
+
+    # Same output as the lesson's Vector
+    def __str__(self):
+        return f"📍 Vector({self.x}, {self.y})"
+
+    def __repr__(self):
+        return f"Vector({self.x!r}, {self.y!r})"
+
+
+class VectorArray:
+    #   particles = VectorArray.zeros(10_000_000)
+    #   velocity  = VectorArray.from_pairs(...)
+    #   particles += velocity * dt      # whole-array, no Vector objects created
+    #   speeds = velocity.norm()        # array('d') of lengths
+
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, xs=(), ys=()):
+        self.xs = xs if isinstance(xs, array) and xs.typecode == "d" else array("d", xs)
+        self.ys = ys if isinstance(ys, array) and ys.typecode == "d" else array("d", ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError("xs and ys must have the same length")
+
+    # -- construction --------------------------------------------------------
+    @classmethod
+    def zeros(cls, n):
+        return cls(array("d", bytes(8 * n)), array("d", bytes(8 * n)))
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        xs, ys = array("d"), array("d")
+        for x, y in pairs:
+            xs.append(x)
+            ys.append(y)
+        return cls(xs, ys)
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        return cls.from_pairs((v.x, v.y) for v in vectors)
+
+    # -- container behaviour --------------------------------------------------
+    def __len__(self):
+        return len(self.xs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VectorArray(self.xs[index], self.ys[index])
+        return Vector(self.xs[index], self.ys[index])
+
+    def __setitem__(self, index, vector):
+        self.xs[index] = vector.x
+        self.ys[index] = vector.y
+
+    def __iter__(self):
+        return map(Vector, self.xs, self.ys)
+
+    def append(self, vector):
+        self.xs.append(vector.x)
+        self.ys.append(vector.y)
+
+    def copy(self):
+        return VectorArray(array("d", self.xs), array("d", self.ys))
+
+    # -- element-wise math ------------------------------------------------------
+    def _combine(self, other, op):
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError("VectorArrays must have the same length")
+            ox, oy = other.xs, other.ys
+        else:                                   # a single Vector is broadcast
+            ox, oy = repeat(other.x), repeat(other.y)
+        return array("d", map(op, self.xs, ox)), array("d", map(op, self.ys, oy))
+
+    def __add__(self, other):
+        return VectorArray(*self._combine(other, operator.add))
+
+    def __sub__(self, other):
+        return VectorArray(*self._combine(other, operator.sub))
+
+    def __mul__(self, k):
+        return VectorArray(array("d", map(operator.mul, self.xs, repeat(k))),
+                           array("d", map(operator.mul, self.ys, repeat(k))))
+
+    __rmul__ = __mul__
+
+    def __iadd__(self, other):
+        self.xs, self.ys = self._combine(other, operator.add)
+        return self
+
+    def __isub__(self, other):
+        self.xs, self.ys = self._combine(other, operator.sub)
+        return self
+
+    def dot(self, other):
+        # Row-wise dot products → array('d') (broadcasts a single Vector)
+        if isinstance(other, VectorArray):
+            ox, oy = other.xs, other.ys
+        else:
+            ox, oy = repeat(other.x), repeat(other.y)
+        return array("d", map(operator.add, map(operator.mul, self.xs, ox),
+                              map(operator.mul, self.ys, oy)))
+
+    def norm(self):
+        # Length of every vector → array('d')
+        return array("d", map(math.hypot, self.xs, self.ys))
+
+    def sum(self):
+        # Vector sum of the whole array (math.fsum for accuracy)
+        return Vector(math.fsum(self.xs), math.fsum(self.ys))
+
+    def nbytes(self):
+        return self.xs.itemsize * len(self.xs) + self.ys.itemsize * len(self.ys)
+
+
+class DictVector:
+    # The lesson's original class, kept for the memory/speed comparison below
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __add__(self, other):
+        return DictVector(self.x + other.x, self.y + other.y)
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    v3 = Vector(2, 3) + Vector(5, 7)
+    print(v3)                                  # 📍 Vector(7, 10), same as the lesson
+
+    n = 1_000_000
+    for name, make in (("dict Vector", lambda: [DictVector(i * 0.5, i * 0.25) for i in range(n)]),
+                       ("slots Vector", lambda: [Vector(i * 0.5, i * 0.25) for i in range(n)]),
+                       ("VectorArray", lambda: VectorArray(array("d", (i * 0.5 for i in range(n))),
+                                                           array("d", (i * 0.25 for i in range(n)))))):
+        tracemalloc.start()
+        data = make()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"📦 {name:<13}: {size / n:6.1f} bytes per vector "
+              f"(≈{size / n * 10_000_000 / 1e9:.2f} GB for 10M)")
+        del data
+
+    # One simulation step: position += velocity * dt
+    pos_objs = [DictVector(i * 0.5, i * 0.25) for i in range(n)]
+    vel_objs = [DictVector(1.0, -1.0) for _ in range(n)]
+    t0 = time.perf_counter()
+    pos_objs = [p + DictVector(v.x * 0.01, v.y * 0.01) for p, v in zip(pos_objs, vel_objs)]
+    t_objs = time.perf_counter() - t0
+
+    pos = VectorArray(array("d", (i * 0.5 for i in range(n))), array("d", (i * 0.25 for i in range(n))))
+    vel = VectorArray(array("d", repeat(1.0, n)), array("d", repeat(-1.0, n)))
+    t0 = time.perf_counter()
+    pos += vel * 0.01
+    t_arr = time.perf_counter() - t0
+    assert pos[n - 1].x == pos_objs[-1].x
+
+    print(f"⏱️ one step for {n:,} particles: objects {t_objs:.2f}s vs VectorArray {t_arr:.2f}s "
+          f"({t_objs / t_arr:.1f}x)")
+    print(f"📏 max speed = {max(vel.norm()):.3f}, mean dot with (1,0) = {sum(vel.dot(Vector(1, 0))) / n}")